@@ -0,0 +1,115 @@
+"""
+Memory and construction cost of Country / ISOCode and a use-case DTO.
+
+Compares the slotted, interned classes with plain `@dataclass`
+equivalents (per-instance __dict__, ISOCode validated on every
+construction), as they were before, and rows hydrated through the
+trusted (unvalidated) repository path. Memory is what tracemalloc sees
+allocated for 100k live objects; names are distinct per object, as
+rows read from the database would be, and are built before measuring.
+
+Usage:
+    make bench-domain BENCH_ARGS="--count 100000 --repeat 5"
+"""
+
+import argparse
+import string
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from itertools import cycle, product
+from typing import Any, Callable, List, Optional
+
+from sportifyapi.application.use_cases.country.get_country_by_id import GetCountryByIdResponse
+from sportifyapi.domain.entities.country import Country
+from sportifyapi.domain.value_objects.iso_code import ISOCode
+
+
+# ---------------- before: plain dataclasses ----------------
+
+@dataclass(frozen=True)
+class PlainISOCode:
+    value: str
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.value, str):
+            raise ValueError("ISO code must be a string")
+        if len(self.value) != 2:
+            raise ValueError("ISO code must be exactly 2 characters")
+        if not self.value.isalpha():
+            raise ValueError("ISO code must contain only alphabetic characters")
+        object.__setattr__(self, "value", self.value.upper())
+
+
+@dataclass
+class PlainCountry:
+    id: Optional[int]
+    name: str
+    iso_code: PlainISOCode
+    is_active: bool = True
+    created_at: Any = None
+    updated_at: Any = None
+
+    def __post_init__(self) -> None:
+        self.name = Country.normalize_name(self.name)
+
+
+@dataclass
+class PlainCountryDTO:
+    id: int
+    name: str
+    iso_code: str
+    is_active: bool
+    updated_at: Any = None
+    message: str = "Country retrieved successfully"
+
+
+# ---------------- measurements ----------------
+
+CODES = ["".join(pair) for pair in product(string.ascii_uppercase, repeat=2)]
+
+
+def build(kind: str, names: List[str]) -> Callable[[], list]:
+    """Function building one object of `kind` per name."""
+    codes = cycle(CODES)
+    if kind == "country":
+        return lambda: [Country(i, name, ISOCode(next(codes))) for i, name in enumerate(names)]
+    if kind == "trusted country":
+        return lambda: [
+            Country._from_trusted(i, name, ISOCode._from_trusted(next(codes))) for i, name in enumerate(names)
+        ]
+    if kind == "plain country":
+        return lambda: [PlainCountry(i, name, PlainISOCode(next(codes))) for i, name in enumerate(names)]
+    if kind == "dto":
+        return lambda: [GetCountryByIdResponse(i, name, next(codes), True) for i, name in enumerate(names)]
+    if kind == "plain dto":
+        return lambda: [PlainCountryDTO(i, name, next(codes), True) for i, name in enumerate(names)]
+    raise ValueError(kind)
+
+
+def allocated(make: Callable[[], list]) -> int:
+    """Bytes allocated by make() and still alive afterwards."""
+    tracemalloc.start()
+    try:
+        objects = make()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del objects
+    return current
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    names = [f"Country {i:06d}" for i in range(args.count)]
+    print(f"{'':16} {'MiB / ' + format(args.count, ',') :>16} {'ns / object':>12}")
+    for kind in ("plain country", "country", "trusted country", "plain dto", "dto"):
+        make = build(kind, names)
+        make()  # warm up: interned codes, allocator pools
+        memory = allocated(make)
+        seconds = min(timeit.repeat(make, number=1, repeat=args.repeat))
+        print(f"{kind:16} {memory / 2**20:16.2f} {seconds / args.count * 1e9:12.0f}")
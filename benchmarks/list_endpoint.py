@@ -0,0 +1,94 @@
+"""
+Per-row CPU cost of GET /api/v1/countries/, with and without fast serialization
+and list snapshots.
+
+Runs the app in-process (httpx ASGI transport) against the database in
+DATABASE_URL and measures this process's CPU time only, so time spent
+inside PostgreSQL is excluded. Missing countries are created first,
+through the bulk endpoint, up to --rows.
+
+Usage:
+    DATABASE_URL=postgresql+asyncpg://... python benchmarks/list_endpoint.py [--rows 600] [--requests 200]
+"""
+
+import argparse
+import asyncio
+import string
+import time
+from itertools import product
+
+import httpx
+
+from sportifyapi.core.settings import settings
+from sportifyapi.main import app
+
+LIST_URL = "/api/v1/countries/"
+
+
+async def seed(client: httpx.AsyncClient, rows: int) -> int:
+    """Create synthetic countries until the table holds at least `rows`."""
+    existing = (await client.get(LIST_URL)).json()["total"]
+    codes = ["".join(pair) for pair in product(string.ascii_uppercase, repeat=2)]
+    missing = [
+        {"name": f"Benchmark {code}", "iso_code": code}
+        for code in codes[:max(rows - existing, 0)]
+    ]
+    for start in range(0, len(missing), 1000):
+        response = await client.post(
+            f"{LIST_URL}bulk",
+            json={"countries": missing[start:start + 1000], "on_conflict": "skip"}
+        )
+        response.raise_for_status()
+    return (await client.get(LIST_URL)).json()["total"]
+
+
+# Uncompressed bodies, so no mode pays for decompression in this process
+HEADERS = {"Accept-Encoding": "identity"}
+
+
+async def measure(client: httpx.AsyncClient, fast: bool, snapshots: bool, requests: int) -> float:
+    """CPU seconds per request for the list endpoint."""
+    settings.fast_serialization = fast
+    settings.list_snapshots_enabled = snapshots
+    for _ in range(10):  # warm up pools, statement caches and snapshots
+        await client.get(LIST_URL, headers=HEADERS)
+
+    started = time.process_time()
+    for _ in range(requests):
+        response = await client.get(LIST_URL, headers=HEADERS)
+        response.raise_for_status()
+    return (time.process_time() - started) / requests
+
+
+async def main(rows: int, requests: int) -> None:
+    settings.query_cache_enabled = False
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        total = await seed(client, rows)
+        print(f"rows per response: {total}, requests per mode: {requests}")
+
+        modes = {
+            "default (ORM -> entity -> DTO -> pydantic)": (False, False),
+            "fast (rows -> orjson)": (True, False),
+            "fast + snapshots (pre-encoded bytes)": (True, True),
+        }
+        results = {}
+        for mode, (fast, snapshots) in modes.items():
+            per_request = await measure(client, fast, snapshots, requests)
+            results[mode] = per_request
+            print(
+                f"{mode:45} {per_request * 1e3:8.3f} ms/request "
+                f"{per_request / max(total, 1) * 1e6:8.2f} us/row"
+            )
+
+        baseline = results[next(iter(modes))]
+        for mode, per_request in list(results.items())[1:]:
+            print(f"speed-up of {mode}: {baseline / per_request:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=600, help="minimum countries in the table")
+    parser.add_argument("--requests", type=int, default=200, help="requests measured per mode")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.requests))
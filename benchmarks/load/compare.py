@@ -0,0 +1,82 @@
+"""
+Compare two load benchmark results (benchmarks/load/run.py output).
+
+Prints throughput and p99 latency per scenario and concurrency, and
+exits with status 1 when any of them regressed by more than
+--max-regression percent, so the comparison can gate a release.
+
+Usage:
+    python benchmarks/load/compare.py BASELINE.json CANDIDATE.json [--max-regression 10]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+Key = Tuple[str, int]
+
+
+def load(path: Path) -> Dict[Key, Dict[str, Any]]:
+    report = json.loads(path.read_text())
+    return {(r["scenario"], r["concurrency"]): r for r in report["results"]}
+
+
+def change(baseline: Optional[float], candidate: Optional[float]) -> Optional[float]:
+    """Relative change in percent, None when either side is missing."""
+    if not baseline or candidate is None:
+        return None
+    return (candidate - baseline) / baseline * 100
+
+
+def compare(
+    baseline: Dict[Key, Dict[str, Any]],
+    candidate: Dict[Key, Dict[str, Any]],
+    max_regression: float
+) -> Tuple[List[str], List[str]]:
+    """Report lines, and the lines describing regressions beyond the threshold."""
+    lines = [f"{'scenario':28} {'c':>4} {'req/s':>18} {'Δ':>8} {'p99 ms':>18} {'Δ':>8}"]
+    regressions = []
+    for key in sorted(baseline.keys() & candidate.keys()):
+        base, cand = baseline[key], candidate[key]
+        rps_change = change(base["throughput_rps"], cand["throughput_rps"])
+        p99_change = change(base["latency_ms"]["p99"], cand["latency_ms"]["p99"])
+        line = (
+            f"{key[0]:28} {key[1]:>4} "
+            f"{base['throughput_rps']:>8} → {cand['throughput_rps']:<8} {_pct(rps_change):>8} "
+            f"{base['latency_ms']['p99']!s:>8} → {cand['latency_ms']['p99']!s:<8} {_pct(p99_change):>8}"
+        )
+        lines.append(line)
+        slower = rps_change is not None and rps_change < -max_regression
+        laggier = p99_change is not None and p99_change > max_regression
+        if slower or laggier or cand["errors"] > base["errors"]:
+            regressions.append(line)
+
+    for key in sorted(baseline.keys() - candidate.keys()):
+        lines.append(f"{key[0]:28} {key[1]:>4} missing from candidate")
+    for key in sorted(candidate.keys() - baseline.keys()):
+        lines.append(f"{key[0]:28} {key[1]:>4} new in candidate")
+    return lines, regressions
+
+
+def _pct(value: Optional[float]) -> str:
+    return "n/a" if value is None else f"{value:+.1f}%"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument(
+        "--max-regression", type=float, default=10.0,
+        help="tolerated throughput drop / p99 increase, in percent"
+    )
+    args = parser.parse_args()
+
+    report, regressions = compare(load(args.baseline), load(args.candidate), args.max_regression)
+    print("\n".join(report))
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.max_regression}%:", file=sys.stderr)
+        print("\n".join(regressions), file=sys.stderr)
+        sys.exit(1)
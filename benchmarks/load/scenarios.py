@@ -0,0 +1,47 @@
+"""
+Request mixes driven by the load benchmark.
+
+One Scenario per endpoint shape worth tracking. New endpoints are
+benchmarked by appending to SCENARIOS; results are keyed by scenario
+name, so keep names stable across commits.
+"""
+
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Dict, List, Tuple
+
+
+@dataclass
+class Scenario:
+    """A GET request, with `{id}` in the path filled from existing IDs in turn."""
+    name: str
+    path: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    # List endpoint, and the key of its items, whose IDs fill `{id}`
+    ids_from: str = "/api/v1/countries/"
+    ids_key: str = "countries"
+
+    def requests(self, ids: List[int]):
+        """Endless (path, headers) pairs for this scenario."""
+        if "{id}" not in self.path:
+            while True:
+                yield self.path, self.headers
+        for i in count():
+            yield self.path.format(id=ids[i % len(ids)]), self.headers
+
+
+# Uncompressed JSON unless a scenario is about content coding
+JSON = {"Accept-Encoding": "identity"}
+
+SCENARIOS: Tuple[Scenario, ...] = (
+    Scenario("countries.list", "/api/v1/countries/", JSON),
+    Scenario("countries.list.active", "/api/v1/countries/?active_only=true", JSON),
+    Scenario("countries.list.brotli", "/api/v1/countries/", {"Accept-Encoding": "br"}),
+    Scenario("countries.page", "/api/v1/countries/?limit=50", JSON),
+    Scenario("countries.get", "/api/v1/countries/{id}", JSON),
+    Scenario(
+        "countries.stream",
+        "/api/v1/countries/",
+        {"Accept": "application/x-ndjson", "Accept-Encoding": "identity"}
+    ),
+)
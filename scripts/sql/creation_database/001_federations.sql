@@ -19,13 +19,20 @@ CREATE TABLE IF NOT EXISTS countries (
     iso_code CHAR(2) UNIQUE NOT NULL,           -- ISO-3166-1 alpha-2 code (e.g., BR, US)
     active BOOLEAN NOT NULL DEFAULT TRUE,       -- Whether the country is active in the system
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(), -- Record creation timestamp
-    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()  -- Last update timestamp
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(), -- Last update timestamp
+    -- Same rules as the Country entity, which loads rows without re-validating
+    -- them; 006_countries_constraints.sql adds them to existing databases
+    CONSTRAINT countries_name_format_chk CHECK (char_length(name) BETWEEN 2 AND 100 AND name !~ '^\s|\s$'),
+    CONSTRAINT countries_iso_code_format_chk CHECK (iso_code ~ '^[A-Z]{2}$')
 );
 COMMENT ON TABLE countries IS 'List of countries (ISO-3166-1 alpha-2).';
 COMMENT ON COLUMN countries.name IS 'Official country name.';
 COMMENT ON COLUMN countries.iso_code IS 'Two-letter ISO country code.';
 COMMENT ON COLUMN countries.active IS 'Defines if the country is active for federation management.';
 
+-- Ordered listing and keyset pagination (ORDER BY name, id / WHERE (name, id) > (...))
+CREATE INDEX IF NOT EXISTS idx_countries_name_id ON countries(name, id);
+
 CREATE TRIGGER trg_countries_updated_at
 BEFORE UPDATE ON countries
 FOR EACH ROW EXECUTE FUNCTION set_updated_at();
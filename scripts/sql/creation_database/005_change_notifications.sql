@@ -0,0 +1,34 @@
+-- ===========================================================
+-- Change notifications for reference tables
+-- ===========================================================
+-- Sends the table name on channel 'table_changed' after every committed
+-- INSERT/UPDATE/DELETE/TRUNCATE, so API processes can invalidate their
+-- in-memory query caches (QUERY_CACHE_ENABLED). Notifications are only
+-- delivered on commit and identical ones are folded per transaction.
+
+CREATE OR REPLACE FUNCTION notify_table_change()
+RETURNS TRIGGER LANGUAGE plpgsql AS $$
+BEGIN
+  PERFORM pg_notify('table_changed', TG_TABLE_NAME);
+  RETURN NULL;
+END$$;
+
+CREATE TRIGGER trg_countries_notify_change
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON countries
+FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER trg_sports_notify_change
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON sports
+FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER trg_staff_roles_notify_change
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON staff_roles
+FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER trg_referee_roles_notify_change
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON referee_roles
+FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
+
+CREATE TRIGGER trg_athlete_positions_notify_change
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON athlete_positions
+FOR EACH STATEMENT EXECUTE FUNCTION notify_table_change();
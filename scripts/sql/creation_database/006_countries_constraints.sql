@@ -0,0 +1,41 @@
+-- ===========================================================
+-- Countries: domain rules and listing index
+-- ===========================================================
+-- The API loads countries without validating them again, so the table
+-- must hold the Country entity's rules itself. 001_federations.sql
+-- creates them with the table; this script brings databases created
+-- before that up to date, and is a no-op on newer ones. Safe to run
+-- again: constraints are added NOT VALID (no long lock on the table),
+-- rows the API would have normalized are fixed, and only then are the
+-- constraints validated.
+
+UPDATE countries
+SET name = regexp_replace(name::text, '^\s+|\s+$', '', 'g'),
+    iso_code = upper(iso_code)
+WHERE name ~ '^\s|\s$' OR iso_code <> upper(iso_code);
+
+DO $$
+BEGIN
+  IF NOT EXISTS (
+    SELECT 1 FROM pg_constraint
+    WHERE conrelid = 'countries'::regclass AND conname = 'countries_name_format_chk'
+  ) THEN
+    ALTER TABLE countries ADD CONSTRAINT countries_name_format_chk
+      CHECK (char_length(name) BETWEEN 2 AND 100 AND name !~ '^\s|\s$') NOT VALID;
+  END IF;
+
+  IF NOT EXISTS (
+    SELECT 1 FROM pg_constraint
+    WHERE conrelid = 'countries'::regclass AND conname = 'countries_iso_code_format_chk'
+  ) THEN
+    ALTER TABLE countries ADD CONSTRAINT countries_iso_code_format_chk
+      CHECK (iso_code ~ '^[A-Z]{2}$') NOT VALID;
+  END IF;
+END$$;
+
+-- No-ops once validated; fail (naming the constraint) if invalid rows remain
+ALTER TABLE countries VALIDATE CONSTRAINT countries_name_format_chk;
+ALTER TABLE countries VALIDATE CONSTRAINT countries_iso_code_format_chk;
+
+-- Ordered listing and keyset pagination (ORDER BY name, id / WHERE (name, id) > (...))
+CREATE INDEX IF NOT EXISTS idx_countries_name_id ON countries(name, id);
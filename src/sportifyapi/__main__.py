@@ -0,0 +1,6 @@
+"""Run the API server: python -m sportifyapi serve."""
+
+from .server import main
+
+if __name__ == "__main__":
+    main()
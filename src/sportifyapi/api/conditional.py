@@ -0,0 +1,105 @@
+"""Conditional GET helpers (ETag / Last-Modified / 304)."""
+
+import hashlib
+import re
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Hashable, Optional
+
+from fastapi import Request, Response, status
+
+# "<digest>-br": the tag of a content-coded variant of "<digest>"
+_CODING_SUFFIX = re.compile(r'-[a-z0-9]+"$')
+
+
+def make_etag(*parts: Hashable) -> str:
+    """
+    Build a strong ETag from the parts that identify a representation.
+
+    Parts should include the version stamp (e.g. updated_at) and every
+    parameter that changes the body, so two different bodies never share
+    a tag.
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    """
+    Strong ETag of a representation in a content coding.
+
+    Each coding is a different representation and needs its own strong
+    validator (RFC 9110, section 8.8.3), so the coding is appended to
+    the tag: "<digest>-br". Identity keeps the plain tag.
+    """
+    if encoding is None:
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def validator_headers(
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    vary: Optional[str] = None
+) -> Dict[str, str]:
+    """Headers advertising the validators of a representation."""
+    headers = {"ETag": etag}
+    if vary is not None:
+        headers["Vary"] = vary
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    return headers
+
+
+def is_conditional(request: Request) -> bool:
+    """Whether the request carries a validator worth checking before the full read."""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_not_modified(
+    request: Request,
+    etag: str,
+    last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since against the current validators.
+
+    If-None-Match takes precedence: when present, If-Modified-Since is
+    ignored (RFC 9110, section 13.2.2). Tags are compared weakly, as
+    required for If-None-Match, and the coding suffix of encoded_etag()
+    is ignored on both sides: every coding of the current representation
+    is current.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {
+            _CODING_SUFFIX.sub('"', tag.strip().removeprefix("W/"))
+            for tag in if_none_match.split(",")
+        }
+        return "*" in tags or _CODING_SUFFIX.sub('"', etag) in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have one-second resolution
+    return last_modified.replace(microsecond=0) <= since
+
+
+def not_modified(
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    vary: Optional[str] = None
+) -> Response:
+    """Empty 304 response carrying the validators (and Vary) a 200 would have."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(etag, last_modified, vary)
+    )
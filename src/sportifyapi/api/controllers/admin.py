@@ -0,0 +1,168 @@
+"""Admin API Controller."""
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+
+from ...core.cache import list_snapshots, query_cache
+from ...core.database import slow_query_log, statement_cache_stats
+from ...core.profiling import profile_store
+from ...core.settings import settings
+from ..deps import require_admin
+from ..schemas.admin import (
+    CacheStatsResponse,
+    LayerTimeResponse,
+    ProfilesResponse,
+    ProfileSummaryResponse,
+    QueryCacheStatsResponse,
+    SlowQueriesResponse,
+    SlowQueryResponse,
+    SnapshotStatsResponse,
+    StatementCacheStatsResponse
+)
+from ..schemas.country import ErrorResponse
+from ..timing import TimedRoute
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin)],
+    responses={
+        403: {"model": ErrorResponse, "description": "Invalid admin token"},
+        404: {"model": ErrorResponse, "description": "Admin routes disabled"}
+    },
+    route_class=TimedRoute
+)
+
+
+@router.get(
+    "/cache-stats",
+    response_model=CacheStatsResponse,
+    summary="Get cache statistics",
+    description=(
+        "Hit/miss counters of the compiled statement cache (all database "
+        "engines), of the repository query cache and of the list "
+        "snapshots, for this process."
+    )
+)
+async def get_cache_stats() -> CacheStatsResponse:
+    """
+    Get cache statistics of this worker process.
+    
+    Requires the `X-Admin-Token` header.
+    """
+    return CacheStatsResponse(
+        statements=StatementCacheStatsResponse(**statement_cache_stats.snapshot()),
+        query_cache=QueryCacheStatsResponse(
+            enabled=settings.query_cache_enabled,
+            active=query_cache.active,
+            hits=query_cache.hits,
+            misses=query_cache.misses,
+            entries=len(query_cache)
+        ),
+        snapshots=SnapshotStatsResponse(
+            enabled=settings.list_snapshots_enabled,
+            hits=list_snapshots.hits,
+            builds=list_snapshots.builds,
+            entries=len(list_snapshots)
+        )
+    )
+
+
+@router.get(
+    "/slow-queries",
+    response_model=SlowQueriesResponse,
+    summary="Get slow queries",
+    description=(
+        "Statements slower than SLOW_QUERY_MS, aggregated per normalized "
+        "statement and sorted by total slow time, with redacted "
+        "parameters, originating route and sampled query plans, for "
+        "this process."
+    )
+)
+async def get_slow_queries() -> SlowQueriesResponse:
+    """
+    Get the slow-query log of this worker process.
+    
+    Requires the `X-Admin-Token` header.
+    """
+    return SlowQueriesResponse(
+        enabled=settings.slow_query_ms > 0,
+        threshold_ms=settings.slow_query_ms,
+        explain_rate=settings.slow_query_explain_rate,
+        queries=[SlowQueryResponse(**entry.as_dict()) for entry in slow_query_log.top()]
+    )
+
+
+@router.delete(
+    "/slow-queries",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Clear slow queries",
+    description="Forget the slow queries recorded by this process."
+)
+async def clear_slow_queries() -> None:
+    """
+    Clear the slow-query log of this worker process.
+    
+    Requires the `X-Admin-Token` header.
+    """
+    slow_query_log.reset()
+
+
+@router.get(
+    "/profiles",
+    response_model=ProfilesResponse,
+    summary="List request profiles",
+    description=(
+        "Summaries of the latest requests profiled with the X-Profile "
+        "header by this process: wall, CPU and await time, per layer."
+    )
+)
+async def list_profiles() -> ProfilesResponse:
+    """
+    List the request profiles stored by this worker process.
+    
+    Requires the `X-Admin-Token` header.
+    """
+    return ProfilesResponse(
+        enabled=settings.profiling_enabled,
+        profiles=[
+            ProfileSummaryResponse(
+                id=profile.id,
+                method=profile.method,
+                path=profile.path,
+                status=profile.status,
+                started_at=profile.started_at,
+                wall_seconds=profile.wall_seconds,
+                cpu_seconds=profile.cpu_seconds,
+                await_seconds=profile.await_seconds,
+                layers={
+                    layer: LayerTimeResponse(**times)
+                    for layer, times in profile.layers.items()
+                }
+            )
+            for profile in profile_store.latest()
+        ]
+    )
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    summary="Download a request profile",
+    description="The profile in speedscope format; open it at https://www.speedscope.app.",
+    responses={404: {"model": ErrorResponse, "description": "Profile not found"}}
+)
+async def get_profile(profile_id: str) -> Response:
+    """
+    Download a stored request profile.
+    
+    Requires the `X-Admin-Token` header.
+    """
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return Response(
+        content=profile.speedscope,
+        media_type="application/json",
+        headers={
+            "Content-Disposition": f'attachment; filename="profile-{profile.id}.speedscope.json"'
+        }
+    )
@@ -1,12 +1,24 @@
 """Country API Controller."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from ...application.use_cases.country.create_country import (
     CreateCountryUseCase, 
     CreateCountryRequest
 )
+from ...application.use_cases.country.create_many_countries import (
+    CreateManyCountriesUseCase,
+    CreateManyCountriesRequest
+)
+from ...application.use_cases.country.delete_country import (
+    DeleteCountryUseCase,
+    DeleteCountryRequest
+)
 from ...application.use_cases.country.get_all_countries import (
     GetAllCountriesUseCase, 
     GetAllCountriesRequest
@@ -15,16 +27,70 @@ from ...application.use_cases.country.get_country_by_id import (
     GetCountryByIdUseCase, 
     GetCountryByIdRequest
 )
+from ...application.use_cases.country.get_countries_page import (
+    GetCountriesPageUseCase,
+    GetCountriesPageRequest,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE
+)
+from ...application.use_cases.country.get_countries_version import (
+    GetCountriesVersionUseCase,
+    GetCountriesVersionRequest
+)
+from ...application.use_cases.country.get_country_rows import (
+    GetCountryRowsUseCase,
+    GetCountryRowsRequest,
+    GetCountryRowsResponse
+)
+from ...application.use_cases.country.get_country_version import (
+    GetCountryVersionUseCase,
+    GetCountryVersionRequest
+)
+from ...application.use_cases.country.patch_country import (
+    PatchCountryUseCase,
+    PatchCountryRequest
+)
+from ...application.use_cases.country.stream_countries import (
+    StreamCountriesUseCase,
+    StreamCountriesRequest
+)
+from ...application.use_cases.country.update_country import (
+    UpdateCountryUseCase,
+    UpdateCountryRequest
+)
+from ...core.cache import list_snapshots
+from ...core.settings import settings
+from ...domain.exceptions import CountryAlreadyExistsError, CountryNotFoundError
+from ...infrastructure.cache.snapshot_store import Snapshot
 from ..schemas.country import (
+    CountryBulkCreateRequest,
+    CountryBulkCreateResponse,
+    CountryBulkResultResponse,
     CountryCreateRequest,
     CountryCreateResponse,
+    CountryDeleteResponse,
+    CountryPatchRequest,
     CountryResponse,
     CountryListResponse,
+    CountryUpdateRequest,
+    CountryUpdateResponse,
     ErrorResponse
 )
-from ..deps import get_country_repository
+from ..conditional import (
+    encoded_etag,
+    is_conditional,
+    is_not_modified,
+    make_etag,
+    not_modified,
+    validator_headers
+)
+from ..encoding import VARY_ENCODING, negotiate_encoding, snapshot_response
+from ..timing import SERIALIZE, TimedRoute, run_use_case, timed
+from ..deps import country_repository_scope, get_country_repository, get_read_country_repository
+
+router = APIRouter(prefix="/countries", tags=["Countries"], route_class=TimedRoute)
 
-router = APIRouter(prefix="/countries", tags=["Countries"])
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 
 
 @router.post(
@@ -61,7 +127,7 @@ async def create_country(
         )
         
         # Execute use case
-        response = await use_case.execute(use_case_request)
+        response = await run_use_case(use_case.execute(use_case_request))
         
         # Convert use case response to API response
         return CountryCreateResponse(
@@ -72,6 +138,12 @@ async def create_country(
             message=response.message
         )
         
+    except CountryAlreadyExistsError as e:
+        # ISO code already taken
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     except ValueError as e:
         # Business rule violation
         raise HTTPException(
@@ -86,53 +158,240 @@ async def create_country(
         )
 
 
+@router.post(
+    "/bulk",
+    response_model=CountryBulkCreateResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid batch"}
+    },
+    summary="Create or update many countries",
+    description=(
+        "Validate a whole batch of countries and write it with a single "
+        "statement. Existing ISO codes get the new name or are skipped "
+        "according to `on_conflict`; their active flag is never changed."
+    )
+)
+async def create_many_countries(
+    request: CountryBulkCreateRequest,
+    country_repository=Depends(get_country_repository)
+) -> CountryBulkCreateResponse:
+    """
+    Create or update many countries.
+    
+    - **countries**: List of countries (name + ISO code), at most 1000
+    - **on_conflict**: `update` (default) or `skip` existing ISO codes
+    
+    Returns the status (created/updated/skipped) of every country.
+    """
+    try:
+        # Create use case
+        use_case = CreateManyCountriesUseCase(country_repository)
+        
+        # Convert API request to use case request
+        use_case_request = CreateManyCountriesRequest(
+            countries=[
+                CreateCountryRequest(name=country.name, iso_code=country.iso_code)
+                for country in request.countries
+            ],
+            on_conflict=request.on_conflict
+        )
+        
+        # Execute use case
+        response = await run_use_case(use_case.execute(use_case_request))
+        
+        # Convert use case response to API response
+        return CountryBulkCreateResponse(
+            countries=[
+                CountryBulkResultResponse(
+                    id=country.id,
+                    name=country.name,
+                    iso_code=country.iso_code,
+                    is_active=country.is_active,
+                    status=country.status
+                )
+                for country in response.countries
+            ],
+            created=response.created,
+            updated=response.updated,
+            skipped=response.skipped,
+            message=response.message
+        )
+        
+    except ValueError as e:
+        # Business rule violation
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception:
+        # Unexpected error
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
+
 @router.get(
     "/",
     response_model=CountryListResponse,
     responses={
-        200: {"model": CountryListResponse, "description": "Countries retrieved successfully"}
+        200: {
+            "model": CountryListResponse,
+            "description": "Countries retrieved successfully",
+            "content": {NDJSON_MEDIA_TYPE: {}}
+        },
+        304: {"description": "Not modified since the ETag in If-None-Match"},
+        400: {
+            "model": ErrorResponse,
+            "description": "Invalid cursor or page size, or pagination with NDJSON"
+        }
     },
     summary="Get all countries",
-    description="Retrieve all countries. Optionally filter by active status."
+    description=(
+        "Retrieve all countries. Optionally filter by active status. "
+        "Pass `limit` (and `after`) for keyset pagination, or send "
+        f"`Accept: {NDJSON_MEDIA_TYPE}` to stream every country, one per line. "
+        "Responses carry an ETag; send it back in `If-None-Match` to get "
+        "a 304 while the list is unchanged."
+    )
 )
 async def get_all_countries(
+    request: Request,
+    http_response: Response,
     active_only: bool = False,
-    country_repository=Depends(get_country_repository)
-) -> CountryListResponse:
+    after: Optional[str] = Query(
+        None,
+        description="Cursor of the last country seen, as '<name>,<id>'"
+    ),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Page size; enables keyset pagination"
+    ),
+    country_repository=Depends(get_read_country_repository)
+):
     """
     Get all countries.
     
     - **active_only**: If true, return only active countries
+    - **after**: Cursor returned as `next_cursor` by the previous page
+    - **limit**: Maximum number of countries per page
     
     Returns list of countries with total count.
     """
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        if after is not None or limit is not None:
+            # A stream is the whole list; silently ignoring the page would mislead
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Pagination (after, limit) is not supported with Accept: {NDJSON_MEDIA_TYPE}"
+            )
+        return StreamingResponse(
+            _stream_countries_ndjson(active_only),
+            media_type=NDJSON_MEDIA_TYPE
+        )
+    
     try:
-        # Create use case
-        use_case = GetAllCountriesUseCase(country_repository)
+        # Answer conditional requests from the list's version stamp alone
+        version_use_case = GetCountriesVersionUseCase(country_repository)
+        version = await run_use_case(version_use_case.execute(
+            GetCountriesVersionRequest(active_only=active_only)
+        ))
+        # max(updated_at) misses deletions, so lists are validated by ETag
+        # only and send no Last-Modified
+        etag = make_etag(
+            "countries", active_only, after, limit, version.last_modified, version.total
+        )
+        paginated = after is not None or limit is not None
+        # Full lists are served from a snapshot built for this very ETag,
+        # in the client's content coding, each coding with its own ETag
+        use_snapshot = (
+            settings.fast_serialization and settings.list_snapshots_enabled and not paginated
+        )
+        if is_not_modified(request, etag):
+            encoding = negotiate_encoding(request) if use_snapshot else None
+            return not_modified(encoded_etag(etag, encoding), vary=VARY_ENCODING)
+        headers = validator_headers(etag, vary=VARY_ENCODING)
         
-        # Create request
-        use_case_request = GetAllCountriesRequest(active_only=active_only)
+        if settings.fast_serialization:
+            snapshot_key = ("countries", active_only)
+            if use_snapshot:
+                snapshot = list_snapshots.get(snapshot_key, etag)
+                if snapshot is not None:
+                    return snapshot_response(request, snapshot, headers)
+            
+            # Rows go straight to JSON bytes: no entity, DTO or response model per row
+            rows_use_case = GetCountryRowsUseCase(country_repository)
+            rows = await run_use_case(rows_use_case.execute(
+                GetCountryRowsRequest(
+                    active_only=active_only,
+                    after=after,
+                    limit=(limit or DEFAULT_PAGE_SIZE) if paginated else None
+                )
+            ))
+            with timed(SERIALIZE):
+                content = _encode_country_rows(rows)
+            if use_snapshot:
+                # Compression releases the GIL; keep it off the event loop
+                with timed(SERIALIZE):
+                    snapshot = await asyncio.to_thread(Snapshot.build, etag, content)
+                list_snapshots.put(snapshot_key, snapshot)
+                return snapshot_response(request, snapshot, headers)
+            return Response(
+                content=content,
+                media_type="application/json",
+                headers=headers
+            )
         
-        # Execute use case
-        response = await use_case.execute(use_case_request)
+        http_response.headers.update(headers)
         
-        # Convert use case response to API response
-        countries = [
-            CountryResponse(
-                id=country.id,
-                name=country.name,
-                iso_code=country.iso_code,
-                is_active=country.is_active
-            )
-            for country in response.countries
-        ]
+        if paginated:
+            # Keyset pagination
+            page_use_case = GetCountriesPageUseCase(country_repository)
+            page = await run_use_case(page_use_case.execute(
+                GetCountriesPageRequest(
+                    active_only=active_only,
+                    after=after,
+                    limit=limit or DEFAULT_PAGE_SIZE
+                )
+            ))
+            countries, total, message = page.countries, page.total, page.message
+            next_cursor = page.next_cursor
+        else:
+            # Create use case
+            use_case = GetAllCountriesUseCase(country_repository)
+            
+            # Create request
+            use_case_request = GetAllCountriesRequest(active_only=active_only)
+            
+            # Execute use case
+            response = await run_use_case(use_case.execute(use_case_request))
+            countries, total, message = response.countries, response.total, response.message
+            next_cursor = None
         
+        # Convert use case response to API response
         return CountryListResponse(
-            countries=countries,
-            total=response.total,
-            message=response.message
+            countries=[
+                CountryResponse(
+                    id=country.id,
+                    name=country.name,
+                    iso_code=country.iso_code,
+                    is_active=country.is_active
+                )
+                for country in countries
+            ],
+            total=total,
+            message=message,
+            next_cursor=next_cursor
         )
         
+    except ValueError as e:
+        # Invalid cursor or page size
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         # Unexpected error
         raise HTTPException(
@@ -141,20 +400,53 @@ async def get_all_countries(
         )
 
 
+def _encode_country_rows(response: GetCountryRowsResponse) -> bytes:
+    """Encode rows to the same JSON document CountryListResponse produces."""
+    return orjson.dumps({
+        "countries": [
+            {"id": country_id, "name": name, "iso_code": iso_code, "is_active": is_active}
+            for country_id, name, iso_code, is_active in response.rows
+        ],
+        "total": response.total,
+        "message": response.message,
+        "next_cursor": response.next_cursor
+    })
+
+
+async def _stream_countries_ndjson(active_only: bool) -> AsyncIterator[bytes]:
+    """Yield one JSON document per country, straight from a server-side cursor."""
+    async with country_repository_scope(read_only=True) as country_repository:
+        use_case = StreamCountriesUseCase(country_repository)
+        async for country in use_case.execute(StreamCountriesRequest(active_only=active_only)):
+            yield orjson.dumps({
+                "id": country.id,
+                "name": country.name,
+                "iso_code": country.iso_code,
+                "is_active": country.is_active
+            }, option=orjson.OPT_APPEND_NEWLINE)
+
+
 @router.get(
     "/{country_id}",
     response_model=CountryResponse,
     responses={
         200: {"model": CountryResponse, "description": "Country retrieved successfully"},
+        304: {"description": "Not modified since If-None-Match / If-Modified-Since"},
         404: {"model": ErrorResponse, "description": "Country not found"}
     },
     summary="Get country by ID",
-    description="Retrieve a specific country by its ID."
+    description=(
+        "Retrieve a specific country by its ID. Responses carry ETag and "
+        "Last-Modified; send them back in `If-None-Match` or "
+        "`If-Modified-Since` to get a 304 while the country is unchanged."
+    )
 )
 async def get_country_by_id(
     country_id: int,
-    country_repository=Depends(get_country_repository)
-) -> CountryResponse:
+    request: Request,
+    http_response: Response,
+    country_repository=Depends(get_read_country_repository)
+):
     """
     Get country by ID.
     
@@ -163,6 +455,16 @@ async def get_country_by_id(
     Returns the country data.
     """
     try:
+        if is_conditional(request):
+            # Answer conditional requests from the country's updated_at alone
+            version_use_case = GetCountryVersionUseCase(country_repository)
+            version = await run_use_case(version_use_case.execute(
+                GetCountryVersionRequest(country_id=country_id)
+            ))
+            etag = make_etag("country", country_id, version.last_modified)
+            if is_not_modified(request, etag, version.last_modified):
+                return not_modified(etag, version.last_modified)
+        
         # Create use case
         use_case = GetCountryByIdUseCase(country_repository)
         
@@ -170,7 +472,9 @@ async def get_country_by_id(
         use_case_request = GetCountryByIdRequest(country_id=country_id)
         
         # Execute use case
-        response = await use_case.execute(use_case_request)
+        response = await run_use_case(use_case.execute(use_case_request))
+        etag = make_etag("country", response.id, response.updated_at)
+        http_response.headers.update(validator_headers(etag, response.updated_at))
         
         # Convert use case response to API response
         return CountryResponse(
@@ -192,3 +496,197 @@ async def get_country_by_id(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error"
         )
+
+
+@router.put(
+    "/{country_id}",
+    response_model=CountryUpdateResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Bad Request"},
+        404: {"model": ErrorResponse, "description": "Country not found"},
+        409: {"model": ErrorResponse, "description": "Country already exists"}
+    },
+    summary="Replace a country",
+    description="Replace name, ISO code and active flag of an existing country."
+)
+async def update_country(
+    country_id: int,
+    request: CountryUpdateRequest,
+    country_repository=Depends(get_country_repository)
+) -> CountryUpdateResponse:
+    """
+    Replace a country.
+    
+    - **country_id**: ID of the country to update
+    - **name**: Country name (2-100 characters)
+    - **iso_code**: ISO-3166-1 alpha-2 code, must stay unique
+    - **is_active**: Whether the country is active (default true)
+    
+    Returns the updated country.
+    """
+    try:
+        # Create use case
+        use_case = UpdateCountryUseCase(country_repository)
+        
+        # Convert API request to use case request
+        use_case_request = UpdateCountryRequest(
+            country_id=country_id,
+            name=request.name,
+            iso_code=request.iso_code,
+            is_active=request.is_active
+        )
+        
+        # Execute use case
+        response = await run_use_case(use_case.execute(use_case_request))
+        
+        # Convert use case response to API response
+        return CountryUpdateResponse(
+            id=response.id,
+            name=response.name,
+            iso_code=response.iso_code,
+            is_active=response.is_active,
+            message=response.message
+        )
+        
+    except CountryNotFoundError as e:
+        # Country not found
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except CountryAlreadyExistsError as e:
+        # ISO code already taken
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except ValueError as e:
+        # Business rule violation
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception:
+        # Unexpected error
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
+
+@router.patch(
+    "/{country_id}",
+    response_model=CountryUpdateResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Bad Request"},
+        404: {"model": ErrorResponse, "description": "Country not found"},
+        409: {"model": ErrorResponse, "description": "Country already exists"}
+    },
+    summary="Update a country partially",
+    description="Update only the given fields of an existing country."
+)
+async def patch_country(
+    country_id: int,
+    request: CountryPatchRequest,
+    country_repository=Depends(get_country_repository)
+) -> CountryUpdateResponse:
+    """
+    Update some fields of a country.
+    
+    - **country_id**: ID of the country to update
+    - **name** / **iso_code** / **is_active**: Fields to change (at least one)
+    
+    Returns the updated country.
+    """
+    try:
+        # Create use case
+        use_case = PatchCountryUseCase(country_repository)
+        
+        # Convert API request to use case request
+        use_case_request = PatchCountryRequest(
+            country_id=country_id,
+            name=request.name,
+            iso_code=request.iso_code,
+            is_active=request.is_active
+        )
+        
+        # Execute use case
+        response = await run_use_case(use_case.execute(use_case_request))
+        
+        # Convert use case response to API response
+        return CountryUpdateResponse(
+            id=response.id,
+            name=response.name,
+            iso_code=response.iso_code,
+            is_active=response.is_active,
+            message=response.message
+        )
+        
+    except CountryNotFoundError as e:
+        # Country not found
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except CountryAlreadyExistsError as e:
+        # ISO code already taken
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except ValueError as e:
+        # Business rule violation
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception:
+        # Unexpected error
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
+
+@router.delete(
+    "/{country_id}",
+    response_model=CountryDeleteResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Country not found"}
+    },
+    summary="Delete a country",
+    description="Delete a country by its ID."
+)
+async def delete_country(
+    country_id: int,
+    country_repository=Depends(get_country_repository)
+) -> CountryDeleteResponse:
+    """
+    Delete a country.
+    
+    - **country_id**: ID of the country to delete
+    
+    Returns the ID of the deleted country.
+    """
+    try:
+        # Create use case
+        use_case = DeleteCountryUseCase(country_repository)
+        
+        # Execute use case
+        response = await run_use_case(use_case.execute(DeleteCountryRequest(country_id=country_id)))
+        
+        # Convert use case response to API response
+        return CountryDeleteResponse(id=response.id, message=response.message)
+        
+    except CountryNotFoundError as e:
+        # Country not found
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception:
+        # Unexpected error
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
@@ -1,10 +1,19 @@
 """API dependency injection."""
 
-from fastapi import Depends
+import hmac
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from fastapi import Depends, Header, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..core.database import get_db_session
+from ..core.batching import country_loader
+from ..core.cache import query_cache
+from ..core.database import db_config, get_db_session, get_read_db_session, is_primary_pinned
+from ..core.settings import settings
 from ..domain.repositories.country_repository import CountryRepository
+from ..infrastructure.batching.batched_country_repository import BatchedCountryRepository
+from ..infrastructure.cache.cached_country_repository import CachedCountryRepository
 from ..infrastructure.database.repositories.country_repository import SQLCountryRepository
 
 
@@ -15,6 +24,72 @@ async def get_country_repository(
     Dependency to get country repository.
     
     This is where we inject the concrete implementation
-    of the repository interface.
+    of the repository interface. With QUERY_CACHE_ENABLED, reads
+    are served from the in-process query cache.
+    """
+    return _country_repository(session)
+
+
+async def get_read_country_repository(
+    session: AsyncSession = Depends(get_read_db_session)
+) -> CountryRepository:
+    """
+    Dependency to get a read-only country repository.
+    
+    For GET routes: the session is on a read replica when one is
+    configured and healthy, otherwise on the primary. With
+    BATCH_LOADING_ENABLED, find_by_id is batched across concurrent
+    requests, unless this request must read from the primary.
+    """
+    repository: CountryRepository = SQLCountryRepository(session)
+    if settings.batch_loading_enabled and not is_primary_pinned():
+        repository = BatchedCountryRepository(repository, country_loader)
+    return _with_query_cache(repository, session)
+
+
+@asynccontextmanager
+async def country_repository_scope(read_only: bool = False) -> AsyncIterator[CountryRepository]:
+    """
+    Open a country repository with its own database session.
+    
+    FastAPI tears down dependencies before a streaming response body
+    is sent, so streaming endpoints open their repository here instead
+    of using get_country_repository.
+    """
+    if read_only:
+        async with db_config.read_session_scope(streaming=True) as session:
+            yield SQLCountryRepository(session)
+    else:
+        async with db_config.session_scope() as session:
+            yield SQLCountryRepository(session)
+
+
+def _country_repository(session: AsyncSession) -> CountryRepository:
+    """SQL repository, behind the query cache when enabled."""
+    return _with_query_cache(SQLCountryRepository(session), session)
+
+
+def _with_query_cache(repository: CountryRepository, session: AsyncSession) -> CountryRepository:
+    """Put the query cache in front of a repository reading through session."""
+    # NOTIFY can arrive before a replica has replayed the change, so only
+    # reads from the primary may repopulate the cache
+    if settings.query_cache_enabled and db_config.is_primary(session):
+        return CachedCountryRepository(repository, query_cache)
+    return repository
+
+
+async def require_admin(
+    x_admin_token: Optional[str] = Header(None, description="Value of ADMIN_TOKEN")
+) -> None:
+    """
+    Dependency guarding admin routes.
+    
+    Admin routes do not exist (404) unless ADMIN_TOKEN is set, and
+    answer 403 to requests without the matching X-Admin-Token header.
     """
-    return SQLCountryRepository(session)
+    if settings.admin_token is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_admin_token is None or not hmac.compare_digest(
+        x_admin_token.encode(), settings.admin_token.encode()
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token")
@@ -0,0 +1,74 @@
+"""Content negotiation for pre-compressed response bodies."""
+
+from typing import Dict, Optional, Tuple
+
+from fastapi import Request, Response
+
+from ..infrastructure.cache.snapshot_store import Snapshot
+from .conditional import encoded_etag
+
+# Codings we can serve, most preferred first
+SUPPORTED_ENCODINGS = ("br", "gzip")
+
+# Vary value of every response of a URL that may serve a coded body
+VARY_ENCODING = "Accept-Encoding"
+
+
+def negotiate_encoding(
+    request: Request,
+    supported: Tuple[str, ...] = SUPPORTED_ENCODINGS
+) -> Optional[str]:
+    """
+    Pick a content coding from Accept-Encoding, None meaning identity.
+
+    Higher q-values win; on a tie the order of `supported` decides.
+    Codings listed with q=0 are refused, and `*` stands for any coding
+    not listed explicitly.
+    """
+    header = request.headers.get("accept-encoding")
+    if not header:
+        return None
+
+    weights: Dict[str, float] = {}
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding:
+            weights[coding] = q
+
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in supported:
+        q = weights.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def snapshot_response(
+    request: Request,
+    snapshot: Snapshot,
+    headers: Dict[str, str],
+    media_type: str = "application/json"
+) -> Response:
+    """
+    Serve a snapshot in the coding the client prefers, under the ETag
+    of that coding.
+    """
+    encoding = negotiate_encoding(request)
+    response_headers = {**headers, "ETag": encoded_etag(snapshot.etag, encoding), "Vary": VARY_ENCODING}
+    if encoding is not None:
+        response_headers["Content-Encoding"] = encoding
+    return Response(
+        content=snapshot.body(encoding),
+        media_type=media_type,
+        headers=response_headers
+    )
@@ -0,0 +1,59 @@
+"""Prometheus request metrics."""
+
+import time
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUEST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def route_template(scope: Scope) -> str:
+    """Template of the API route that matched this request, once the router has run."""
+    # The router stores the matched route in the shared scope
+    return getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+
+
+class MetricsMiddleware:
+    """
+    Record latency and status of every HTTP request, per route.
+
+    Requests are labelled with the route template (`/countries/{id}`),
+    not the raw path, so label cardinality stays bounded; requests no
+    API route matched share `<unmatched>`. The duration runs until the
+    application returns, so streamed bodies are included.
+    """
+
+    def __init__(self, app: ASGIApp, registry: CollectorRegistry = REGISTRY):
+        self.app = app
+        self.duration = Histogram(
+            "http_request_duration_seconds", "HTTP request latency",
+            ["method", "route", "status"], buckets=REQUEST_BUCKETS, registry=registry
+        )
+        self.requests = Counter(
+            "http_requests_total", "HTTP requests",
+            ["method", "route", "status"], registry=registry
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            labels = (scope["method"], route_template(scope), str(status))
+            self.duration.labels(*labels).observe(time.perf_counter() - started)
+            self.requests.labels(*labels).inc()
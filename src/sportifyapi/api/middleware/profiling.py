@@ -0,0 +1,124 @@
+"""On-demand profiling of single requests."""
+
+import hmac
+import json
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+from uuid import uuid4
+
+from pyinstrument import Profiler
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...infrastructure.profiling.request_profile import ProfileStore, RequestProfile
+
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = "x-profile-id"
+PROFILE_SUMMARY_HEADER = "x-profile-summary"
+
+# X-Profile value returning the profile instead of the response
+RETURN_SPEEDSCOPE = "speedscope"
+
+
+class ProfilingMiddleware:
+    """
+    Profile requests carrying `X-Profile` and a valid `X-Admin-Token`.
+
+    The request runs under pyinstrument's sampling profiler in async
+    mode, so only this request's task is sampled and its awaits show
+    as [await] frames. The profile is stored (X-Profile-Id names it
+    for /api/v1/admin/profiles/{id}) and summarized in
+    X-Profile-Summary; with `X-Profile: speedscope` the speedscope
+    document replaces the response body.
+
+    Profiled responses are buffered until the profile is complete.
+    Requests without the header only pay for the header lookup.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: ProfileStore,
+        admin_token: Optional[str],
+        interval_seconds: float = 0.001
+    ):
+        self.app = app
+        self.store = store
+        self.admin_token = admin_token
+        self.interval_seconds = interval_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        mode = headers.get(PROFILE_HEADER)
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not self._authorized(headers.get("x-admin-token")):
+            await _send_json(send, 403, json.dumps({"detail": "Invalid admin token"}).encode())
+            return
+
+        messages: List[Message] = []
+
+        async def buffer(message: Message) -> None:
+            messages.append(message)
+
+        started_at = datetime.now(timezone.utc)
+        profiler = Profiler(interval=self.interval_seconds, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, buffer)
+        finally:
+            session = profiler.stop()
+
+        start = messages[0]
+        profile = RequestProfile.from_session(
+            id=uuid4().hex[:16],
+            method=scope["method"],
+            path=scope["path"],
+            status=start["status"],
+            started_at=started_at,
+            session=session
+        )
+        self.store.put(profile)
+
+        if mode.strip().lower() == RETURN_SPEEDSCOPE:
+            await _send_json(send, 200, profile.speedscope.encode(), extra_headers=[
+                (b"content-disposition", f'attachment; filename="profile-{profile.id}.speedscope.json"'.encode()),
+                (PROFILE_ID_HEADER.encode(), profile.id.encode()),
+            ])
+            return
+
+        response_headers = MutableHeaders(scope=start)
+        response_headers[PROFILE_ID_HEADER] = profile.id
+        response_headers[PROFILE_SUMMARY_HEADER] = (
+            f"wall={profile.wall_seconds * 1e3:.1f}ms; "
+            f"cpu={profile.cpu_seconds * 1e3:.1f}ms; "
+            f"await={profile.await_seconds * 1e3:.1f}ms"
+        )
+        for message in messages:
+            await send(message)
+
+    def _authorized(self, token: Optional[str]) -> bool:
+        return (
+            self.admin_token is not None
+            and token is not None
+            and hmac.compare_digest(token.encode(), self.admin_token.encode())
+        )
+
+
+async def _send_json(send: Send, status: int, body: bytes, extra_headers: Iterable = ()) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            *extra_headers,
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
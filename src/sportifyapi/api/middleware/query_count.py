@@ -0,0 +1,54 @@
+"""Per-request SQL statement counts, for spotting N+1 queries."""
+
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...infrastructure.database.query_counter import QueryCounter
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "x-query-count"
+QUERY_TIME_HEADER = "x-query-time-ms"
+QUERY_REPEATED_HEADER = "x-query-repeated"
+
+
+class QueryCountMiddleware:
+    """
+    Report the statements each request executed in response headers.
+
+    X-Query-Count and X-Query-Time-Ms give the statements and DB time
+    up to the response start (a streamed body's later queries are not
+    included). Statement shapes executed `repeat_threshold` times or
+    more, the signature of a lazy load in a loop, are counted in
+    X-Query-Repeated and logged with the route.
+    """
+
+    def __init__(self, app: ASGIApp, counter: QueryCounter, repeat_threshold: int):
+        self.app = app
+        self.counter = counter
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with self.counter.track() as log:
+            async def send_with_counts(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    repeated = log.repeated(self.repeat_threshold)
+                    headers = MutableHeaders(scope=message)
+                    headers[QUERY_COUNT_HEADER] = str(log.count)
+                    headers[QUERY_TIME_HEADER] = f"{log.duration * 1e3:.2f}"
+                    if repeated:
+                        headers[QUERY_REPEATED_HEADER] = str(len(repeated))
+                        for shape, times in repeated:
+                            logger.warning(
+                                "Possible N+1 on %s %s: %d × %s",
+                                scope["method"], scope["path"], times, shape
+                            )
+                await send(message)
+
+            await self.app(scope, receive, send_with_counts)
@@ -0,0 +1,73 @@
+"""Read-your-writes routing for replica reads."""
+
+import time
+from http.cookies import SimpleCookie
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...core.database import pin_primary
+
+READ_PRIMARY_HEADER = "x-read-primary"
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class ReadYourWritesMiddleware:
+    """
+    Send reads to the primary for clients that just wrote.
+
+    A successful write sets a short-lived cookie; while it is valid,
+    or when the request carries an `X-Read-Primary: true` header, the
+    request is pinned to the primary so replica lag can never hide
+    the client's own changes.
+    """
+
+    def __init__(self, app: ASGIApp, window_seconds: float):
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self._wants_primary(scope):
+            with pin_primary():
+                await self._call(scope, receive, send)
+        else:
+            await self._call(scope, receive, send)
+
+    async def _call(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["method"] not in WRITE_METHODS or self.window_seconds <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                cookie = SimpleCookie()
+                cookie[READ_PRIMARY_COOKIE] = str(int(time.time() + self.window_seconds))
+                cookie[READ_PRIMARY_COOKIE]["max-age"] = int(self.window_seconds) or 1
+                cookie[READ_PRIMARY_COOKIE]["path"] = "/"
+                cookie[READ_PRIMARY_COOKIE]["httponly"] = True
+                MutableHeaders(scope=message).append(
+                    "set-cookie", cookie.output(header="").strip()
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+    @staticmethod
+    def _wants_primary(scope: Scope) -> bool:
+        """Header opt-in, or a read-your-writes cookie that has not expired yet."""
+        for name, value in scope["headers"]:
+            if name == READ_PRIMARY_HEADER.encode():
+                if value.decode("latin-1").strip().lower() in ("1", "true", "yes"):
+                    return True
+            elif name == b"cookie":
+                cookie = SimpleCookie(value.decode("latin-1"))
+                until = cookie.get(READ_PRIMARY_COOKIE)
+                if until is not None and until.value.isdigit() and int(until.value) > time.time():
+                    return True
+        return False
@@ -0,0 +1,54 @@
+"""Server-Timing response header."""
+
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...infrastructure.database.query_counter import QueryCounter
+from ..timing import CONVERT, SERIALIZE, USE_CASE, USE_CASE_DB, timing_scope
+
+
+class ServerTimingMiddleware:
+    """
+    Add a Server-Timing header breaking each response's time down by layer.
+
+        Server-Timing: db;dur=1.9;desc="queries: 2", use_case;dur=0.5,
+                       convert;dur=0.1, serialize;dur=0.2, total;dur=3.5
+
+    - db: SQL statement execution (engine events)
+    - use_case: use case executions minus their DB time (domain and
+      application work), so it never overlaps db
+    - convert: the endpoint's own work (DTOs, response models, headers)
+    - serialize: JSON encoding and compression of the response
+    - total: from the request to the response start
+
+    Durations are in milliseconds and cover the work done before the
+    response starts; a streamed body's later work is not included.
+    """
+
+    def __init__(self, app: ASGIApp, counter: QueryCounter):
+        self.app = app
+        self.counter = counter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        with timing_scope(self.counter) as timings, self.counter.track() as queries:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    total = time.perf_counter() - started
+                    use_case = max(timings.get(USE_CASE) - timings.get(USE_CASE_DB), 0.0)
+                    MutableHeaders(scope=message).append("server-timing", (
+                        f'db;dur={queries.duration * 1e3:.1f};desc="queries: {queries.count}", '
+                        f"{USE_CASE};dur={use_case * 1e3:.1f}, "
+                        f"{CONVERT};dur={timings.get(CONVERT) * 1e3:.1f}, "
+                        f"{SERIALIZE};dur={timings.get(SERIALIZE) * 1e3:.1f}, "
+                        f"total;dur={total * 1e3:.1f}"
+                    ))
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
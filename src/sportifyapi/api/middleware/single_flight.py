@@ -0,0 +1,142 @@
+"""Single-flight coalescing of identical in-flight GET requests."""
+
+import asyncio
+import hashlib
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Request headers that change the response body or its status
+VARY_HEADERS = (
+    b"accept",
+    b"accept-encoding",
+    b"if-none-match",
+    b"if-modified-since",
+    b"origin",
+    b"x-read-primary",
+)
+
+# Request headers that identify the caller; responses never cross them
+AUTH_HEADERS = (
+    b"authorization",
+    b"cookie",
+    b"x-admin-token",
+)
+
+# Streaming responses are never shared
+UNSHARED_CONTENT_TYPES = (b"application/x-ndjson",)
+
+DEFAULT_MAX_BODY_BYTES = 1024 * 1024
+
+
+class SingleFlightMiddleware:
+    """
+    Let one of several identical concurrent GET requests run.
+
+    Requests share a key when their path, normalized query string,
+    representation headers (VARY_HEADERS) and credentials (AUTH_HEADERS,
+    hashed) are equal. The first request of a key runs the app as usual
+    and records its response; duplicates arriving meanwhile wait for it
+    and replay that response instead of running the app themselves.
+
+    A duplicate runs the app itself when the leader takes longer than
+    timeout_seconds, fails, or produces a response that must not be
+    shared: one setting a cookie, a streamed NDJSON body, or a body
+    larger than max_body_bytes.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        timeout_seconds: float,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES
+    ):
+        self.app = app
+        self.timeout_seconds = timeout_seconds
+        self.max_body_bytes = max_body_bytes
+        self._in_flight: Dict[Tuple, asyncio.Future] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        key = self._key(scope)
+        leader = self._in_flight.get(key)
+        if leader is None:
+            await self._lead(key, scope, receive, send)
+            return
+
+        try:
+            messages = await asyncio.wait_for(asyncio.shield(leader), self.timeout_seconds)
+        except asyncio.TimeoutError:
+            messages = None
+        if messages is None:
+            await self.app(scope, receive, send)
+            return
+
+        self.followers += 1
+        for message in messages:
+            # Outer middleware may edit headers in place; give each client its own
+            await send({**message, "headers": list(message.get("headers", []))})
+
+    async def _lead(self, key: Tuple, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the app for key, sending to this client while recording the response."""
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        self.leaders += 1
+
+        recorded: Optional[List[Message]] = []
+        size = 0
+
+        async def send_and_record(message: Message) -> None:
+            nonlocal recorded, size
+            if recorded is not None:
+                if message["type"] == "http.response.start" and not self._shareable(message):
+                    recorded = None
+                elif message["type"] == "http.response.body":
+                    size += len(message.get("body", b""))
+                    if size > self.max_body_bytes:
+                        recorded = None
+                if recorded is not None:
+                    recorded.append({**message, "headers": list(message.get("headers", []))})
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_record)
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+            complete = bool(recorded) and not recorded[-1].get("more_body", False)
+            future.set_result(recorded if complete else None)
+
+    @staticmethod
+    def _shareable(message: Message) -> bool:
+        for name, value in message.get("headers", []):
+            if name == b"set-cookie":
+                return False
+            if name == b"content-type" and value.startswith(UNSHARED_CONTENT_TYPES):
+                return False
+        return True
+
+    @staticmethod
+    def _key(scope: Scope) -> Tuple:
+        """Path, sorted query parameters, representation headers and a credentials digest."""
+        query_string = scope.get("query_string", b"").decode("latin-1")
+        query = urlencode(sorted(parse_qsl(query_string, keep_blank_values=True)))
+        vary = []
+        credentials = hashlib.blake2b(digest_size=16)
+        for name, value in scope["headers"]:
+            if name in VARY_HEADERS:
+                vary.append((name, value))
+            elif name in AUTH_HEADERS:
+                credentials.update(name + b"\0" + value + b"\0")
+        return (
+            scope.get("root_path", "") + scope["path"],
+            query,
+            tuple(sorted(vary)),
+            credentials.digest(),
+        )
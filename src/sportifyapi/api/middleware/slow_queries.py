@@ -0,0 +1,23 @@
+"""Attribution of slow queries to the route that ran them."""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ...infrastructure.database.slow_query_log import SlowQueryLog
+from .metrics import route_template
+
+
+class SlowQueryOriginMiddleware:
+    """Record slow statements of a request as coming from "METHOD /route/{template}"."""
+
+    def __init__(self, app: ASGIApp, slow_query_log: SlowQueryLog):
+        self.app = app
+        self.slow_query_log = slow_query_log
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Resolved lazily: the route is only known once the router has run
+        with self.slow_query_log.origin(lambda: f"{scope['method']} {route_template(scope)}"):
+            await self.app(scope, receive, send)
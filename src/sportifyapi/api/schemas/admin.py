@@ -0,0 +1,101 @@
+"""Admin API Schemas."""
+
+from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+
+class StatementCacheStatsResponse(BaseModel):
+    """Schema for SQLAlchemy compiled statement cache statistics."""
+    
+    hits: int = Field(..., description="Executions served from the compiled cache")
+    misses: int = Field(..., description="Executions that compiled and cached a statement")
+    uncached: int = Field(..., description="Executions compiled without caching")
+    hit_ratio: Optional[float] = Field(None, description="hits / executions, null before any execution")
+    compiled_cache_entries: Optional[int] = Field(
+        None,
+        description="Statements currently in the compiled caches, null if SQLAlchemy does not expose them"
+    )
+
+
+class QueryCacheStatsResponse(BaseModel):
+    """Schema for repository query cache statistics."""
+    
+    enabled: bool = Field(..., description="Whether QUERY_CACHE_ENABLED is set")
+    active: bool = Field(..., description="Whether the cache currently serves entries")
+    hits: int
+    misses: int
+    entries: int
+
+
+class SnapshotStatsResponse(BaseModel):
+    """Schema for list snapshot statistics."""
+    
+    enabled: bool = Field(..., description="Whether LIST_SNAPSHOTS_ENABLED is set")
+    hits: int = Field(..., description="Responses served from a snapshot")
+    builds: int = Field(..., description="Snapshots built after a change")
+    entries: int
+
+
+class CacheStatsResponse(BaseModel):
+    """Schema for cache statistics."""
+    
+    statements: StatementCacheStatsResponse
+    query_cache: QueryCacheStatsResponse
+    snapshots: SnapshotStatsResponse
+
+
+class SlowQueryResponse(BaseModel):
+    """Schema for the slow executions of one statement shape."""
+    
+    fingerprint: str = Field(..., description="Stable ID of the normalized statement")
+    statement: str = Field(..., description="Statement with placeholders normalized")
+    calls: int = Field(..., description="Executions over the threshold")
+    total_seconds: float
+    max_seconds: float
+    last_seconds: float
+    last_parameters: Any = Field(None, description="Parameters of the last slow execution, redacted")
+    last_origin: Optional[str] = Field(None, description="Route of the last slow execution")
+    last_seen: Optional[datetime] = None
+    plan: Optional[Any] = Field(None, description="Latest sampled EXPLAIN (ANALYZE, BUFFERS) plan, as JSON")
+    plan_captured_at: Optional[datetime] = None
+
+
+class SlowQueriesResponse(BaseModel):
+    """Schema for the slow-query log."""
+    
+    enabled: bool = Field(..., description="Whether SLOW_QUERY_MS is above 0")
+    threshold_ms: float
+    explain_rate: float = Field(..., description="Share of slow SELECTs whose plan is captured")
+    queries: List[SlowQueryResponse] = Field(..., description="Most total slow time first")
+
+
+class LayerTimeResponse(BaseModel):
+    """Schema for the sampled time of one code layer."""
+    
+    cpu: float = Field(..., description="Seconds running Python code")
+    await_: float = Field(..., alias="await", description="Seconds suspended on an await")
+
+
+class ProfileSummaryResponse(BaseModel):
+    """Schema for a stored request profile, without its samples."""
+    
+    id: str
+    method: str
+    path: str
+    status: int
+    started_at: datetime
+    wall_seconds: float
+    cpu_seconds: float = Field(..., description="Sampled time running Python code")
+    await_seconds: float = Field(..., description="Sampled time suspended on awaits (database, network)")
+    layers: Dict[str, LayerTimeResponse] = Field(
+        ..., description="Time per sportifyapi subpackage (api, application, infrastructure...), "
+                         "library code counted in the layer that called it"
+    )
+
+
+class ProfilesResponse(BaseModel):
+    """Schema for the stored request profiles."""
+    
+    enabled: bool = Field(..., description="Whether PROFILING_ENABLED is set")
+    profiles: List[ProfileSummaryResponse] = Field(..., description="Newest first")
@@ -1,7 +1,7 @@
 """Country API Schemas."""
 
 from pydantic import BaseModel, Field, validator
-from typing import List
+from typing import List, Literal, Optional
 
 
 class CountryCreateRequest(BaseModel):
@@ -38,6 +38,52 @@ class CountryCreateRequest(BaseModel):
         return v
 
 
+class CountryUpdateRequest(CountryCreateRequest):
+    """Schema for replacing a country."""
+    
+    is_active: bool = Field(
+        default=True,
+        description="Whether country is active"
+    )
+
+
+class CountryPatchRequest(BaseModel):
+    """Schema for partially updating a country."""
+    
+    name: Optional[str] = Field(
+        None,
+        min_length=2,
+        max_length=100,
+        description="New country name (2-100 characters)"
+    )
+    iso_code: Optional[str] = Field(
+        None,
+        min_length=2,
+        max_length=2,
+        description="New ISO-3166-1 alpha-2 country code"
+    )
+    is_active: Optional[bool] = Field(None, description="Whether country is active")
+    
+    @validator('name')
+    def validate_name(cls, v):
+        """Validate country name."""
+        if v is None:
+            return v
+        if not v.strip():
+            raise ValueError("Country name cannot be empty")
+        return v.strip()
+    
+    @validator('iso_code')
+    def validate_iso_code(cls, v):
+        """Validate ISO code format."""
+        if v is None:
+            return v
+        v = v.upper().strip()
+        if not v.isalpha():
+            raise ValueError("ISO code must contain only alphabetic characters")
+        return v
+
+
 class CountryResponse(BaseModel):
     """Schema for country response."""
     
@@ -63,8 +109,18 @@ class CountryListResponse(BaseModel):
     """Schema for country list response."""
     
     countries: List[CountryResponse] = Field(..., description="List of countries")
-    total: int = Field(..., description="Total number of countries")
+    total: int = Field(
+        ...,
+        description=(
+            "Number of countries in this response: the whole (filtered) list, "
+            "or only this page when paginated, not the table size"
+        )
+    )
     message: str = Field(default="Countries retrieved successfully")
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor of the next page (paginated requests only)"
+    )
     
     class Config:
         """Pydantic configuration."""
@@ -113,6 +169,76 @@ class CountryCreateResponse(BaseModel):
         }
 
 
+class CountryUpdateResponse(BaseModel):
+    """Schema for country update response."""
+    
+    id: int = Field(..., description="Country ID")
+    name: str = Field(..., description="Country name")
+    iso_code: str = Field(..., description="ISO country code")
+    is_active: bool = Field(..., description="Whether country is active")
+    message: str = Field(default="Country updated successfully")
+
+
+class CountryDeleteResponse(BaseModel):
+    """Schema for country deletion response."""
+    
+    id: int = Field(..., description="Deleted country ID")
+    message: str = Field(default="Country deleted successfully")
+
+
+class CountryBulkCreateRequest(BaseModel):
+    """Schema for creating or updating many countries at once."""
+    
+    countries: List[CountryCreateRequest] = Field(
+        ...,
+        max_length=1000,
+        description="Countries to write (at most 1000, unique ISO codes)"
+    )
+    on_conflict: Literal["update", "skip"] = Field(
+        default="update",
+        description=(
+            "What to do with countries whose ISO code already exists: rename "
+            "them (update) or leave them untouched (skip); never re-activates them"
+        )
+    )
+    
+    class Config:
+        """Pydantic configuration."""
+        json_schema_extra = {
+            "example": {
+                "countries": [
+                    {"name": "Brazil", "iso_code": "BR"},
+                    {"name": "Argentina", "iso_code": "AR"}
+                ],
+                "on_conflict": "update"
+            }
+        }
+
+
+class CountryBulkResultResponse(BaseModel):
+    """Schema for the outcome of one country in a bulk write."""
+    
+    id: Optional[int] = Field(None, description="Country ID")
+    name: str = Field(..., description="Country name")
+    iso_code: str = Field(..., description="ISO country code")
+    is_active: bool = Field(..., description="Whether country is active")
+    status: Literal["created", "updated", "skipped"] = Field(
+        ..., description="What happened to this country"
+    )
+
+
+class CountryBulkCreateResponse(BaseModel):
+    """Schema for bulk country creation response."""
+    
+    countries: List[CountryBulkResultResponse] = Field(
+        ..., description="Outcome of each country, in request order"
+    )
+    created: int = Field(..., description="Number of countries created")
+    updated: int = Field(..., description="Number of countries updated")
+    skipped: int = Field(..., description="Number of countries left untouched")
+    message: str = Field(default="Countries processed successfully")
+
+
 class ErrorResponse(BaseModel):
     """Schema for error responses."""
     
@@ -0,0 +1,142 @@
+"""Per-request time breakdown, reported in the Server-Timing header."""
+
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, TypeVar
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from ..infrastructure.database.query_counter import QueryCounter
+
+T = TypeVar("T")
+
+# Phases, as named in Server-Timing
+USE_CASE = "use_case"
+CONVERT = "convert"
+SERIALIZE = "serialize"
+
+# DB time spent inside use cases, part of USE_CASE
+USE_CASE_DB = "use_case_db"
+
+
+class RequestTimings:
+    """Seconds spent in each phase of one request."""
+
+    __slots__ = ("phases", "endpoint_returned", "queries")
+
+    def __init__(self, queries: Optional[QueryCounter] = None):
+        self.phases: Dict[str, float] = {}
+        # perf_counter() when the endpoint function returned
+        self.endpoint_returned: Optional[float] = None
+        # Measures the DB share of use cases, when given
+        self.queries = queries
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def get(self, phase: str) -> float:
+        return self.phases.get(phase, 0.0)
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+@contextmanager
+def timing_scope(queries: Optional[QueryCounter] = None) -> Iterator[RequestTimings]:
+    """
+    Collect the phase timings of everything run inside this block,
+    with the DB time of use cases measured by `queries` if given.
+    """
+    timings = RequestTimings(queries)
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Count the time of this block towards a phase of the current request."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter() - started)
+
+
+async def run_use_case(execution: Awaitable[T]) -> T:
+    """
+    Await a use case execution, counting it as use-case time; its DB
+    time is also recorded as USE_CASE_DB, so it can be told apart.
+    """
+    timings = _current.get()
+    if timings is None or timings.queries is None:
+        with timed(USE_CASE):
+            return await execution
+    with timed(USE_CASE), timings.queries.track() as queries:
+        try:
+            return await execution
+        finally:
+            timings.add(USE_CASE_DB, queries.duration)
+
+
+def _timed_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Endpoint counting its own time, minus use cases and explicit
+    serialization, as conversion time (DTOs, response models, headers).
+    """
+    @wraps(endpoint)
+    async def timed_endpoint(*args: Any, **kwargs: Any) -> Any:
+        timings = _current.get()
+        if timings is None:
+            return await endpoint(*args, **kwargs)
+        before = timings.get(USE_CASE) + timings.get(SERIALIZE)
+        started = time.perf_counter()
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            returned = time.perf_counter()
+            timings.endpoint_returned = returned
+            inner = timings.get(USE_CASE) + timings.get(SERIALIZE) - before
+            timings.add(CONVERT, max(returned - started - inner, 0.0))
+
+    timed_endpoint.timed = True
+    return timed_endpoint
+
+
+class TimedRoute(APIRoute):
+    """
+    API route reporting conversion and serialization time.
+
+    Conversion is the endpoint's own work; serialization is what
+    FastAPI does with its return value (response_model validation,
+    JSON encoding) until the response is ready. Plain function
+    endpoints, run in a thread, are not timed.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        # include_router() rebuilds routes from the already wrapped endpoint
+        if inspect.iscoroutinefunction(endpoint) and not hasattr(endpoint, "timed"):
+            endpoint = _timed_endpoint(endpoint)
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            response = await handler(request)
+            timings = _current.get()
+            if timings is not None and timings.endpoint_returned is not None:
+                timings.add(SERIALIZE, time.perf_counter() - timings.endpoint_returned)
+            return response
+
+        return timed_handler
@@ -8,14 +8,14 @@ from ....domain.repositories.country_repository import CountryRepository
 from ....domain.value_objects.iso_code import ISOCode
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateCountryRequest:
     """Request DTO for creating a country."""
     name: str
     iso_code: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateCountryResponse:
     """Response DTO for country creation."""
     id: int
@@ -51,15 +51,12 @@ class CreateCountryUseCase:
             
         Raises:
             ValueError: If business rules are violated
+            CountryAlreadyExistsError: If the ISO code is already taken
         """
         # 1. Create value objects (validates format)
         iso_code = ISOCode.from_string(request.iso_code)
         
-        # 2. Check business rule: ISO code must be unique
-        if await self._country_repository.exists_by_iso_code(iso_code):
-            raise ValueError(f"Country with ISO code '{iso_code}' already exists")
-        
-        # 3. Create domain entity (validates business rules)
+        # 2. Create domain entity (validates business rules)
         country = Country(
             id=None,
             name=request.name,
@@ -67,10 +64,10 @@ class CreateCountryUseCase:
             is_active=True
         )
         
-        # 4. Save through repository
+        # 3. Save through repository (enforces ISO code uniqueness atomically)
         saved_country = await self._country_repository.save(country)
         
-        # 5. Return response DTO
+        # 4. Return response DTO
         return CreateCountryResponse(
             id=saved_country.id,
             name=saved_country.name,
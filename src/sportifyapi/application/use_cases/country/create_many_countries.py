@@ -0,0 +1,126 @@
+"""Create Many Countries Use Case."""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from ....domain.entities.country import Country
+from ....domain.repositories.country_repository import CountryRepository, UpsertStatus
+from ....domain.value_objects.iso_code import ISOCode
+from .create_country import CreateCountryRequest
+
+MAX_BATCH_SIZE = 1000
+
+ON_CONFLICT_UPDATE = "update"
+ON_CONFLICT_SKIP = "skip"
+
+
+@dataclass(slots=True)
+class CreateManyCountriesRequest:
+    """Request DTO for creating many countries at once."""
+    countries: List[CreateCountryRequest]
+    on_conflict: str = ON_CONFLICT_UPDATE
+
+
+@dataclass(slots=True)
+class CountryUpsertResultDTO:
+    """Outcome of one country in a bulk creation."""
+    id: Optional[int]
+    name: str
+    iso_code: str
+    is_active: bool
+    status: str
+
+
+@dataclass(slots=True)
+class CreateManyCountriesResponse:
+    """Response DTO for bulk country creation."""
+    countries: List[CountryUpsertResultDTO] = field(default_factory=list)
+    created: int = 0
+    updated: int = 0
+    skipped: int = 0
+    message: str = "Countries processed successfully"
+
+
+class CreateManyCountriesUseCase:
+    """
+    Use Case: Create or update many countries in one go.
+
+    Business Rules:
+    - Every country in the batch must be valid, otherwise nothing is written
+    - ISO codes must be unique within the batch
+    - Batch size is limited to MAX_BATCH_SIZE
+    - Existing countries (same ISO code) get the new name or are skipped, per
+      on_conflict; their active flag is never changed
+    - New countries are created as active
+    """
+
+    def __init__(self, country_repository: CountryRepository):
+        self._country_repository = country_repository
+
+    async def execute(self, request: CreateManyCountriesRequest) -> CreateManyCountriesResponse:
+        """
+        Execute the create many countries use case.
+
+        Args:
+            request: Countries to write and the conflict policy
+
+        Returns:
+            CreateManyCountriesResponse with the status of each country
+
+        Raises:
+            ValueError: If any country or the batch itself is invalid
+        """
+        # 1. Validate the batch as a whole
+        if request.on_conflict not in (ON_CONFLICT_UPDATE, ON_CONFLICT_SKIP):
+            raise ValueError(
+                f"on_conflict must be '{ON_CONFLICT_UPDATE}' or '{ON_CONFLICT_SKIP}'"
+            )
+
+        if len(request.countries) > MAX_BATCH_SIZE:
+            raise ValueError(f"Cannot create more than {MAX_BATCH_SIZE} countries at once")
+
+        if not request.countries:
+            return CreateManyCountriesResponse()
+
+        # 2. Create domain entities (validates every row before writing any)
+        countries = []
+        seen_iso_codes = set()
+        for index, item in enumerate(request.countries):
+            try:
+                iso_code = ISOCode.from_string(item.iso_code)
+                country = Country(id=None, name=item.name, iso_code=iso_code, is_active=True)
+            except ValueError as e:
+                raise ValueError(f"Country #{index}: {e}")
+
+            if iso_code in seen_iso_codes:
+                raise ValueError(f"Country #{index}: ISO code '{iso_code}' is duplicated in the batch")
+            seen_iso_codes.add(iso_code)
+            countries.append(country)
+
+        # 3. Write the whole batch through the repository
+        outcomes = await self._country_repository.upsert_many(
+            countries,
+            update_existing=request.on_conflict == ON_CONFLICT_UPDATE
+        )
+
+        # 4. Return response DTO
+        response = CreateManyCountriesResponse(
+            countries=[
+                CountryUpsertResultDTO(
+                    id=country.id,
+                    name=country.name,
+                    iso_code=str(country.iso_code),
+                    is_active=country.is_active,
+                    status=status.value
+                )
+                for country, status in outcomes
+            ]
+        )
+        for _, status in outcomes:
+            if status is UpsertStatus.CREATED:
+                response.created += 1
+            elif status is UpsertStatus.UPDATED:
+                response.updated += 1
+            else:
+                response.skipped += 1
+        return response
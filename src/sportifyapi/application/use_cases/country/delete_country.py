@@ -0,0 +1,54 @@
+"""Delete Country Use Case."""
+
+from dataclasses import dataclass
+
+from ....domain.exceptions import CountryNotFoundError
+from ....domain.repositories.country_repository import CountryRepository
+
+
+@dataclass(slots=True)
+class DeleteCountryRequest:
+    """Request DTO for deleting a country."""
+    country_id: int
+
+
+@dataclass(slots=True)
+class DeleteCountryResponse:
+    """Response DTO for country deletion."""
+    id: int
+    message: str = "Country deleted successfully"
+
+
+class DeleteCountryUseCase:
+    """
+    Use Case: Delete a country.
+
+    Business Rules:
+    - Country must exist
+    """
+
+    def __init__(self, country_repository: CountryRepository):
+        self._country_repository = country_repository
+
+    async def execute(self, request: DeleteCountryRequest) -> DeleteCountryResponse:
+        """
+        Execute the delete country use case.
+
+        Args:
+            request: Delete country request data
+
+        Returns:
+            DeleteCountryResponse with the deleted country ID
+
+        Raises:
+            CountryNotFoundError: If country not found
+        """
+        # 1. Delete through repository
+        deleted = await self._country_repository.delete(request.country_id)
+
+        # 2. Check if found
+        if not deleted:
+            raise CountryNotFoundError(f"Country with ID {request.country_id} not found")
+
+        # 3. Return response DTO
+        return DeleteCountryResponse(id=request.country_id)
@@ -7,13 +7,13 @@ from ....domain.entities.country import Country
 from ....domain.repositories.country_repository import CountryRepository
 
 
-@dataclass
+@dataclass(slots=True)
 class GetAllCountriesRequest:
     """Request DTO for getting all countries."""
     active_only: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class CountryDTO:
     """Country data transfer object."""
     id: int
@@ -22,7 +22,7 @@ class CountryDTO:
     is_active: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class GetAllCountriesResponse:
     """Response DTO for getting all countries."""
     countries: List[CountryDTO]
@@ -0,0 +1,106 @@
+"""Get Countries Page Use Case."""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from ....domain.repositories.country_repository import CountryRepository
+from .get_all_countries import CountryDTO
+
+MAX_PAGE_SIZE = 500
+DEFAULT_PAGE_SIZE = 50
+
+
+def parse_cursor(cursor: str) -> Tuple[str, int]:
+    """Split a "<name>,<id>" cursor; names may themselves contain commas."""
+    name, _, raw_id = cursor.rpartition(",")
+    if not name or not raw_id.isdigit():
+        raise ValueError(f"Invalid cursor '{cursor}', expected '<name>,<id>'")
+    return name, int(raw_id)
+
+
+def format_cursor(name: str, country_id: int) -> str:
+    """Build the cursor pointing right after the given country."""
+    return f"{name},{country_id}"
+
+
+@dataclass(slots=True)
+class GetCountriesPageRequest:
+    """Request DTO for getting one page of countries."""
+    active_only: bool = False
+    after: Optional[str] = None
+    limit: int = DEFAULT_PAGE_SIZE
+
+
+@dataclass(slots=True)
+class GetCountriesPageResponse:
+    """Response DTO for getting one page of countries."""
+    countries: List[CountryDTO]
+    total: int  # items in this response (the page, when paginated)
+    next_cursor: Optional[str] = None
+    message: str = "Countries retrieved successfully"
+
+
+class GetCountriesPageUseCase:
+    """
+    Use Case: Get one page of countries.
+
+    Business Rules:
+    - Countries are ordered by name, then ID
+    - Pages are addressed by a "<name>,<id>" cursor of the last country seen
+    - Page size must be between 1 and MAX_PAGE_SIZE
+    - A next cursor is returned only when more countries exist
+    """
+
+    def __init__(self, country_repository: CountryRepository):
+        self._country_repository = country_repository
+
+    async def execute(self, request: GetCountriesPageRequest) -> GetCountriesPageResponse:
+        """
+        Execute the get countries page use case.
+
+        Args:
+            request: Get countries page request data
+
+        Returns:
+            GetCountriesPageResponse with the page and the cursor of the next one
+
+        Raises:
+            ValueError: If the cursor or the page size is invalid
+        """
+        # 1. Validate page size and cursor
+        if not 1 <= request.limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"Page size must be between 1 and {MAX_PAGE_SIZE}")
+
+        after = parse_cursor(request.after) if request.after else None
+
+        # 2. Fetch one extra row to know whether another page exists
+        countries = await self._country_repository.find_page(
+            active_only=request.active_only,
+            after=after,
+            limit=request.limit + 1
+        )
+        has_more = len(countries) > request.limit
+        countries = countries[:request.limit]
+
+        # 3. Convert to DTOs
+        country_dtos = [
+            CountryDTO(
+                id=country.id,
+                name=country.name,
+                iso_code=str(country.iso_code),
+                is_active=country.is_active
+            )
+            for country in countries
+        ]
+
+        # 4. Return response
+        next_cursor = None
+        if has_more:
+            last = country_dtos[-1]
+            next_cursor = format_cursor(last.name, last.id)
+
+        return GetCountriesPageResponse(
+            countries=country_dtos,
+            total=len(country_dtos),
+            next_cursor=next_cursor
+        )
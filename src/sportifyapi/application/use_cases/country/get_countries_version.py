@@ -0,0 +1,50 @@
+"""Get Countries Version Use Case."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from ....domain.repositories.country_repository import CountryRepository
+
+
+@dataclass(slots=True)
+class GetCountriesVersionRequest:
+    """Request DTO for getting the version of the country list."""
+    active_only: bool = False
+
+
+@dataclass(slots=True)
+class GetCountriesVersionResponse:
+    """Response DTO for getting the version of the country list."""
+    last_modified: Optional[datetime]
+    total: int
+
+
+class GetCountriesVersionUseCase:
+    """
+    Use Case: Get the version of the country list.
+
+    Business Rules:
+    - Can filter by active status, like the list itself
+    - The version is the latest modification time plus the number of countries,
+      so deletions change it too
+    - No country is read
+    """
+
+    def __init__(self, country_repository: CountryRepository):
+        self._country_repository = country_repository
+
+    async def execute(self, request: GetCountriesVersionRequest) -> GetCountriesVersionResponse:
+        """
+        Execute the get countries version use case.
+
+        Args:
+            request: Get countries version request data
+
+        Returns:
+            GetCountriesVersionResponse with the list's version stamp
+        """
+        last_modified, total = await self._country_repository.get_list_version(
+            active_only=request.active_only
+        )
+        return GetCountriesVersionResponse(last_modified=last_modified, total=total)
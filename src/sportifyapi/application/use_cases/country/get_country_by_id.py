@@ -1,25 +1,28 @@
 """Get Country by ID Use Case."""
 
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 
 from ....domain.entities.country import Country
+from ....domain.exceptions import CountryNotFoundError
 from ....domain.repositories.country_repository import CountryRepository
 
 
-@dataclass
+@dataclass(slots=True)
 class GetCountryByIdRequest:
     """Request DTO for getting country by ID."""
     country_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class GetCountryByIdResponse:
     """Response DTO for getting country by ID."""
     id: int
     name: str
     iso_code: str
     is_active: bool
+    updated_at: Optional[datetime] = None
     message: str = "Country retrieved successfully"
 
 
@@ -46,19 +49,20 @@ class GetCountryByIdUseCase:
             GetCountryByIdResponse with country data
             
         Raises:
-            ValueError: If country not found
+            CountryNotFoundError: If country not found
         """
         # 1. Find country by ID
         country = await self._country_repository.find_by_id(request.country_id)
         
         # 2. Check if found
         if not country:
-            raise ValueError(f"Country with ID {request.country_id} not found")
+            raise CountryNotFoundError(f"Country with ID {request.country_id} not found")
         
         # 3. Return response DTO
         return GetCountryByIdResponse(
             id=country.id,
             name=country.name,
             iso_code=str(country.iso_code),
-            is_active=country.is_active
+            is_active=country.is_active,
+            updated_at=country.updated_at
         )
@@ -0,0 +1,77 @@
+"""Get Country Rows Use Case."""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from ....domain.repositories.country_repository import CountryRepository, CountryRow
+from .get_countries_page import MAX_PAGE_SIZE, format_cursor, parse_cursor
+
+
+@dataclass(slots=True)
+class GetCountryRowsRequest:
+    """Request DTO for getting countries as plain rows."""
+    active_only: bool = False
+    after: Optional[str] = None
+    limit: Optional[int] = None
+
+
+@dataclass(slots=True)
+class GetCountryRowsResponse:
+    """Response DTO for getting countries as plain rows."""
+    rows: List[CountryRow]
+    total: int  # items in this response (the page, when paginated)
+    next_cursor: Optional[str] = None
+    message: str = "Countries retrieved successfully"
+
+
+class GetCountryRowsUseCase:
+    """
+    Use Case: Get countries as (id, name, iso_code, is_active) rows.
+
+    Read-only fast path for list endpoints: rows go from the repository
+    to the caller untouched, with no entity or DTO per country.
+
+    Business Rules:
+    - Can filter by active status
+    - Countries are ordered by name, then ID
+    - Without a limit, all countries are returned
+    - With a limit, pages follow the rules of GetCountriesPageUseCase
+    """
+
+    def __init__(self, country_repository: CountryRepository):
+        self._country_repository = country_repository
+
+    async def execute(self, request: GetCountryRowsRequest) -> GetCountryRowsResponse:
+        """
+        Execute the get country rows use case.
+
+        Args:
+            request: Get country rows request data
+
+        Returns:
+            GetCountryRowsResponse with the rows and, when paginating, the next cursor
+
+        Raises:
+            ValueError: If the cursor or the page size is invalid
+        """
+        # 1. Validate page size and cursor
+        if request.limit is not None and not 1 <= request.limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"Page size must be between 1 and {MAX_PAGE_SIZE}")
+
+        after = parse_cursor(request.after) if request.after else None
+
+        # 2. Fetch one extra row to know whether another page exists
+        rows = await self._country_repository.find_rows(
+            active_only=request.active_only,
+            after=after,
+            limit=request.limit + 1 if request.limit is not None else None
+        )
+
+        next_cursor = None
+        if request.limit is not None and len(rows) > request.limit:
+            rows = rows[:request.limit]
+            last_id, last_name = rows[-1][0], rows[-1][1]
+            next_cursor = format_cursor(last_name, last_id)
+
+        # 3. Return response DTO
+        return GetCountryRowsResponse(rows=rows, total=len(rows), next_cursor=next_cursor)
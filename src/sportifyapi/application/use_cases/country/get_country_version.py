@@ -0,0 +1,58 @@
+"""Get Country Version Use Case."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from ....domain.exceptions import CountryNotFoundError
+from ....domain.repositories.country_repository import CountryRepository
+
+
+@dataclass(slots=True)
+class GetCountryVersionRequest:
+    """Request DTO for getting the version of one country."""
+    country_id: int
+
+
+@dataclass(slots=True)
+class GetCountryVersionResponse:
+    """Response DTO for getting the version of one country."""
+    id: int
+    last_modified: Optional[datetime]
+
+
+class GetCountryVersionUseCase:
+    """
+    Use Case: Get the version of one country.
+
+    Business Rules:
+    - Country must exist
+    - The version is the country's last modification time
+    - The country itself is not read
+    """
+
+    def __init__(self, country_repository: CountryRepository):
+        self._country_repository = country_repository
+
+    async def execute(self, request: GetCountryVersionRequest) -> GetCountryVersionResponse:
+        """
+        Execute the get country version use case.
+
+        Args:
+            request: Get country version request data
+
+        Returns:
+            GetCountryVersionResponse with the country's modification time
+
+        Raises:
+            CountryNotFoundError: If country not found
+        """
+        # 1. Look up the modification time only
+        last_modified = await self._country_repository.get_version(request.country_id)
+
+        # 2. Check if found
+        if last_modified is None:
+            raise CountryNotFoundError(f"Country with ID {request.country_id} not found")
+
+        # 3. Return response DTO
+        return GetCountryVersionResponse(id=request.country_id, last_modified=last_modified)
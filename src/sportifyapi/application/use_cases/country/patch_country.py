@@ -0,0 +1,72 @@
+"""Patch Country Use Case."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from ....domain.entities.country import Country
+from ....domain.repositories.country_repository import CountryRepository
+from ....domain.value_objects.iso_code import ISOCode
+from .update_country import UpdateCountryResponse
+
+
+@dataclass(slots=True)
+class PatchCountryRequest:
+    """Request DTO for partially updating a country."""
+    country_id: int
+    name: Optional[str] = None
+    iso_code: Optional[str] = None
+    is_active: Optional[bool] = None
+
+
+class PatchCountryUseCase:
+    """
+    Use Case: Update some fields of an existing country.
+
+    Business Rules:
+    - Country must exist
+    - At least one field must be given
+    - Given fields follow the same rules as on creation
+    - ISO code must remain unique
+    """
+
+    def __init__(self, country_repository: CountryRepository):
+        self._country_repository = country_repository
+
+    async def execute(self, request: PatchCountryRequest) -> UpdateCountryResponse:
+        """
+        Execute the patch country use case.
+
+        Args:
+            request: Patch country request data
+
+        Returns:
+            UpdateCountryResponse with updated country data
+
+        Raises:
+            ValueError: If business rules are violated
+            CountryNotFoundError: If country not found
+            CountryAlreadyExistsError: If the ISO code is already taken
+        """
+        # 1. Check that there is something to update
+        if request.name is None and request.iso_code is None and request.is_active is None:
+            raise ValueError("At least one field must be provided")
+
+        # 2. Validate given fields
+        name = Country.normalize_name(request.name) if request.name is not None else None
+        iso_code = ISOCode.from_string(request.iso_code) if request.iso_code is not None else None
+
+        # 3. Update through repository (one round trip, detects missing rows)
+        updated_country = await self._country_repository.patch(
+            request.country_id,
+            name=name,
+            iso_code=iso_code,
+            is_active=request.is_active
+        )
+
+        # 4. Return response DTO
+        return UpdateCountryResponse(
+            id=updated_country.id,
+            name=updated_country.name,
+            iso_code=str(updated_country.iso_code),
+            is_active=updated_country.is_active
+        )
@@ -0,0 +1,46 @@
+"""Stream Countries Use Case."""
+
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+from ....domain.repositories.country_repository import CountryRepository
+from .get_all_countries import CountryDTO
+
+
+@dataclass(slots=True)
+class StreamCountriesRequest:
+    """Request DTO for streaming countries."""
+    active_only: bool = False
+
+
+class StreamCountriesUseCase:
+    """
+    Use Case: Stream all countries.
+
+    Business Rules:
+    - Can filter by active status
+    - Countries are yielded one by one, ordered by name, then ID
+    """
+
+    def __init__(self, country_repository: CountryRepository):
+        self._country_repository = country_repository
+
+    async def execute(self, request: StreamCountriesRequest) -> AsyncIterator[CountryDTO]:
+        """
+        Execute the stream countries use case.
+
+        Args:
+            request: Stream countries request data
+
+        Yields:
+            CountryDTO for each country, as soon as it is read
+        """
+        async for country in self._country_repository.stream_all(
+            active_only=request.active_only
+        ):
+            yield CountryDTO(
+                id=country.id,
+                name=country.name,
+                iso_code=str(country.iso_code),
+                is_active=country.is_active
+            )
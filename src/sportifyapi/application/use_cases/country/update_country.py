@@ -0,0 +1,75 @@
+"""Update Country Use Case."""
+
+from dataclasses import dataclass
+
+from ....domain.entities.country import Country
+from ....domain.repositories.country_repository import CountryRepository
+from ....domain.value_objects.iso_code import ISOCode
+
+
+@dataclass(slots=True)
+class UpdateCountryRequest:
+    """Request DTO for replacing a country."""
+    country_id: int
+    name: str
+    iso_code: str
+    is_active: bool = True
+
+
+@dataclass(slots=True)
+class UpdateCountryResponse:
+    """Response DTO for country update."""
+    id: int
+    name: str
+    iso_code: str
+    is_active: bool
+    message: str = "Country updated successfully"
+
+
+class UpdateCountryUseCase:
+    """
+    Use Case: Replace all fields of an existing country.
+
+    Business Rules:
+    - Country must exist
+    - Country name must be valid (2-100 characters)
+    - ISO code must be valid (2 uppercase letters)
+    - ISO code must remain unique
+    """
+
+    def __init__(self, country_repository: CountryRepository):
+        self._country_repository = country_repository
+
+    async def execute(self, request: UpdateCountryRequest) -> UpdateCountryResponse:
+        """
+        Execute the update country use case.
+
+        Args:
+            request: Update country request data
+
+        Returns:
+            UpdateCountryResponse with updated country data
+
+        Raises:
+            ValueError: If business rules are violated
+            CountryNotFoundError: If country not found
+            CountryAlreadyExistsError: If the ISO code is already taken
+        """
+        # 1. Create domain entity (validates business rules)
+        country = Country(
+            id=request.country_id,
+            name=request.name,
+            iso_code=ISOCode.from_string(request.iso_code),
+            is_active=request.is_active
+        )
+
+        # 2. Update through repository (one round trip, detects missing rows)
+        updated_country = await self._country_repository.update(country)
+
+        # 3. Return response DTO
+        return UpdateCountryResponse(
+            id=updated_country.id,
+            name=updated_country.name,
+            iso_code=str(updated_country.iso_code),
+            is_active=updated_country.is_active
+        )
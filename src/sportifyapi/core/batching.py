@@ -0,0 +1,20 @@
+"""Batch loader configuration."""
+
+from typing import Dict, List
+
+from ..domain.entities.country import Country
+from ..infrastructure.batching.batch_loader import BatchLoader
+from ..infrastructure.database.repositories.country_repository import SQLCountryRepository
+from .database import db_config
+from .settings import settings
+
+
+async def _load_countries(country_ids: List[int]) -> Dict[int, Country]:
+    """Load one batch of countries on its own read session."""
+    async with db_config.read_session_scope() as session:
+        countries = await SQLCountryRepository(session).find_by_ids(country_ids)
+    return {country.id: country for country in countries}
+
+
+# Global country loader, shared by every request of this process
+country_loader = BatchLoader(_load_countries, max_batch_size=settings.batch_max_size)
@@ -0,0 +1,26 @@
+"""Query cache configuration."""
+
+from sqlalchemy.engine import make_url
+
+from ..infrastructure.cache.query_cache import QueryCache
+from ..infrastructure.cache.snapshot_store import SnapshotStore
+from ..infrastructure.cache.table_change_listener import TableChangeListener
+from .database import db_config
+from .settings import settings
+
+
+def _listener_dsn(database_url: str) -> str:
+    """Plain libpq DSN for asyncpg, from the SQLAlchemy URL."""
+    return make_url(database_url).set(drivername="postgresql").render_as_string(
+        hide_password=False
+    )
+
+
+# Global query cache, shared by every request of this process
+query_cache = QueryCache(max_entries=settings.query_cache_max_entries)
+
+# Encoded and compressed bodies of full (unpaginated) list responses
+list_snapshots = SnapshotStore()
+
+# Invalidates query_cache from the notify_table_change() triggers
+table_change_listener = TableChangeListener(_listener_dsn(db_config.database_url), query_cache)
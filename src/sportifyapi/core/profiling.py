@@ -0,0 +1,7 @@
+"""Request profiling configuration."""
+
+from ..infrastructure.profiling.request_profile import ProfileStore
+from .settings import settings
+
+# Profiles of requests sent with X-Profile, newest last
+profile_store = ProfileStore(max_entries=settings.profile_store_size)
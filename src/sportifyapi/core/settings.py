@@ -0,0 +1,94 @@
+"""Application settings read from the environment."""
+
+import os
+from typing import List
+
+
+def env_bool(name: str, default: bool = False) -> bool:
+    """Read a boolean environment variable ("true"/"1"/"yes" are truthy)."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("true", "1", "yes", "on")
+
+
+def env_int(name: str, default: int) -> int:
+    """Read an integer environment variable."""
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def env_float(name: str, default: float) -> float:
+    """Read a float environment variable."""
+    value = os.getenv(name)
+    return float(value) if value not in (None, "") else default
+
+
+def env_list(name: str) -> List[str]:
+    """Read a comma-separated environment variable, skipping empty items."""
+    return [item.strip() for item in os.getenv(name, "").split(",") if item.strip()]
+
+
+class Settings:
+    """Application settings."""
+
+    def __init__(self):
+        # Repository query cache for reference data, invalidated via LISTEN/NOTIFY
+        self.query_cache_enabled = env_bool("QUERY_CACHE_ENABLED", False)
+        self.query_cache_max_entries = env_int("QUERY_CACHE_MAX_ENTRIES", 1024)
+
+        # List endpoints encode repository rows straight to JSON with orjson,
+        # skipping entities, DTOs and response_model validation
+        self.fast_serialization = env_bool("FAST_SERIALIZATION", True)
+
+        # With fast serialization, full lists are encoded and compressed
+        # (gzip, brotli) once per change and served from memory
+        self.list_snapshots_enabled = env_bool("LIST_SNAPSHOTS_ENABLED", True)
+
+        # With read replicas, a client's reads go to the primary for this
+        # long after each of its successful writes (0 disables the cookie)
+        self.read_your_writes_seconds = env_float("READ_YOUR_WRITES_SECONDS", 5.0)
+
+        # Coalesce concurrent find_by_id calls of GET routes into one
+        # WHERE id = ANY(:ids) query per event-loop tick
+        self.batch_loading_enabled = env_bool("BATCH_LOADING_ENABLED", False)
+        self.batch_max_size = env_int("BATCH_MAX_SIZE", 500)
+
+        # Identical concurrent GET requests wait for the first one's
+        # response instead of running, for at most this many seconds
+        self.single_flight_enabled = env_bool("SINGLE_FLIGHT_ENABLED", False)
+        self.single_flight_timeout = env_float("SINGLE_FLIGHT_TIMEOUT", 5.0)
+
+        # Server-Timing header on every response: DB, use case,
+        # conversion and serialization time
+        self.server_timing_enabled = env_bool("SERVER_TIMING_ENABLED", True)
+
+        # Prometheus metrics on /metrics: route latencies and status
+        # counts, query durations and connection pool saturation
+        self.metrics_enabled = env_bool("METRICS_ENABLED", True)
+
+        # Debug mode: every response carries its SQL statement count and
+        # DB time, and statement shapes repeated this many times within
+        # one request are flagged as likely N+1 queries
+        self.debug = env_bool("DEBUG", False)
+        self.n_plus_one_threshold = env_int("N_PLUS_ONE_THRESHOLD", 3)
+
+        # Statements slower than this many milliseconds are logged and
+        # aggregated (0 disables); this share of slow SELECTs is re-run
+        # as EXPLAIN (ANALYZE, BUFFERS) to capture its plan
+        self.slow_query_ms = env_float("SLOW_QUERY_MS", 200.0)
+        self.slow_query_top_n = env_int("SLOW_QUERY_TOP_N", 50)
+        self.slow_query_explain_rate = env_float("SLOW_QUERY_EXPLAIN_RATE", 0.0)
+
+        # Requests with X-Profile and a valid X-Admin-Token run under a
+        # sampling profiler; the latest PROFILE_STORE_SIZE profiles are kept
+        self.profiling_enabled = env_bool("PROFILING_ENABLED", False)
+        self.profiling_interval = env_float("PROFILING_INTERVAL", 0.001)
+        self.profile_store_size = env_int("PROFILE_STORE_SIZE", 20)
+
+        # Token for /admin routes, sent as X-Admin-Token; unset hides them
+        self.admin_token = os.getenv("ADMIN_TOKEN") or None
+
+
+# Global settings instance
+settings = Settings()
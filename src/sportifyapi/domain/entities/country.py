@@ -7,7 +7,7 @@ from typing import Optional
 from ..value_objects.iso_code import ISOCode
 
 
-@dataclass
+@dataclass(slots=True)
 class Country:
     """
     Country Domain Entity.
@@ -29,17 +29,54 @@ class Country:
     
     def _validate_name(self) -> None:
         """Validate country name business rules."""
-        if not self.name or not self.name.strip():
+        # Clean the name
+        self.name = self.normalize_name(self.name)
+    
+    @classmethod
+    def _from_trusted(
+        cls,
+        id: int,
+        name: str,
+        iso_code: ISOCode,
+        is_active: bool = True,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None
+    ) -> "Country":
+        """
+        Rebuild a stored country without validating it again.
+
+        For repositories hydrating rows only: the database enforces the
+        same name and ISO code rules (countries_*_format_chk, created by
+        006_countries_constraints.sql). User input must always use
+        Country(...).
+        """
+        country = object.__new__(cls)
+        country.id = id
+        country.name = name
+        country.iso_code = iso_code
+        country.is_active = is_active
+        country.created_at = created_at
+        country.updated_at = updated_at
+        return country
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """
+        Validate a country name and return it stripped.
+        
+        Lets callers that only change the name (e.g. partial updates)
+        apply the same rules without building a whole entity.
+        """
+        if not name or not name.strip():
             raise ValueError("Country name cannot be empty")
         
-        if len(self.name.strip()) < 2:
+        if len(name.strip()) < 2:
             raise ValueError("Country name must be at least 2 characters")
         
-        if len(self.name.strip()) > 100:
+        if len(name.strip()) > 100:
             raise ValueError("Country name cannot exceed 100 characters")
         
-        # Clean the name
-        self.name = self.name.strip()
+        return name.strip()
     
     def activate(self) -> None:
         """Activate the country."""
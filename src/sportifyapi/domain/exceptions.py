@@ -0,0 +1,9 @@
+"""Domain exceptions - Business rule violations raised by the domain contracts."""
+
+
+class CountryAlreadyExistsError(ValueError):
+    """Raised when a country with the same ISO code already exists."""
+
+
+class CountryNotFoundError(ValueError):
+    """Raised when no country exists with the requested ID."""
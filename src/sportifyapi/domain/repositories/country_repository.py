@@ -1,12 +1,31 @@
 """Country Repository Interface - Domain Contract."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from enum import Enum
+from typing import AsyncIterator, List, NamedTuple, Optional, Tuple
 
 from ..entities.country import Country
 from ..value_objects.iso_code import ISOCode
 
 
+class UpsertStatus(str, Enum):
+    """Outcome of writing one country in a bulk upsert."""
+    
+    CREATED = "created"
+    UPDATED = "updated"
+    SKIPPED = "skipped"
+
+
+class CountryRow(NamedTuple):
+    """Read projection of a country, for read paths that skip entities."""
+    
+    id: int
+    name: str
+    iso_code: str
+    is_active: bool
+
+
 class CountryRepository(ABC):
     """
     Repository interface for Country entity.
@@ -26,6 +45,32 @@ class CountryRepository(ABC):
             
         Returns:
             Country: Saved country with populated ID
+            
+        Raises:
+            CountryAlreadyExistsError: If the ISO code is already taken
+        """
+        pass
+    
+    @abstractmethod
+    async def upsert_many(
+        self,
+        countries: List[Country],
+        update_existing: bool = True
+    ) -> List[Tuple[Country, UpsertStatus]]:
+        """
+        Insert or update many countries at once, matched by ISO code.
+        
+        Args:
+            countries: Country entities to write (ISO codes must be distinct)
+            update_existing: If True, overwrite the name of existing
+                countries (never their active flag); if False, leave them
+                untouched
+            
+        Returns:
+            One (country, status) pair per input, in input order, each
+            carrying its stored state. Skipped ones are existing countries
+            that were not updated or whose name did not change (names
+            compare case-sensitively).
         """
         pass
     
@@ -42,6 +87,19 @@ class CountryRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def find_by_ids(self, country_ids: List[int]) -> List[Country]:
+        """
+        Find many countries by ID at once.
+        
+        Args:
+            country_ids: Country IDs to find
+            
+        Returns:
+            The countries found, in no particular order; missing IDs are left out
+        """
+        pass
+    
     @abstractmethod
     async def find_by_iso_code(self, iso_code: ISOCode) -> Optional[Country]:
         """
@@ -68,6 +126,97 @@ class CountryRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def find_page(
+        self,
+        active_only: bool = False,
+        after: Optional[Tuple[str, int]] = None,
+        limit: int = 50
+    ) -> List[Country]:
+        """
+        Find one page of countries using keyset pagination.
+        
+        Countries are ordered by (name, id), so a page can be resumed
+        from the last country of the previous one without OFFSET.
+        
+        Args:
+            active_only: If True, return only active countries
+            after: (name, id) of the last country already seen, None for the first page
+            limit: Maximum number of countries to return
+            
+        Returns:
+            List of country entities
+        """
+        pass
+    
+    @abstractmethod
+    async def find_rows(
+        self,
+        active_only: bool = False,
+        after: Optional[Tuple[str, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[CountryRow]:
+        """
+        Find countries as plain rows, without building entities.
+        
+        Same ordering and keyset semantics as find_page; for read-only
+        endpoints that only serialize what they read.
+        
+        Args:
+            active_only: If True, return only active countries
+            after: (name, id) of the last country already seen, None to start at the beginning
+            limit: Maximum number of rows to return, None for all
+            
+        Returns:
+            List of rows with CountryRow's fields, in its order
+        """
+        pass
+    
+    @abstractmethod
+    def stream_all(self, active_only: bool = False) -> AsyncIterator[Country]:
+        """
+        Stream all countries as they are read from storage.
+        
+        Unlike find_all, rows are not materialized up front, so memory
+        usage stays flat regardless of table size.
+        
+        Args:
+            active_only: If True, stream only active countries
+            
+        Returns:
+            Async iterator of country entities, ordered by (name, id)
+        """
+        pass
+    
+    @abstractmethod
+    async def get_list_version(self, active_only: bool = False) -> Tuple[Optional[datetime], int]:
+        """
+        Get a cheap version stamp of the country list.
+        
+        Changes whenever any listed country is created, updated or
+        deleted, without reading the countries themselves.
+        
+        Args:
+            active_only: If True, consider only active countries
+            
+        Returns:
+            (latest updated_at, number of countries); updated_at is None when empty
+        """
+        pass
+    
+    @abstractmethod
+    async def get_version(self, country_id: int) -> Optional[datetime]:
+        """
+        Get the last modification time of one country.
+        
+        Args:
+            country_id: Country ID to check
+            
+        Returns:
+            The country's updated_at, None if it does not exist
+        """
+        pass
+    
     @abstractmethod
     async def update(self, country: Country) -> Country:
         """
@@ -78,6 +227,36 @@ class CountryRepository(ABC):
             
         Returns:
             Updated country entity
+            
+        Raises:
+            CountryNotFoundError: If no country has the entity's ID
+            CountryAlreadyExistsError: If the new ISO code is already taken
+        """
+        pass
+    
+    @abstractmethod
+    async def patch(
+        self,
+        country_id: int,
+        name: Optional[str] = None,
+        iso_code: Optional[ISOCode] = None,
+        is_active: Optional[bool] = None
+    ) -> Country:
+        """
+        Update only the given fields of an existing country.
+        
+        Args:
+            country_id: ID of country to update
+            name: New name (already validated), None to keep the current one
+            iso_code: New ISO code, None to keep the current one
+            is_active: New active flag, None to keep the current one
+            
+        Returns:
+            Updated country entity
+            
+        Raises:
+            CountryNotFoundError: If country does not exist
+            CountryAlreadyExistsError: If the new ISO code is already taken
         """
         pass
     
@@ -1,50 +1,90 @@
 """ISO Country Code Value Object."""
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, ClassVar, Dict
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, init=False)
 class ISOCode:
     """
     ISO-3166-1 alpha-2 country code value object.
-    
+
     Examples: BR, US, DE, FR
-    
+
     Business Rules:
     - Must be exactly 2 characters
     - Must be uppercase
     - Must be valid alphabetic characters
+
+    Codes are interned flyweights: there are at most 676 ASCII ones,
+    so each is validated once per process and every ISOCode("BR") (or
+    "br") is the same shared instance.
     """
-    
+
     value: str
-    
-    def __post_init__(self) -> None:
-        """Validate ISO code format."""
-        if not isinstance(self.value, str):
+
+    # Every accepted spelling -> its shared instance; bounded, since only
+    # valid two-letter ASCII inputs are ever stored
+    _interned: ClassVar[Dict[str, "ISOCode"]] = {}
+
+    def __new__(cls, value: str) -> "ISOCode":
+        try:
+            return cls._interned[value]
+        except (KeyError, TypeError):
+            pass
+
+        # Validate ISO code format
+        if not isinstance(value, str):
             raise ValueError("ISO code must be a string")
-        
-        if len(self.value) != 2:
+
+        if len(value) != 2:
             raise ValueError("ISO code must be exactly 2 characters")
-        
-        if not self.value.isalpha():
+
+        if not value.isalpha():
             raise ValueError("ISO code must contain only alphabetic characters")
-        
+
         # Ensure uppercase
-        object.__setattr__(self, 'value', self.value.upper())
-    
+        code = value.upper()
+        instance = cls._interned.get(code)
+        if instance is None:
+            instance = object.__new__(cls)
+            object.__setattr__(instance, "value", code)
+        if value.isascii():
+            cls._interned[code] = instance
+            cls._interned[value] = instance
+        return instance
+
     @classmethod
     def from_string(cls, value: str) -> "ISOCode":
         """Create ISO code from string."""
         return cls(value.upper().strip())
-    
+
+    @classmethod
+    def _from_trusted(cls, value: str) -> "ISOCode":
+        """
+        ISO code read from the database, already valid: not validated
+        again. For repositories only; user input goes through ISOCode(...).
+        """
+        try:
+            return cls._interned[value]
+        except KeyError:
+            instance = object.__new__(cls)
+            object.__setattr__(instance, "value", value)
+            if value.isascii():
+                cls._interned[value] = instance
+            return instance
+
+    def __reduce__(self) -> Any:
+        # Unpickled and copied codes are the interned instance too
+        return (ISOCode, (self.value,))
+
     def __str__(self) -> str:
         return self.value
-    
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, ISOCode):
             return False
         return self.value == other.value
-    
+
     def __hash__(self) -> int:
         return hash(self.value)
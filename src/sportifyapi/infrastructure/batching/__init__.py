@@ -0,0 +1 @@
+"""Batching infrastructure - Coalescing of concurrent lookups."""
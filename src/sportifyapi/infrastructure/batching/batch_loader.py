@@ -0,0 +1,81 @@
+"""DataLoader-style batching of concurrent key lookups."""
+
+import asyncio
+import contextvars
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, TypeVar
+from weakref import WeakKeyDictionary
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Coalesces load(key) calls made in the same event-loop tick.
+
+    The first load() of a tick schedules a dispatch with call_soon; every
+    load() made before it runs joins the same batch, duplicates included,
+    and the whole batch is resolved by one batch_load(keys) call. Batches
+    are kept per event loop, so one loader can serve several loops.
+
+    batch_load returns a dict of the keys it found; keys it left out
+    resolve to None. If it raises, every caller of that batch gets the
+    error.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        max_batch_size: int = 500
+    ):
+        self._batch_load = batch_load
+        self._max_batch_size = max_batch_size
+        self._pending: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[K, asyncio.Future]]" = (
+            WeakKeyDictionary()
+        )
+        self.batches = 0
+        self.keys_loaded = 0
+
+    async def load(self, key: K) -> Optional[V]:
+        """Value for key, loaded together with this tick's other keys."""
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(loop)
+        if pending is None:
+            pending = self._pending[loop] = {}
+            # Dispatch outside the caller's context, so request-scoped
+            # context variables never leak into the shared batch
+            loop.call_soon(self._dispatch, loop, context=contextvars.Context())
+
+        future = pending.get(key)
+        if future is None:
+            future = pending[key] = loop.create_future()
+
+        # Several callers share the future; one being cancelled must not cancel the rest
+        return await asyncio.shield(future)
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Take this tick's keys and load them, max_batch_size at a time."""
+        pending = self._pending.pop(loop, {})
+        keys = list(pending)
+        for start in range(0, len(keys), self._max_batch_size):
+            batch = {key: pending[key] for key in keys[start:start + self._max_batch_size]}
+            loop.create_task(self._run(batch))
+
+    async def _run(self, batch: Dict[K, asyncio.Future]) -> None:
+        self.batches += 1
+        self.keys_loaded += len(batch)
+        try:
+            values = await self._batch_load(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
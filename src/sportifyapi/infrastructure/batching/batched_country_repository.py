@@ -0,0 +1,104 @@
+"""Batching decorator for CountryRepository."""
+
+import copy
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from ...domain.entities.country import Country
+from ...domain.repositories.country_repository import CountryRepository, CountryRow, UpsertStatus
+from ...domain.value_objects.iso_code import ISOCode
+from .batch_loader import BatchLoader
+
+
+class BatchedCountryRepository(CountryRepository):
+    """
+    CountryRepository whose find_by_id goes through a shared BatchLoader.
+
+    Concurrent find_by_id calls, from this and every other request of
+    the process, are answered by one WHERE id = ANY(:ids) query per
+    event-loop tick. Results are memoized for the lifetime of this
+    instance (one request), so repeated lookups of the same ID cost
+    nothing. Everything else goes straight to the wrapped repository;
+    writes clear the memo.
+    """
+
+    def __init__(self, repository: CountryRepository, loader: BatchLoader[int, Country]):
+        self._repository = repository
+        self._loader = loader
+        self._memo: Dict[int, Optional[Country]] = {}
+
+    async def save(self, country: Country) -> Country:
+        self._memo.clear()
+        return await self._repository.save(country)
+
+    async def upsert_many(
+        self,
+        countries: List[Country],
+        update_existing: bool = True
+    ) -> List[Tuple[Country, UpsertStatus]]:
+        self._memo.clear()
+        return await self._repository.upsert_many(countries, update_existing=update_existing)
+
+    async def find_by_id(self, country_id: int) -> Optional[Country]:
+        if country_id not in self._memo:
+            country = await self._loader.load(country_id)
+            # The loaded entity is shared by every caller of the batch
+            self._memo[country_id] = copy.copy(country)
+        return self._memo[country_id]
+
+    async def find_by_ids(self, country_ids: List[int]) -> List[Country]:
+        return await self._repository.find_by_ids(country_ids)
+
+    async def find_by_iso_code(self, iso_code: ISOCode) -> Optional[Country]:
+        return await self._repository.find_by_iso_code(iso_code)
+
+    async def find_all(self, active_only: bool = False) -> List[Country]:
+        return await self._repository.find_all(active_only=active_only)
+
+    async def find_page(
+        self,
+        active_only: bool = False,
+        after: Optional[Tuple[str, int]] = None,
+        limit: int = 50
+    ) -> List[Country]:
+        return await self._repository.find_page(active_only=active_only, after=after, limit=limit)
+
+    async def find_rows(
+        self,
+        active_only: bool = False,
+        after: Optional[Tuple[str, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[CountryRow]:
+        return await self._repository.find_rows(active_only=active_only, after=after, limit=limit)
+
+    def stream_all(self, active_only: bool = False) -> AsyncIterator[Country]:
+        return self._repository.stream_all(active_only=active_only)
+
+    async def get_list_version(self, active_only: bool = False) -> Tuple[Optional[datetime], int]:
+        return await self._repository.get_list_version(active_only=active_only)
+
+    async def get_version(self, country_id: int) -> Optional[datetime]:
+        return await self._repository.get_version(country_id)
+
+    async def update(self, country: Country) -> Country:
+        self._memo.clear()
+        return await self._repository.update(country)
+
+    async def patch(
+        self,
+        country_id: int,
+        name: Optional[str] = None,
+        iso_code: Optional[ISOCode] = None,
+        is_active: Optional[bool] = None
+    ) -> Country:
+        self._memo.clear()
+        return await self._repository.patch(
+            country_id, name=name, iso_code=iso_code, is_active=is_active
+        )
+
+    async def delete(self, country_id: int) -> bool:
+        self._memo.clear()
+        return await self._repository.delete(country_id)
+
+    async def exists_by_iso_code(self, iso_code: ISOCode) -> bool:
+        return await self._repository.exists_by_iso_code(iso_code)
@@ -0,0 +1 @@
+"""Cache infrastructure - In-process query caches and their invalidation."""
@@ -0,0 +1,159 @@
+"""Caching decorator for CountryRepository."""
+
+import copy
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, List, Optional, Tuple
+
+from ...domain.entities.country import Country
+from ...domain.repositories.country_repository import CountryRepository, CountryRow, UpsertStatus
+from ...domain.value_objects.iso_code import ISOCode
+from .query_cache import MISSING, QueryCache
+
+
+class CachedCountryRepository(CountryRepository):
+    """
+    CountryRepository that serves reads from a QueryCache.
+
+    Wraps any CountryRepository. Reads are cached per query and
+    parameters; writes go straight to the wrapped repository and
+    invalidate the countries table. Once this instance has written,
+    it stops using the cache, so rows from a not-yet-committed
+    transaction are never shared with other requests.
+    """
+
+    TABLE = "countries"
+
+    def __init__(self, repository: CountryRepository, cache: QueryCache):
+        self._repository = repository
+        self._cache = cache
+        self._has_written = False
+
+    async def save(self, country: Country) -> Country:
+        return await self._write(lambda: self._repository.save(country))
+
+    async def upsert_many(
+        self,
+        countries: List[Country],
+        update_existing: bool = True
+    ) -> List[Tuple[Country, UpsertStatus]]:
+        return await self._write(
+            lambda: self._repository.upsert_many(countries, update_existing=update_existing)
+        )
+
+    async def find_by_id(self, country_id: int) -> Optional[Country]:
+        return await self._read(
+            ("find_by_id", country_id),
+            lambda: self._repository.find_by_id(country_id)
+        )
+
+    async def find_by_ids(self, country_ids: List[int]) -> List[Country]:
+        return await self._read(
+            ("find_by_ids", tuple(sorted(set(country_ids)))),
+            lambda: self._repository.find_by_ids(country_ids)
+        )
+
+    async def find_by_iso_code(self, iso_code: ISOCode) -> Optional[Country]:
+        return await self._read(
+            ("find_by_iso_code", str(iso_code)),
+            lambda: self._repository.find_by_iso_code(iso_code)
+        )
+
+    async def find_all(self, active_only: bool = False) -> List[Country]:
+        return await self._read(
+            ("find_all", active_only),
+            lambda: self._repository.find_all(active_only=active_only)
+        )
+
+    async def find_page(
+        self,
+        active_only: bool = False,
+        after: Optional[Tuple[str, int]] = None,
+        limit: int = 50
+    ) -> List[Country]:
+        return await self._read(
+            ("find_page", active_only, after, limit),
+            lambda: self._repository.find_page(active_only=active_only, after=after, limit=limit)
+        )
+
+    async def find_rows(
+        self,
+        active_only: bool = False,
+        after: Optional[Tuple[str, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[CountryRow]:
+        return await self._read(
+            ("find_rows", active_only, after, limit),
+            lambda: self._repository.find_rows(active_only=active_only, after=after, limit=limit)
+        )
+
+    def stream_all(self, active_only: bool = False) -> AsyncIterator[Country]:
+        # Streams exist to avoid materializing the table; never cached
+        return self._repository.stream_all(active_only=active_only)
+
+    async def get_list_version(self, active_only: bool = False) -> Tuple[Optional[datetime], int]:
+        return await self._read(
+            ("get_list_version", active_only),
+            lambda: self._repository.get_list_version(active_only=active_only)
+        )
+
+    async def get_version(self, country_id: int) -> Optional[datetime]:
+        return await self._read(
+            ("get_version", country_id),
+            lambda: self._repository.get_version(country_id)
+        )
+
+    async def update(self, country: Country) -> Country:
+        return await self._write(lambda: self._repository.update(country))
+
+    async def patch(
+        self,
+        country_id: int,
+        name: Optional[str] = None,
+        iso_code: Optional[ISOCode] = None,
+        is_active: Optional[bool] = None
+    ) -> Country:
+        return await self._write(
+            lambda: self._repository.patch(
+                country_id, name=name, iso_code=iso_code, is_active=is_active
+            )
+        )
+
+    async def delete(self, country_id: int) -> bool:
+        return await self._write(lambda: self._repository.delete(country_id))
+
+    async def exists_by_iso_code(self, iso_code: ISOCode) -> bool:
+        return await self._read(
+            ("exists_by_iso_code", str(iso_code)),
+            lambda: self._repository.exists_by_iso_code(iso_code)
+        )
+
+    async def _read(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        """Serve key from the cache, or load it and store it under the pre-load version."""
+        if self._has_written:
+            return await load()
+
+        value = self._cache.get(self.TABLE, key)
+        if value is MISSING:
+            version = self._cache.version(self.TABLE)
+            value = await load()
+            self._cache.put(self.TABLE, key, version, value)
+
+        # Entities are mutable; callers get their own copies
+        return self._copy(value)
+
+    async def _write(self, write: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a write and invalidate locally; other processes learn it via NOTIFY."""
+        self._has_written = True
+        try:
+            return await write()
+        finally:
+            self._cache.invalidate(self.TABLE)
+
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        if isinstance(value, list):
+            # Rows are immutable and shared as-is; only entities are copied
+            return [copy.copy(item) if isinstance(item, Country) else item for item in value]
+        if isinstance(value, Country):
+            return copy.copy(value)
+        return value
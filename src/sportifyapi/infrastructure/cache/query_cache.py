@@ -0,0 +1,73 @@
+"""In-process query result cache with per-table version invalidation."""
+
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Hashable, Tuple
+
+# Returned by QueryCache.get on a miss (None is a valid cached result)
+MISSING = object()
+
+
+class QueryCache:
+    """
+    LRU cache of repository query results.
+
+    Entries are keyed by (table, query, params) and tagged with the table
+    version that was current when the query started. Invalidating a table
+    bumps its version, so a result computed concurrently with a change is
+    never served even if it is stored after the invalidation arrived.
+
+    The cache only serves entries while ``active`` is set, i.e. while
+    invalidations are actually being received. Otherwise every lookup is
+    a miss and nothing is stored.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[int, Any]]" = OrderedDict()
+        self._versions: Dict[str, int] = defaultdict(int)
+        self.active = False
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, table: str) -> int:
+        """Current version of a table; read it before running the query."""
+        return self._versions[table]
+
+    def get(self, table: str, key: Hashable) -> Any:
+        """Return the cached result for key, or MISSING."""
+        if not self.active:
+            return MISSING
+
+        entry = self._entries.get((table, key))
+        if entry is None or entry[0] != self._versions[table]:
+            self.misses += 1
+            return MISSING
+
+        self._entries.move_to_end((table, key))
+        self.hits += 1
+        return entry[1]
+
+    def put(self, table: str, key: Hashable, version: int, value: Any) -> None:
+        """Store a result computed while the table was at the given version."""
+        if not self.active or version != self._versions[table]:
+            return
+
+        self._entries[(table, key)] = (version, value)
+        self._entries.move_to_end((table, key))
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, table: str) -> None:
+        """Drop every entry of a table and bump its version."""
+        self._versions[table] += 1
+        for entry_key in [k for k in self._entries if k[0] == table]:
+            del self._entries[entry_key]
+
+    def clear(self) -> None:
+        """Drop every entry and bump every known table version."""
+        for table in list(self._versions):
+            self._versions[table] += 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,73 @@
+"""Pre-encoded, pre-compressed snapshots of list responses."""
+
+import gzip
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional
+
+import brotli
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One response body, encoded once in every content coding we serve."""
+    etag: str
+    identity: bytes
+    gzip: bytes
+    br: bytes
+
+    @classmethod
+    def build(cls, etag: str, body: bytes) -> "Snapshot":
+        """
+        Compress body once for all later requests.
+
+        Brotli quality 9 rather than 11: on JSON lists it compresses as
+        well and runs an order of magnitude faster.
+        """
+        return cls(
+            etag=etag,
+            identity=body,
+            gzip=gzip.compress(body, compresslevel=9, mtime=0),
+            br=brotli.compress(body, mode=brotli.MODE_TEXT, quality=9)
+        )
+
+    def body(self, encoding: Optional[str]) -> bytes:
+        """Body in the given content coding ("br", "gzip" or None)."""
+        if encoding == "br":
+            return self.br
+        if encoding == "gzip":
+            return self.gzip
+        return self.identity
+
+
+class SnapshotStore:
+    """
+    Latest snapshot per key (e.g. table and filters).
+
+    A snapshot is tied to the ETag of the list it was built from. Since
+    the ETag covers the table's version stamp, a changed table never
+    matches the stored snapshot and the next request rebuilds it.
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[Hashable, Snapshot] = {}
+        self.hits = 0
+        self.builds = 0
+
+    def get(self, key: Hashable, etag: str) -> Optional[Snapshot]:
+        """Snapshot for key if it was built for this ETag."""
+        snapshot = self._snapshots.get(key)
+        if snapshot is None or snapshot.etag != etag:
+            return None
+        self.hits += 1
+        return snapshot
+
+    def put(self, key: Hashable, snapshot: Snapshot) -> None:
+        """Replace the snapshot for key."""
+        self._snapshots[key] = snapshot
+        self.builds += 1
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
@@ -0,0 +1,78 @@
+"""LISTEN/NOTIFY bridge that invalidates the query cache on table changes."""
+
+import asyncio
+import logging
+from typing import Optional
+
+import asyncpg
+
+from .query_cache import QueryCache
+
+logger = logging.getLogger(__name__)
+
+
+class TableChangeListener:
+    """
+    Keeps a dedicated connection LISTENing on the table change channel.
+
+    The notify_table_change() trigger (scripts/sql/creation_database)
+    sends the table name on every committed INSERT/UPDATE/DELETE, and each
+    notification invalidates that table in the cache. The cache is only
+    marked active while the connection is up; when it drops, the cache is
+    cleared and bypassed until the listener has reconnected, since
+    notifications sent in between are lost.
+    """
+
+    CHANNEL = "table_changed"
+
+    def __init__(self, dsn: str, cache: QueryCache, reconnect_delay: float = 1.0):
+        self._dsn = dsn
+        self._cache = cache
+        self._reconnect_delay = reconnect_delay
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start listening in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening and disable the cache."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self._dsn)
+                lost = asyncio.Event()
+                connection.add_termination_listener(lambda _: lost.set())
+                await connection.add_listener(self.CHANNEL, self._on_notification)
+
+                # Anything may have changed while we were not listening
+                self._cache.clear()
+                self._cache.active = True
+                logger.info("Query cache listening on '%s'", self.CHANNEL)
+
+                await lost.wait()
+                logger.warning("Query cache listener connection lost")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Query cache listener failed")
+            finally:
+                self._cache.active = False
+                self._cache.clear()
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+
+            await asyncio.sleep(self._reconnect_delay)
+
+    def _on_notification(self, connection, pid: int, channel: str, table: str) -> None:
+        self._cache.invalidate(table)
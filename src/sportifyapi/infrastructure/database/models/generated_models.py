@@ -28,7 +28,10 @@ class Countries(Base):
     __tablename__ = 'countries'
     __table_args__ = (
         PrimaryKeyConstraint('id', name='countries_pkey'),
+        CheckConstraint("char_length(name::text) >= 2 AND char_length(name::text) <= 100 AND name::text !~ '^\\s|\\s$'::text", name='countries_name_format_chk'),
+        CheckConstraint("iso_code ~ '^[A-Z]{2}$'::text", name='countries_iso_code_format_chk'),
         UniqueConstraint('iso_code', name='countries_iso_code_key'),
+        Index('idx_countries_name_id', 'name', 'id'),
         {'comment': 'List of countries (ISO-3166-1 alpha-2).'}
     )
 
@@ -0,0 +1,106 @@
+"""Per-scope SQL statement counting, for N+1 detection."""
+
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# asyncpg ($1), pyformat (%(name)s) and named (:name) placeholders; not ::casts
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|(?<!:):(?!:)[A-Za-z_]\w*")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:::\w+)?(?:\s*,\s*\?(?:::\w+)?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Statement with placeholders and expanded IN lists normalized, so repeats compare equal."""
+    shape = _PLACEHOLDER.sub("?", statement)
+    shape = _PLACEHOLDER_LIST.sub("?, ...", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryLog:
+    """Statements executed while a QueryCounter.track() block was active."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        # Raw statements: compiled SQL strings are cached, so counting them
+        # is cheap; normalizing waits until shapes are asked for
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+        self.statements[statement] += 1
+
+    @property
+    def shapes(self) -> Counter:
+        """Executions per normalized statement shape."""
+        shapes: Counter = Counter()
+        for statement, n in self.statements.items():
+            shapes[statement_shape(statement)] += n
+        return shapes
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Shapes executed at least `threshold` times, most repeated first: likely N+1 loops."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+    def report(self) -> str:
+        """Readable summary, one line per statement shape."""
+        lines = [f"{self.count} statement(s) in {self.duration * 1e3:.1f} ms"]
+        lines.extend(f"  {n:>4} × {shape}" for shape, n in self.shapes.most_common())
+        return "\n".join(lines)
+
+
+class QueryCounter:
+    """
+    Counts statements and DB time of attached engines per tracked scope.
+
+    Scopes are context-local, so concurrent requests each see only
+    their own statements, and they nest: a statement counts in every
+    active scope. Outside any scope the listeners do nothing.
+    """
+
+    def __init__(self):
+        self._active: ContextVar[Tuple[QueryLog, ...]] = ContextVar("query_logs", default=())
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Start counting statements of this engine."""
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._before_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_execute)
+        event.listen(sync_engine, "handle_error", self._on_error)
+
+    @contextmanager
+    def track(self) -> Iterator[QueryLog]:
+        """Count the statements executed inside this block."""
+        log = QueryLog()
+        token = self._active.set(self._active.get() + (log,))
+        try:
+            yield log
+        finally:
+            self._active.reset(token)
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if self._active.get():
+            conn.info.setdefault("query_counter_started", []).append(time.perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        logs = self._active.get()
+        started = conn.info.get("query_counter_started")
+        if not logs or not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        for log in logs:
+            log.record(statement, elapsed)
+
+    def _on_error(self, context) -> None:
+        # A failed statement never reaches after_cursor_execute
+        started = context.connection.info.get("query_counter_started") if context.connection else None
+        if started and context.statement is not None:
+            started.pop()
@@ -0,0 +1,135 @@
+"""Prometheus metrics for SQLAlchemy engines: query durations and pool saturation."""
+
+import re
+import time
+from typing import Callable, Optional
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# First table a statement reads or writes; schema-bounded, so safe as a label
+_TABLE = re.compile(r"\b(?:FROM|INTO|UPDATE|JOIN)\s+\"?(\w+)", re.IGNORECASE)
+
+
+def statement_labels(statement: str) -> tuple:
+    """(operation, table) of a SQL statement, e.g. ("SELECT", "countries")."""
+    stripped = statement.lstrip()
+    operation = stripped.split(None, 1)[0].upper() if stripped else "UNKNOWN"
+    match = _TABLE.search(statement)
+    return operation, match.group(1).lower() if match else ""
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool timing every checkout.
+
+    The time covers waiting for a free connection and, when the pool
+    still has room, opening a new one: what a request actually waits
+    before its first statement.
+    """
+
+    wait_observer: Optional[Callable[[float], None]] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.wait_observer is not None:
+                self.wait_observer(time.perf_counter() - started)
+
+    def recreate(self):
+        # dispose() swaps in a fresh pool; keep timing it
+        pool = super().recreate()
+        pool.wait_observer = self.wait_observer
+        return pool
+
+
+class DatabaseMetrics:
+    """
+    Exports query and pool metrics of attached engines, labelled by engine name.
+
+    - db_query_duration_seconds{engine, operation, table}: cursor execution time
+    - db_query_errors_total{engine, operation, table}
+    - db_pool_checked_out / db_pool_overflow / db_pool_size{engine}: pool state,
+      tracked through checkout and checkin events
+    - db_pool_wait_seconds{engine}: time to get a connection (InstrumentedQueuePool)
+    """
+
+    def __init__(self, registry: CollectorRegistry = REGISTRY):
+        self.query_duration = Histogram(
+            "db_query_duration_seconds", "SQL statement execution time",
+            ["engine", "operation", "table"], buckets=QUERY_BUCKETS, registry=registry
+        )
+        self.query_errors = Counter(
+            "db_query_errors_total", "SQL statements that raised",
+            ["engine", "operation", "table"], registry=registry
+        )
+        self.pool_checked_out = Gauge(
+            "db_pool_checked_out", "Connections currently checked out of the pool",
+            ["engine"], multiprocess_mode="livesum", registry=registry
+        )
+        self.pool_overflow = Gauge(
+            "db_pool_overflow", "Connections open beyond pool_size (negative: pool not full yet)",
+            ["engine"], multiprocess_mode="livesum", registry=registry
+        )
+        self.pool_size = Gauge(
+            "db_pool_size", "Configured pool size",
+            ["engine"], multiprocess_mode="livesum", registry=registry
+        )
+        self.pool_wait = Histogram(
+            "db_pool_wait_seconds", "Time to obtain a pooled connection",
+            ["engine"], buckets=QUERY_BUCKETS, registry=registry
+        )
+
+    def attach(self, engine: AsyncEngine, name: str) -> None:
+        """Start exporting metrics of this engine under the given name."""
+        sync_engine = engine.sync_engine
+        pool = sync_engine.pool
+        duration = self.query_duration
+        errors = self.query_errors
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def before_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def after_execute(conn, cursor, statement, parameters, context, executemany):
+            elapsed = time.perf_counter() - conn.info["query_started"].pop()
+            duration.labels(name, *statement_labels(statement)).observe(elapsed)
+
+        @event.listens_for(sync_engine, "handle_error")
+        def on_error(context):
+            started = context.connection.info.get("query_started") if context.connection else None
+            if started and context.statement is not None:
+                started.pop()
+            errors.labels(name, *statement_labels(context.statement or "")).inc()
+
+        if not hasattr(pool, "checkedout"):
+            return  # NullPool: nothing is kept, nothing to report
+
+        checked_out = self.pool_checked_out.labels(name)
+        overflow = self.pool_overflow.labels(name)
+        size = self.pool_size.labels(name)
+
+        # Set from the process using the pool, never at import time: under
+        # a preloading server that is the master, whose values would be
+        # added to every worker's. The checkin event fires before the pool
+        # takes the connection back, hence counting instead of asking it.
+        def on_checkout(*_) -> None:
+            checked_out.inc()
+            overflow.set(sync_engine.pool.overflow())
+            size.set(sync_engine.pool.size())
+
+        def on_checkin(*_) -> None:
+            checked_out.dec()
+
+        event.listen(sync_engine, "checkout", on_checkout)
+        event.listen(sync_engine, "checkin", on_checkin)
+
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.wait_observer = self.pool_wait.labels(name).observe
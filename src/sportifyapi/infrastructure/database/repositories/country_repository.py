@@ -1,15 +1,66 @@
 """Country Repository Implementation."""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import (
+    CHAR,
+    Boolean,
+    Integer,
+    Row,
+    Select,
+    Text,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    literal_column,
+    select,
+    tuple_,
+    update
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 
 from ....domain.entities.country import Country
-from ....domain.repositories.country_repository import CountryRepository
+from ....domain.exceptions import CountryAlreadyExistsError, CountryNotFoundError
+from ....domain.repositories.country_repository import CountryRepository, CountryRow, UpsertStatus
 from ....domain.value_objects.iso_code import ISOCode
 from ..models.generated_models import Countries as CountryModel
 
+countries_table = CountryModel.__table__
+
+# Read projections: only the columns each read needs, selected with Core so
+# results are plain rows, never ORM instances tracked by the identity map
+LIST_COLUMNS = (
+    countries_table.c.id,
+    countries_table.c.name,
+    countries_table.c.iso_code,
+    countries_table.c.active.label("is_active")
+)
+DETAIL_COLUMNS = LIST_COLUMNS + (countries_table.c.created_at, countries_table.c.updated_at)
+
+# Hot lookups, built once with bound parameters. Executing the same statement
+# object hits SQLAlchemy's compiled cache without rebuilding the construct, and
+# the identical SQL text reuses asyncpg's per-connection prepared statement,
+# so Postgres skips parsing and planning
+FIND_BY_ID = select(*DETAIL_COLUMNS).where(countries_table.c.id == bindparam("country_id"))
+FIND_BY_IDS = select(*DETAIL_COLUMNS).where(
+    countries_table.c.id == any_(bindparam("country_ids", type_=ARRAY(Integer)))
+)
+FIND_BY_ISO_CODE = select(*DETAIL_COLUMNS).where(countries_table.c.iso_code == bindparam("iso_code"))
+FIND_BY_ISO_CODES = select(*DETAIL_COLUMNS).where(
+    countries_table.c.iso_code == any_(bindparam("iso_codes", type_=ARRAY(CHAR(2))))
+)
+EXISTS_BY_ISO_CODE = select(countries_table.c.id).where(
+    countries_table.c.iso_code == bindparam("iso_code")
+)
+GET_VERSION = select(countries_table.c.updated_at).where(
+    countries_table.c.id == bindparam("country_id")
+)
+
 
 class SQLCountryRepository(CountryRepository):
     """
@@ -20,115 +71,307 @@ class SQLCountryRepository(CountryRepository):
     - Database sessions
     - SQL queries
     - Error handling
+    
+    Reads are Core selects of a projection (LIST_COLUMNS / DETAIL_COLUMNS)
+    hydrated straight into entities; writes are single statements that
+    RETURNING the detail projection.
     """
     
+    # Rows fetched per round trip when streaming from a server-side cursor
+    STREAM_BATCH_SIZE = 500
+    
     def __init__(self, session: AsyncSession):
         self._session = session
     
     async def save(self, country: Country) -> Country:
-        """Save a country entity to database."""
-        # Convert domain entity to database model
-        db_country = CountryModel(
-            name=country.name,
-            iso_code=str(country.iso_code),
-            active=country.is_active
+        """
+        Save a country entity to database.
+        
+        Uniqueness is left to the countries_iso_code_key constraint: a single
+        INSERT ... ON CONFLICT DO NOTHING RETURNING either hands back the new
+        row or nothing, so there is no separate existence check to race with.
+        """
+        stmt = (
+            pg_insert(countries_table)
+            .values(
+                name=country.name,
+                iso_code=str(country.iso_code),
+                active=country.is_active
+            )
+            .on_conflict_do_nothing(index_elements=[countries_table.c.iso_code])
+            .returning(*DETAIL_COLUMNS)
         )
         
         try:
-            self._session.add(db_country)
-            await self._session.flush()  # Get the ID without committing
-            
-            # Convert back to domain entity
-            return self._model_to_entity(db_country)
-            
+            result = await self._session.execute(stmt)
         except IntegrityError as e:
             await self._session.rollback()
-            if "unique constraint" in str(e).lower():
-                raise ValueError(f"Country with ISO code '{country.iso_code}' already exists")
             raise ValueError(f"Error saving country: {str(e)}")
+        
+        row = result.first()
+        if row is None:
+            raise CountryAlreadyExistsError(
+                f"Country with ISO code '{country.iso_code}' already exists"
+            )
+        
+        # Convert back to domain entity
+        return self._row_to_entity(row)
+    
+    async def upsert_many(
+        self,
+        countries: List[Country],
+        update_existing: bool = True
+    ) -> List[Tuple[Country, UpsertStatus]]:
+        """Write all countries with one INSERT ... ON CONFLICT ... RETURNING."""
+        if not countries:
+            return []
+        
+        stmt = pg_insert(countries_table).values([
+            {
+                "name": country.name,
+                "iso_code": str(country.iso_code),
+                "active": country.is_active
+            }
+            for country in countries
+        ])
+        
+        if update_existing:
+            # Only the name is overwritten: `active` is managed per country, and
+            # re-loading a list must not re-activate deactivated ones. Only rows
+            # whose name actually changes are touched, so unchanged countries
+            # keep their updated_at and are reported as skipped; names compare
+            # as text, since CITEXT equality would hide case-only renames
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[countries_table.c.iso_code],
+                set_={"name": stmt.excluded.name},
+                where=cast(countries_table.c.name, Text).is_distinct_from(
+                    cast(stmt.excluded.name, Text)
+                )
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[countries_table.c.iso_code])
+        
+        # xmax is 0 only for tuples created by this statement
+        stmt = stmt.returning(
+            *DETAIL_COLUMNS,
+            literal_column("(xmax = 0)", Boolean).label("inserted")
+        )
+        
+        try:
+            result = await self._session.execute(stmt)
+        except IntegrityError as e:
+            await self._session.rollback()
+            raise ValueError(f"Error saving countries: {str(e)}")
+        
+        written = {row.iso_code: row for row in result}
+        
+        # Conflicting rows left alone are not returned; read them to report
+        # their stored state
+        skipped = [str(c.iso_code) for c in countries if str(c.iso_code) not in written]
+        existing = {}
+        if skipped:
+            result = await self._session.execute(FIND_BY_ISO_CODES, {"iso_codes": skipped})
+            existing = {row.iso_code: row for row in result}
+        
+        outcomes = []
+        for country in countries:
+            row = written.get(str(country.iso_code))
+            if row is None:
+                row = existing.get(str(country.iso_code))
+                outcomes.append((country if row is None else self._row_to_entity(row), UpsertStatus.SKIPPED))
+            else:
+                status = UpsertStatus.CREATED if row.inserted else UpsertStatus.UPDATED
+                outcomes.append((self._row_to_entity(row), status))
+        return outcomes
     
     async def find_by_id(self, country_id: int) -> Optional[Country]:
         """Find country by ID."""
-        stmt = select(CountryModel).where(CountryModel.id == country_id)
-        result = await self._session.execute(stmt)
-        db_country = result.scalar_one_or_none()
+        result = await self._session.execute(FIND_BY_ID, {"country_id": country_id})
+        row = result.first()
         
-        if db_country:
-            return self._model_to_entity(db_country)
+        if row:
+            return self._row_to_entity(row)
         return None
     
+    async def find_by_ids(self, country_ids: List[int]) -> List[Country]:
+        """Find many countries with one WHERE id = ANY(:country_ids)."""
+        if not country_ids:
+            return []
+        
+        result = await self._session.execute(FIND_BY_IDS, {"country_ids": list(country_ids)})
+        return [self._row_to_entity(row) for row in result]
+    
     async def find_by_iso_code(self, iso_code: ISOCode) -> Optional[Country]:
         """Find country by ISO code."""
-        stmt = select(CountryModel).where(CountryModel.iso_code == str(iso_code))
-        result = await self._session.execute(stmt)
-        db_country = result.scalar_one_or_none()
+        result = await self._session.execute(FIND_BY_ISO_CODE, {"iso_code": str(iso_code)})
+        row = result.first()
         
-        if db_country:
-            return self._model_to_entity(db_country)
+        if row:
+            return self._row_to_entity(row)
         return None
     
     async def find_all(self, active_only: bool = False) -> List[Country]:
         """Find all countries."""
-        stmt = select(CountryModel)
-        
-        if active_only:
-            stmt = stmt.where(CountryModel.active == True)
+        result = await self._session.execute(self._select_list(active_only))
+        return [self._list_row_to_entity(row) for row in result]
+    
+    async def find_page(
+        self,
+        active_only: bool = False,
+        after: Optional[Tuple[str, int]] = None,
+        limit: int = 50
+    ) -> List[Country]:
+        """Find one page of countries, seeking on the (name, id) index."""
+        stmt = self._select_list(active_only, after).limit(limit)
+        result = await self._session.execute(stmt)
+        return [self._list_row_to_entity(row) for row in result]
+    
+    async def find_rows(
+        self,
+        active_only: bool = False,
+        after: Optional[Tuple[str, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[CountryRow]:
+        """Find countries as the list projection's rows; no entities at all."""
+        stmt = self._select_list(active_only, after)
         
-        stmt = stmt.order_by(CountryModel.name)
+        if limit is not None:
+            stmt = stmt.limit(limit)
         
         result = await self._session.execute(stmt)
-        db_countries = result.scalars().all()
+        return result.all()
+    
+    async def stream_all(self, active_only: bool = False) -> AsyncIterator[Country]:
+        """Stream all countries from a server-side cursor."""
+        stmt = self._select_list(active_only).execution_options(
+            yield_per=self.STREAM_BATCH_SIZE
+        )
         
-        return [self._model_to_entity(db_country) for db_country in db_countries]
+        result = await self._session.stream(stmt)
+        async for row in result:
+            yield self._list_row_to_entity(row)
     
-    async def update(self, country: Country) -> Country:
-        """Update existing country."""
-        stmt = select(CountryModel).where(CountryModel.id == country.id)
+    async def get_list_version(self, active_only: bool = False) -> Tuple[Optional[datetime], int]:
+        """Get max(updated_at) and count(*) of the listed countries."""
+        stmt = select(func.max(countries_table.c.updated_at), func.count())
+        
+        if active_only:
+            stmt = stmt.where(countries_table.c.active == True)
+        
         result = await self._session.execute(stmt)
-        db_country = result.scalar_one_or_none()
+        last_modified, total = result.one()
+        return last_modified, total
+    
+    async def get_version(self, country_id: int) -> Optional[datetime]:
+        """Get updated_at of one country."""
+        result = await self._session.execute(GET_VERSION, {"country_id": country_id})
+        return result.scalar_one_or_none()
+    
+    async def update(self, country: Country) -> Country:
+        """Update existing country with a single UPDATE ... RETURNING."""
+        return await self._update_returning(
+            country.id,
+            {
+                "name": country.name,
+                "iso_code": str(country.iso_code),
+                "active": country.is_active
+            }
+        )
+    
+    async def patch(
+        self,
+        country_id: int,
+        name: Optional[str] = None,
+        iso_code: Optional[ISOCode] = None,
+        is_active: Optional[bool] = None
+    ) -> Country:
+        """Update only the given columns with a single UPDATE ... RETURNING."""
+        values = {}
+        if name is not None:
+            values["name"] = name
+        if iso_code is not None:
+            values["iso_code"] = str(iso_code)
+        if is_active is not None:
+            values["active"] = is_active
         
-        if not db_country:
-            raise ValueError(f"Country with ID {country.id} not found")
+        if not values:
+            country = await self.find_by_id(country_id)
+            if not country:
+                raise CountryNotFoundError(f"Country with ID {country_id} not found")
+            return country
         
-        # Update fields
-        db_country.name = country.name
-        db_country.iso_code = str(country.iso_code)
-        db_country.active = country.is_active
+        return await self._update_returning(country_id, values)
+    
+    async def delete(self, country_id: int) -> bool:
+        """Delete country by ID with a single DELETE ... RETURNING."""
+        stmt = delete(countries_table).where(countries_table.c.id == country_id).returning(countries_table.c.id)
+        result = await self._session.execute(stmt)
+        return result.first() is not None
+    
+    async def _update_returning(self, country_id: int, values: dict) -> Country:
+        """Apply column values to one row; a missing row shows up as no RETURNING row."""
+        stmt = (
+            update(countries_table)
+            .where(countries_table.c.id == country_id)
+            .values(**values)
+            .returning(*DETAIL_COLUMNS)
+        )
         
         try:
-            await self._session.flush()
-            return self._model_to_entity(db_country)
-            
+            result = await self._session.execute(stmt)
         except IntegrityError as e:
             await self._session.rollback()
             if "unique constraint" in str(e).lower():
-                raise ValueError(f"Country with ISO code '{country.iso_code}' already exists")
+                raise CountryAlreadyExistsError(
+                    f"Country with ISO code '{values.get('iso_code')}' already exists"
+                )
             raise ValueError(f"Error updating country: {str(e)}")
-    
-    async def delete(self, country_id: int) -> bool:
-        """Delete country by ID."""
-        stmt = select(CountryModel).where(CountryModel.id == country_id)
-        result = await self._session.execute(stmt)
-        db_country = result.scalar_one_or_none()
         
-        if db_country:
-            await self._session.delete(db_country)
-            return True
-        return False
+        row = result.first()
+        if row is None:
+            raise CountryNotFoundError(f"Country with ID {country_id} not found")
+        
+        return self._row_to_entity(row)
     
     async def exists_by_iso_code(self, iso_code: ISOCode) -> bool:
         """Check if country exists by ISO code."""
-        stmt = select(CountryModel.id).where(CountryModel.iso_code == str(iso_code))
-        result = await self._session.execute(stmt)
+        result = await self._session.execute(EXISTS_BY_ISO_CODE, {"iso_code": str(iso_code)})
         return result.scalar_one_or_none() is not None
     
-    def _model_to_entity(self, db_country: CountryModel) -> Country:
-        """Convert database model to domain entity."""
-        return Country(
-            id=db_country.id,
-            name=db_country.name,
-            iso_code=ISOCode(db_country.iso_code),
-            is_active=db_country.active,
-            created_at=db_country.created_at,
-            updated_at=db_country.updated_at
+    def _select_list(
+        self,
+        active_only: bool = False,
+        after: Optional[Tuple[str, int]] = None
+    ) -> Select:
+        """SELECT of the list projection, ordered by (name, id), optionally after a key."""
+        stmt = select(*LIST_COLUMNS)
+        
+        if active_only:
+            stmt = stmt.where(countries_table.c.active == True)
+        
+        if after is not None:
+            # Binding a plain tuple lets the bind params take the column types
+            # (CITEXT, INTEGER), so the row comparison matches the index ordering
+            stmt = stmt.where(tuple_(countries_table.c.name, countries_table.c.id) > tuple(after))
+        
+        return stmt.order_by(countries_table.c.name, countries_table.c.id)
+    
+    def _row_to_entity(self, row: Row) -> Country:
+        """Convert a DETAIL_COLUMNS row to domain entity."""
+        return Country._from_trusted(
+            id=row.id,
+            name=row.name,
+            iso_code=ISOCode._from_trusted(row.iso_code),
+            is_active=row.is_active,
+            created_at=row.created_at,
+            updated_at=row.updated_at
+        )
+    
+    def _list_row_to_entity(self, row: Row) -> Country:
+        """Convert a LIST_COLUMNS row to domain entity, without timestamps."""
+        return Country._from_trusted(
+            id=row.id,
+            name=row.name,
+            iso_code=ISOCode._from_trusted(row.iso_code),
+            is_active=row.is_active
         )
@@ -0,0 +1,213 @@
+"""Threshold-based slow-query recording with sampled EXPLAIN ANALYZE plans."""
+
+import asyncio
+import contextvars
+import hashlib
+import json
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .query_counter import statement_shape
+
+logger = logging.getLogger(__name__)
+
+# Set inside plan captures, whose EXPLAIN ANALYZE is slow by design
+_capturing: ContextVar[bool] = ContextVar("slow_query_capturing", default=False)
+
+
+def fingerprint(shape: str) -> str:
+    """Short stable ID of a normalized statement."""
+    return hashlib.blake2b(shape.encode(), digest_size=8).hexdigest()
+
+
+def redact(parameters: Any) -> Any:
+    """
+    Parameters with their values hidden.
+
+    Numbers, booleans and None are kept, as they decide plans (ID
+    ranges, limits, flags) and carry no personal data; text and bytes
+    become their type and length, anything else (dates...) its type.
+    """
+    if isinstance(parameters, dict):
+        return {key: redact(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact(value) for value in parameters]
+    if parameters is None or isinstance(parameters, (bool, int, float)):
+        return parameters
+    if isinstance(parameters, (str, bytes)):
+        return f"<{type(parameters).__name__}:{len(parameters)}>"
+    return f"<{type(parameters).__name__}>"
+
+
+@dataclass
+class SlowQuery:
+    """Aggregate of the slow executions of one statement shape."""
+    fingerprint: str
+    statement: str
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_seconds: float = 0.0
+    last_parameters: Any = None
+    last_origin: Optional[str] = None
+    last_seen: Optional[datetime] = None
+    plan: Optional[Any] = None
+    plan_captured_at: Optional[datetime] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class SlowQueryLog:
+    """
+    Records statements of attached engines that ran longer than a threshold.
+
+    Each slow execution is logged and folded into a per-fingerprint
+    aggregate; only the `max_entries` fingerprints with the most total
+    slow time are kept. The origin of a statement (typically the route)
+    comes from the innermost origin() block around it.
+
+    A `plan_sample_rate` share of slow SELECTs is re-run in the
+    background as EXPLAIN (ANALYZE, BUFFERS) on a fresh connection, in
+    a READ ONLY transaction bounded by `plan_timeout_seconds`; the JSON
+    plan replaces the fingerprint's previous one. Writes are never
+    re-run. Parameters are only stored redacted.
+    """
+
+    def __init__(
+        self,
+        threshold_seconds: float,
+        max_entries: int = 50,
+        plan_sample_rate: float = 0.0,
+        plan_timeout_seconds: float = 10.0
+    ):
+        self.threshold_seconds = threshold_seconds
+        self.max_entries = max_entries
+        self.plan_sample_rate = plan_sample_rate
+        self.plan_timeout_seconds = plan_timeout_seconds
+        self._entries: Dict[str, SlowQuery] = {}
+        self._capturing_plans: Set[str] = set()
+        self._origin: ContextVar[Optional[Callable[[], str]]] = ContextVar("slow_query_origin", default=None)
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Start recording slow statements of this engine."""
+        sync_engine = engine.sync_engine
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def before_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def after_execute(conn, cursor, statement, parameters, context, executemany):
+            elapsed = time.perf_counter() - conn.info["slow_query_started"].pop()
+            if elapsed >= self.threshold_seconds and not _capturing.get():
+                self.record(statement, parameters, elapsed, engine)
+
+        @event.listens_for(sync_engine, "handle_error")
+        def on_error(context):
+            started = context.connection.info.get("slow_query_started") if context.connection else None
+            if started and context.statement is not None:
+                started.pop()
+
+    @contextmanager
+    def origin(self, describe: Callable[[], str]) -> Iterator[None]:
+        """Attribute statements inside this block to describe(), evaluated when one is slow."""
+        token = self._origin.set(describe)
+        try:
+            yield
+        finally:
+            self._origin.reset(token)
+
+    def record(
+        self,
+        statement: str,
+        parameters: Any,
+        elapsed: float,
+        engine: Optional[AsyncEngine] = None
+    ) -> SlowQuery:
+        """Fold one slow execution into its fingerprint's aggregate."""
+        shape = statement_shape(statement)
+        key = fingerprint(shape)
+        describe = self._origin.get()
+        origin = describe() if describe is not None else None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = SlowQuery(fingerprint=key, statement=shape)
+        entry.calls += 1
+        entry.total_seconds += elapsed
+        entry.max_seconds = max(entry.max_seconds, elapsed)
+        entry.last_seconds = elapsed
+        entry.last_parameters = redact(parameters)
+        entry.last_origin = origin
+        entry.last_seen = datetime.now(timezone.utc)
+        self._evict()
+
+        logger.warning(
+            "Slow query %s (%.1f ms) from %s: %s",
+            key, elapsed * 1e3, origin or "unknown origin", shape
+        )
+
+        if engine is not None and self._should_capture_plan(key, statement):
+            self._capturing_plans.add(key)
+            # Own context: the capture must not count in the request's metrics
+            asyncio.get_running_loop().create_task(
+                self._capture_plan(engine, key, statement, parameters),
+                context=contextvars.Context()
+            )
+        return entry
+
+    def top(self) -> List[SlowQuery]:
+        """Recorded fingerprints, most total slow time first."""
+        return sorted(self._entries.values(), key=lambda e: e.total_seconds, reverse=True)
+
+    def reset(self) -> None:
+        """Forget every recorded fingerprint."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            smallest = min(self._entries.values(), key=lambda e: e.total_seconds)
+            del self._entries[smallest.fingerprint]
+
+    def _should_capture_plan(self, key: str, statement: str) -> bool:
+        return (
+            self.plan_sample_rate > 0
+            and key not in self._capturing_plans
+            and statement.lstrip()[:6].upper() == "SELECT"
+            and random.random() < self.plan_sample_rate
+        )
+
+    async def _capture_plan(self, engine: AsyncEngine, key: str, statement: str, parameters: Any) -> None:
+        _capturing.set(True)
+        try:
+            read_only = engine.execution_options(postgresql_readonly=True)
+            async with read_only.connect() as connection:
+                await connection.execute(
+                    text(f"SET LOCAL statement_timeout = {int(self.plan_timeout_seconds * 1000)}")
+                )
+                result = await connection.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters
+                )
+                plan = result.scalar()
+                await connection.rollback()
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.plan = json.loads(plan) if isinstance(plan, str) else plan
+                entry.plan_captured_at = datetime.now(timezone.utc)
+        except Exception:
+            logger.exception("Could not capture the plan of slow query %s", key)
+        finally:
+            self._capturing_plans.discard(key)
@@ -0,0 +1,76 @@
+"""Statement cache statistics for SQLAlchemy engines."""
+
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import default
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_MISSING = object()
+
+
+class StatementCacheStats:
+    """
+    Counts how statements executed on attached engines were compiled.
+
+    Every execution is classified from its execution context: served
+    from SQLAlchemy's compiled cache (hit), compiled and stored (miss),
+    or compiled without caching (uncached: caching disabled for the
+    statement, or a construct without a cache key).
+    """
+
+    def __init__(self):
+        self._engines = []
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    def attach(self, engine: AsyncEngine) -> None:
+        """Start counting executions on this engine."""
+        self._engines.append(engine)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._on_execute)
+
+    def reset(self) -> None:
+        """Zero the counters."""
+        self.hits = self.misses = self.uncached = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current counters plus compiled cache occupancy of every engine."""
+        executions = self.hits + self.misses + self.uncached
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncached": self.uncached,
+            "hit_ratio": self.hits / executions if executions else None,
+            "compiled_cache_entries": self._compiled_cache_entries(),
+        }
+
+    def _compiled_cache_entries(self) -> Optional[int]:
+        """
+        Statements in the compiled caches of all engines, None if unavailable.
+
+        SQLAlchemy has no public accessor for the cache, so its private
+        `_compiled_cache` is read defensively: it may change in any
+        release. An engine whose cache is None has caching disabled
+        (query_cache_size=0) and counts as empty.
+        """
+        total = 0
+        for engine in self._engines:
+            cache = getattr(engine.sync_engine, "_compiled_cache", _MISSING)
+            if cache is None:
+                continue
+            if cache is _MISSING or not hasattr(cache, "__len__"):
+                return None
+            total += len(cache)
+        return total
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if context is None:
+            return
+        cache_hit = getattr(context, "cache_hit", None)
+        if cache_hit is default.CACHE_HIT:
+            self.hits += 1
+        elif cache_hit is default.CACHE_MISS:
+            self.misses += 1
+        else:
+            self.uncached += 1
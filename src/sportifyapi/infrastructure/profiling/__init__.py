@@ -0,0 +1 @@
+"""Profiling infrastructure - On-demand request profiles and their storage."""
@@ -0,0 +1,121 @@
+"""Sampled profiles of single requests, with an await vs CPU breakdown per layer."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import PurePath
+from typing import Dict, List, Optional
+
+from pyinstrument.frame import AWAIT_FRAME_IDENTIFIER, OUT_OF_CONTEXT_FRAME_IDENTIFIER, Frame
+from pyinstrument.renderers import SpeedscopeRenderer
+from pyinstrument.session import Session
+
+PACKAGE = "sportifyapi"
+
+# Time of leaves outside any frame of this package
+FRAMEWORK_LAYER = "framework"
+
+# Samples of a task suspended on an await, rather than running Python code
+_WAITING = {AWAIT_FRAME_IDENTIFIER, OUT_OF_CONTEXT_FRAME_IDENTIFIER}
+
+
+@dataclass(frozen=True)
+class RequestProfile:
+    """Profile of one request: totals, per-layer breakdown and a speedscope document."""
+    id: str
+    method: str
+    path: str
+    status: int
+    started_at: datetime
+    wall_seconds: float
+    cpu_seconds: float
+    await_seconds: float
+    # Layer (api, application, domain, infrastructure, core...) -> {"cpu": s, "await": s}
+    layers: Dict[str, Dict[str, float]]
+    speedscope: str
+
+    @classmethod
+    def from_session(
+        cls,
+        id: str,
+        method: str,
+        path: str,
+        status: int,
+        started_at: datetime,
+        session: Session
+    ) -> "RequestProfile":
+        layers = layer_breakdown(session.root_frame())
+        return cls(
+            id=id,
+            method=method,
+            path=path,
+            status=status,
+            started_at=started_at,
+            wall_seconds=session.duration,
+            cpu_seconds=sum(times["cpu"] for times in layers.values()),
+            await_seconds=sum(times["await"] for times in layers.values()),
+            layers=layers,
+            speedscope=SpeedscopeRenderer().render(session)
+        )
+
+
+def layer_of(frame: Frame) -> Optional[str]:
+    """Subpackage of sportifyapi the frame's code lives in, None for other code."""
+    if not frame.file_path:
+        return None
+    parts = PurePath(frame.file_path).parts
+    if PACKAGE not in parts:
+        return None
+    # Innermost "sportifyapi" directory: the package, not a checkout named after it
+    rest = parts[len(parts) - parts[::-1].index(PACKAGE):]
+    if len(rest) > 1:
+        return rest[0]
+    return PurePath(rest[0]).stem if rest else None
+
+
+def layer_breakdown(root: Optional[Frame]) -> Dict[str, Dict[str, float]]:
+    """
+    Sampled time of every leaf, split into CPU and await time.
+
+    A leaf counts for the innermost frame of this package above it, so
+    time spent in SQLAlchemy or asyncpg lands in the infrastructure
+    layer that called them; the controller -> use case -> repository
+    split shows as api / application / infrastructure.
+    """
+    layers: Dict[str, Dict[str, float]] = {}
+    if root is None:
+        return layers
+
+    stack: List[tuple] = [(root, FRAMEWORK_LAYER)]
+    while stack:
+        frame, layer = stack.pop()
+        layer = layer_of(frame) or layer
+        if not frame.children:
+            kind = "await" if frame.identifier in _WAITING else "cpu"
+            times = layers.setdefault(layer, {"cpu": 0.0, "await": 0.0})
+            times[kind] += frame.time
+        stack.extend((child, layer) for child in frame.children)
+    return layers
+
+
+class ProfileStore:
+    """The latest `max_entries` request profiles of this process."""
+
+    def __init__(self, max_entries: int = 20):
+        self.max_entries = max_entries
+        self._profiles: "OrderedDict[str, RequestProfile]" = OrderedDict()
+
+    def put(self, profile: RequestProfile) -> None:
+        self._profiles[profile.id] = profile
+        while len(self._profiles) > self.max_entries:
+            self._profiles.popitem(last=False)
+
+    def get(self, id: str) -> Optional[RequestProfile]:
+        return self._profiles.get(id)
+
+    def latest(self) -> List[RequestProfile]:
+        """Stored profiles, newest first."""
+        return list(reversed(self._profiles.values()))
+
+    def __len__(self) -> int:
+        return len(self._profiles)
@@ -1,9 +1,36 @@
 """Sportify API - Main application entry point."""
 
-from fastapi import FastAPI
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest
+from prometheus_client.multiprocess import MultiProcessCollector
 
+from .api.controllers.admin import router as admin_router
 from .api.controllers.country import router as country_router
+from .api.middleware.metrics import MetricsMiddleware
+from .api.middleware.profiling import ProfilingMiddleware
+from .api.middleware.query_count import QueryCountMiddleware
+from .api.middleware.read_your_writes import ReadYourWritesMiddleware
+from .api.middleware.server_timing import ServerTimingMiddleware
+from .api.middleware.single_flight import SingleFlightMiddleware
+from .api.middleware.slow_queries import SlowQueryOriginMiddleware
+from .core.cache import table_change_listener
+from .core.database import db_config, query_counter, slow_query_log
+from .core.profiling import profile_store
+from .core.settings import settings
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop background services."""
+    if settings.query_cache_enabled:
+        table_change_listener.start()
+    yield
+    await table_change_listener.stop()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -11,7 +38,8 @@ app = FastAPI(
     description="A sports management API built with Clean Architecture + DDD + SOLID",
     version="0.1.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -23,8 +51,52 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Keep clients that just wrote off lagging replicas
+if db_config.replicas.engines:
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        window_seconds=settings.read_your_writes_seconds
+    )
+
+# Collapse bursts of identical GET requests into one execution
+if settings.single_flight_enabled:
+    app.add_middleware(
+        SingleFlightMiddleware,
+        timeout_seconds=settings.single_flight_timeout
+    )
+
+# Time per layer in a Server-Timing header
+if settings.server_timing_enabled:
+    app.add_middleware(ServerTimingMiddleware, counter=query_counter)
+
+# Slow statements are reported with the route that ran them
+if settings.slow_query_ms > 0:
+    app.add_middleware(SlowQueryOriginMiddleware, slow_query_log=slow_query_log)
+
+# Statement counts and N+1 warnings per request
+if settings.debug:
+    app.add_middleware(
+        QueryCountMiddleware,
+        counter=query_counter,
+        repeat_threshold=settings.n_plus_one_threshold
+    )
+
+# Profile requests sent with X-Profile (and the admin token)
+if settings.profiling_enabled:
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=profile_store,
+        admin_token=settings.admin_token,
+        interval_seconds=settings.profiling_interval
+    )
+
+# Outermost, so latencies include every other middleware
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(country_router, prefix="/api/v1")
+app.include_router(admin_router, prefix="/api/v1")
 
 
 @app.get("/")
@@ -43,3 +115,13 @@ async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "message": "Sportify API is running"}
 
+
+if settings.metrics_enabled:
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        """Prometheus metrics, aggregated over all workers when PROMETHEUS_MULTIPROC_DIR is set."""
+        registry = REGISTRY
+        if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+            registry = CollectorRegistry()
+            MultiProcessCollector(registry)
+        return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,149 @@
+"""Production server - Gunicorn master with Uvicorn workers."""
+
+import argparse
+import os
+from typing import Any, Dict, List, Optional
+
+from gunicorn.app.base import BaseApplication
+from uvicorn_worker import UvicornWorker
+
+from .core.settings import env_bool, env_int
+
+APP_PATH = "sportifyapi.main:app"
+
+
+class ProductionUvicornWorker(UvicornWorker):
+    """Uvicorn worker pinned to uvloop and httptools instead of auto-detection."""
+
+    CONFIG_KWARGS = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "lifespan": "on",
+    }
+
+
+def default_workers() -> int:
+    """One worker per CPU this process may run on (cgroup/affinity aware)."""
+    try:
+        return max(len(os.sched_getaffinity(0)), 1)
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """
+    Drop database connections inherited from the master.
+
+    The app is imported before fork, so each worker starts with a copy
+    of the master's engines. close=False leaves the parent's sockets
+    alone and just gives this worker fresh, empty pools.
+    """
+    from .core.database import db_config
+
+    for engine in [db_config.engine, *db_config.replicas.engines]:
+        engine.sync_engine.dispose(close=False)
+
+
+def child_exit(server: Any, worker: Any) -> None:
+    """Drop the live gauges of a dead worker from the aggregated /metrics."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
+
+
+class SportifyApplication(BaseApplication):
+    """
+    Gunicorn application serving sportifyapi.main:app.
+
+    The app is imported and its ORM mappers configured in the master
+    (preload), so workers are forked with that work done and share the
+    memory pages holding it.
+    """
+
+    def __init__(self, options: Dict[str, Any]):
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> Any:
+        from sqlalchemy.orm import configure_mappers
+
+        from .main import app
+
+        configure_mappers()
+        return app
+
+
+def build_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """Gunicorn settings for the parsed command line."""
+    return {
+        "bind": f"{args.host}:{args.port}",
+        "workers": args.workers,
+        "worker_class": f"{__name__}.ProductionUvicornWorker",
+        "preload_app": True,
+        "post_fork": post_fork,
+        "child_exit": child_exit,
+        "keepalive": args.keepalive,
+        "backlog": args.backlog,
+        "timeout": args.timeout,
+        "graceful_timeout": args.graceful_timeout,
+        "max_requests": args.max_requests,
+        "max_requests_jitter": args.max_requests // 10,
+        "forwarded_allow_ips": args.forwarded_allow_ips,
+        "accesslog": "-" if args.access_log else None,
+        "errorlog": "-",
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Command line, defaulting to environment variables."""
+    parser = argparse.ArgumentParser(prog="sportifyapi", description="Sportify API server")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help=f"Serve {APP_PATH} with Gunicorn + Uvicorn workers")
+    serve.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    serve.add_argument("--port", type=int, default=env_int("PORT", 8000))
+    serve.add_argument(
+        "--workers", type=int, default=env_int("WEB_CONCURRENCY", default_workers()),
+        help="worker processes (WEB_CONCURRENCY, default: one per CPU)"
+    )
+    serve.add_argument(
+        "--keepalive", type=int, default=env_int("KEEPALIVE", 5),
+        help="seconds an idle keep-alive connection stays open (KEEPALIVE)"
+    )
+    serve.add_argument(
+        "--backlog", type=int, default=env_int("BACKLOG", 2048),
+        help="pending connections queued by the listening socket (BACKLOG)"
+    )
+    serve.add_argument(
+        "--timeout", type=int, default=env_int("WORKER_TIMEOUT", 30),
+        help="seconds before a silent worker is restarted (WORKER_TIMEOUT)"
+    )
+    serve.add_argument(
+        "--graceful-timeout", type=int, default=env_int("GRACEFUL_TIMEOUT", 30),
+        help="seconds workers get to finish requests on shutdown (GRACEFUL_TIMEOUT)"
+    )
+    serve.add_argument(
+        "--max-requests", type=int, default=env_int("MAX_REQUESTS", 0),
+        help="restart a worker after this many requests, 0 to never (MAX_REQUESTS)"
+    )
+    serve.add_argument(
+        "--forwarded-allow-ips", default=os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1"),
+        help="proxies trusted for X-Forwarded-* headers (FORWARDED_ALLOW_IPS)"
+    )
+    serve.add_argument(
+        "--access-log", action="store_true", default=env_bool("ACCESS_LOG", False),
+        help="log every request (ACCESS_LOG)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point of the `sportifyapi` command."""
+    args = parse_args(argv)
+    if args.command == "serve":
+        SportifyApplication(build_options(args)).run()
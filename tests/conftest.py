@@ -0,0 +1,24 @@
+from contextlib import contextmanager
+
+import pytest
+from sportifyapi.core.database import query_counter
+
+
+@pytest.fixture
+def max_queries():
+    """
+    Fail when a block executes more SQL statements than allowed.
+
+        with max_queries(2):
+            response = await client.get("/api/v1/countries/1")
+
+    The failure lists every statement shape with its count, so an N+1
+    loop shows up as one shape repeated per row.
+    """
+    @contextmanager
+    def check(limit: int):
+        with query_counter.track() as log:
+            yield log
+        assert log.count <= limit, f"Expected at most {limit} statement(s), got {log.report()}"
+
+    return check
@@ -0,0 +1,46 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import CollectorRegistry
+from sportifyapi.api.middleware.metrics import UNMATCHED_ROUTE, MetricsMiddleware
+
+
+def _app(registry):
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, registry=registry)
+
+    @app.get("/countries/{country_id}")
+    async def get_country(country_id: int):
+        if country_id == 0:
+            raise HTTPException(status_code=404)
+        return {"id": country_id}
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_metrics_middleware_should_label_requests_by_route_template():
+    # Arrange
+    registry = CollectorRegistry()
+    transport = ASGITransport(app=_app(registry))
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/countries/1")
+        await client.get("/countries/2")
+        await client.get("/countries/0")
+        await client.get("/nowhere")
+
+    # Assert
+    def requests(route, status):
+        return registry.get_sample_value(
+            "http_requests_total", {"method": "GET", "route": route, "status": status}
+        )
+
+    assert requests("/countries/{country_id}", "200") == 2
+    assert requests("/countries/{country_id}", "404") == 1
+    assert requests(UNMATCHED_ROUTE, "404") == 1
+    assert registry.get_sample_value(
+        "http_request_duration_seconds_count",
+        {"method": "GET", "route": "/countries/{country_id}", "status": "200"}
+    ) == 2
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+from sportifyapi.api.middleware.profiling import ProfilingMiddleware
+from sportifyapi.infrastructure.profiling.request_profile import ProfileStore
+
+
+async def _app(scope, receive, send):
+    await asyncio.sleep(0.01)
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def _get(app, headers=()):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/countries/", "headers": list(headers)}
+    await app(scope, receive, send)
+    return messages[0]["status"], dict(messages[0]["headers"]), messages[1]["body"]
+
+
+@pytest.mark.asyncio
+async def test_profiling_middleware_should_store_profile_of_authorized_request():
+    # Arrange
+    store = ProfileStore()
+    middleware = ProfilingMiddleware(_app, store=store, admin_token="secret")
+
+    # Act
+    status, headers, body = await _get(middleware, [(b"x-profile", b"1"), (b"x-admin-token", b"secret")])
+
+    # Assert
+    assert (status, body) == (200, b"ok")
+    profile = store.get(headers[b"x-profile-id"].decode())
+    assert profile.path == "/countries/"
+    assert profile.wall_seconds >= 0.01
+    assert b"await=" in headers[b"x-profile-summary"]
+
+
+@pytest.mark.asyncio
+async def test_profiling_middleware_should_reject_profiles_without_admin_token():
+    # Arrange
+    store = ProfileStore()
+    middleware = ProfilingMiddleware(_app, store=store, admin_token="secret")
+
+    # Act
+    status, _, _ = await _get(middleware, [(b"x-profile", b"1"), (b"x-admin-token", b"wrong")])
+    plain = await _get(middleware)
+
+    # Assert
+    assert status == 403
+    assert plain[0] == 200 and b"x-profile-id" not in plain[1]
+    assert len(store) == 0
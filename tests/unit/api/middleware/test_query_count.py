@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+import pytest
+from sportifyapi.api.middleware.query_count import QueryCountMiddleware
+from sportifyapi.infrastructure.database.query_counter import QueryCounter
+
+
+async def _get(app):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/clubs/", "headers": []}
+    await app(scope, receive, send)
+    return dict(messages[0]["headers"])
+
+
+@pytest.mark.asyncio
+async def test_query_count_middleware_should_report_statements_of_the_request():
+    # Arrange
+    counter = QueryCounter()
+
+    async def app(scope, receive, send):
+        conn = SimpleNamespace(info={})
+        for statement in ["SELECT * FROM clubs"] + ["SELECT * FROM people WHERE id = $1"] * 3:
+            counter._before_execute(conn, None, statement, (), None, False)
+            counter._after_execute(conn, None, statement, (), None, False)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"[]"})
+
+    middleware = QueryCountMiddleware(app, counter=counter, repeat_threshold=3)
+
+    # Act
+    headers = await _get(middleware)
+
+    # Assert
+    assert headers[b"x-query-count"] == b"4"
+    assert headers[b"x-query-repeated"] == b"1"
+    assert b"x-query-time-ms" in headers
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+from sportifyapi.api.middleware.single_flight import SingleFlightMiddleware
+
+
+def _counting_app(delay=0.01, headers=None):
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["query_string"])
+        await asyncio.sleep(delay)
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": headers or [(b"content-type", b"application/json")],
+        })
+        await send({"type": "http.response.body", "body": f"call {len(calls)}".encode()})
+
+    return app, calls
+
+
+async def _get(app, query=b"", headers=()):
+    scope = {"type": "http", "method": "GET", "path": "/countries/",
+             "query_string": query, "headers": list(headers)}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+
+
+@pytest.mark.asyncio
+async def test_single_flight_should_share_response_of_identical_requests():
+    # Arrange
+    app, calls = _counting_app()
+    middleware = SingleFlightMiddleware(app, timeout_seconds=1)
+
+    # Act
+    bodies = await asyncio.gather(
+        _get(middleware, b"active_only=true&limit=5"),
+        _get(middleware, b"limit=5&active_only=true"),
+        _get(middleware, b"limit=5&active_only=true"),
+    )
+
+    # Assert
+    assert bodies == [b"call 1"] * 3
+    assert len(calls) == 1
+    assert (middleware.leaders, middleware.followers) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_should_not_share_across_credentials():
+    # Arrange
+    app, calls = _counting_app()
+    middleware = SingleFlightMiddleware(app, timeout_seconds=1)
+
+    # Act
+    await asyncio.gather(
+        _get(middleware, headers=[(b"authorization", b"Bearer a")]),
+        _get(middleware, headers=[(b"authorization", b"Bearer b")]),
+    )
+
+    # Assert
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_should_not_share_responses_setting_cookies():
+    # Arrange
+    app, calls = _counting_app(headers=[(b"set-cookie", b"session=1")])
+    middleware = SingleFlightMiddleware(app, timeout_seconds=1)
+
+    # Act
+    await asyncio.gather(_get(middleware), _get(middleware))
+
+    # Assert
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_should_run_duplicates_after_timeout():
+    # Arrange
+    app, calls = _counting_app(delay=0.2)
+    middleware = SingleFlightMiddleware(app, timeout_seconds=0.01)
+
+    # Act
+    await asyncio.gather(_get(middleware), _get(middleware))
+
+    # Assert
+    assert len(calls) == 2
+    assert middleware.followers == 0
@@ -0,0 +1,62 @@
+import pytest
+from sportifyapi.api.conditional import is_not_modified, make_etag
+from sportifyapi.api.encoding import negotiate_encoding, snapshot_response
+from sportifyapi.infrastructure.cache.snapshot_store import Snapshot
+from starlette.requests import Request
+
+
+def _request(accept_encoding, if_none_match=None):
+    headers = [] if accept_encoding is None else [(b"accept-encoding", accept_encoding.encode())]
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    (None, None),
+    ("gzip, deflate", "gzip"),
+    ("gzip, deflate, br", "br"),
+    ("br;q=0.5, gzip", "gzip"),
+    ("br;q=0, gzip;q=0", None),
+    ("identity", None),
+    ("*", "br"),
+    ("*;q=0.1, br;q=0", "gzip"),
+])
+def test_negotiate_encoding_should_follow_accept_encoding(accept_encoding, expected):
+    # Act
+    result = negotiate_encoding(_request(accept_encoding))
+
+    # Assert
+    assert result == expected
+
+
+def test_snapshot_response_should_tag_each_coding_with_its_own_etag():
+    # Arrange
+    etag = make_etag("countries")
+    snapshot = Snapshot.build(etag, b'{"countries": []}')
+
+    # Act
+    tags = {
+        accept_encoding: snapshot_response(_request(accept_encoding), snapshot, {"ETag": etag}).headers
+        for accept_encoding in (None, "gzip", "br")
+    }
+
+    # Assert
+    assert tags[None]["etag"] == etag
+    assert tags["gzip"]["etag"] == etag[:-1] + '-gzip"'
+    assert tags["br"]["etag"] == etag[:-1] + '-br"'
+    assert {headers["vary"] for headers in tags.values()} == {"Accept-Encoding"}
+
+
+@pytest.mark.parametrize("if_none_match, expected", [
+    ('"abc"', True),
+    ('"abc-br"', True),
+    ('W/"abc-gzip"', True),
+    ('"abd-br"', False),
+])
+def test_is_not_modified_should_ignore_coding_suffixes(if_none_match, expected):
+    # Act
+    result = is_not_modified(_request("br", if_none_match), '"abc-br"')
+
+    # Assert
+    assert result is expected
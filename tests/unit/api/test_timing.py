@@ -0,0 +1,77 @@
+import asyncio
+import re
+from types import SimpleNamespace
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+from sportifyapi.api.middleware.server_timing import ServerTimingMiddleware
+from sportifyapi.api.timing import TimedRoute, run_use_case
+from sportifyapi.infrastructure.database.query_counter import QueryCounter
+
+
+def _app():
+    router = APIRouter(route_class=TimedRoute)
+
+    @router.get("/slow")
+    async def slow():
+        await run_use_case(asyncio.sleep(0.02))
+        return {"ok": True}
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.add_middleware(ServerTimingMiddleware, counter=QueryCounter())
+    return app
+
+
+def _durations(header):
+    return {name: float(ms) for name, ms in re.findall(r"(\w+);dur=([\d.]+)", header)}
+
+
+@pytest.mark.asyncio
+async def test_server_timing_should_break_response_time_down_by_phase():
+    # Arrange
+    transport = ASGITransport(app=_app())
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/slow")
+
+    # Assert
+    durations = _durations(response.headers["server-timing"])
+    assert set(durations) == {"db", "use_case", "convert", "serialize", "total"}
+    assert durations["use_case"] >= 20
+    assert durations["convert"] < durations["use_case"]
+    assert durations["total"] >= durations["use_case"]
+
+
+@pytest.mark.asyncio
+async def test_server_timing_should_not_count_db_time_in_use_case():
+    # Arrange
+    counter = QueryCounter()
+    conn = SimpleNamespace(info={})
+
+    async def use_case():
+        counter._before_execute(conn, None, "SELECT 1", (), None, False)
+        await asyncio.sleep(0.03)
+        counter._after_execute(conn, None, "SELECT 1", (), None, False)
+
+    router = APIRouter(route_class=TimedRoute)
+
+    @router.get("/db")
+    async def db():
+        await run_use_case(use_case())
+        return {"ok": True}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(ServerTimingMiddleware, counter=counter)
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/db")
+
+    # Assert
+    durations = _durations(response.headers["server-timing"])
+    assert durations["db"] >= 30
+    assert durations["use_case"] < 10
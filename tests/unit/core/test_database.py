@@ -0,0 +1,100 @@
+import pytest
+from sportifyapi.core.database import DatabaseConfig, ReplicaSet
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool
+
+
+def test_database_config_should_read_pool_settings_from_environment(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("DB_POOL_SIZE", "20")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "2.5")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "true")
+
+    # Act
+    config = DatabaseConfig()
+    options = config.engine_options()
+
+    # Assert
+    assert config.engine.pool.size() == 20
+    assert options["max_overflow"] == 0
+    assert options["pool_timeout"] == 2.5
+    assert options["pool_pre_ping"] is True
+
+
+def test_database_config_should_disable_prepared_statement_caching_for_pgbouncer(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("DB_PGBOUNCER", "true")
+
+    # Act
+    connect_args = DatabaseConfig().engine_options()["connect_args"]
+
+    # Assert
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    name_func = connect_args["prepared_statement_name_func"]
+    assert name_func() != name_func()
+
+
+def test_database_config_should_use_null_pool_when_pool_size_is_zero(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("DB_POOL_SIZE", "0")
+
+    # Act
+    config = DatabaseConfig()
+
+    # Assert
+    assert isinstance(config.engine.pool, NullPool)
+
+
+def test_replica_set_should_rotate_between_replicas():
+    # Arrange
+    replicas = ReplicaSet(["replica-a", "replica-b"], cooldown=30)
+
+    # Act
+    firsts = [replicas.candidates()[0] for _ in range(4)]
+
+    # Assert
+    assert firsts == ["replica-a", "replica-b", "replica-a", "replica-b"]
+
+
+def test_replica_set_should_skip_replica_marked_down():
+    # Arrange
+    replicas = ReplicaSet(["replica-a", "replica-b"], cooldown=30)
+
+    # Act
+    replicas.mark_down("replica-a")
+
+    # Assert
+    assert replicas.candidates() == ["replica-b"]
+    assert replicas.candidates() == ["replica-b"]
+
+
+def test_replica_set_should_retry_replica_after_cooldown():
+    # Arrange
+    replicas = ReplicaSet(["replica-a"], cooldown=0)
+
+    # Act
+    replicas.mark_down("replica-a")
+
+    # Assert
+    assert replicas.candidates() == ["replica-a"]
+
+
+@pytest.mark.asyncio
+async def test_read_session_should_mark_unreachable_replica_down_and_retry_on_primary(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("DATABASE_URL", "postgresql+asyncpg://primary@127.0.0.1:1/sportify")
+    monkeypatch.setenv("DATABASE_REPLICA_URLS", "postgresql+asyncpg://replica@127.0.0.1:1/sportify")
+    config = DatabaseConfig()
+    replica = config.replicas.engines[0]
+
+    # Act
+    with pytest.raises(OSError):
+        async with config.read_session_scope() as session:
+            await session.execute(text("SELECT 1"))
+
+    # Assert
+    assert config.is_primary(session)
+    assert config.replicas.pick() is None
+    assert replica not in config.replicas.candidates()
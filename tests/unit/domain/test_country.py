@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+
+import pytest
+from sportifyapi.domain.entities.country import Country
+from sportifyapi.domain.value_objects.iso_code import ISOCode
+
+
+def test_country_from_trusted_should_match_validated_country():
+    # Arrange
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    # Act
+    trusted = Country._from_trusted(7, "Brasil", ISOCode._from_trusted("BR"), False, created_at, created_at)
+    validated = Country(7, "Brasil", ISOCode("BR"), False, created_at, created_at)
+
+    # Assert
+    assert repr(trusted) == repr(validated)
+    assert (trusted.created_at, trusted.updated_at) == (validated.created_at, validated.updated_at)
+
+
+def test_country_from_trusted_should_skip_validation_that_constructor_applies():
+    # Act
+    trusted = Country._from_trusted(1, " X ", ISOCode("XX"))
+
+    # Assert
+    assert trusted.name == " X "
+    with pytest.raises(ValueError):
+        Country(1, " X ", ISOCode("XX"))
@@ -0,0 +1,55 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
+from sportifyapi.domain.entities.country import Country
+from sportifyapi.domain.value_objects.iso_code import ISOCode
+
+
+def test_iso_code_should_share_one_instance_per_code():
+    # Act
+    codes = [ISOCode("BR"), ISOCode("br"), ISOCode.from_string(" bR "), copy.deepcopy(ISOCode("BR"))]
+    codes.append(pickle.loads(pickle.dumps(codes[0])))
+
+    # Assert
+    assert all(code is codes[0] for code in codes)
+    assert codes[0].value == "BR"
+
+
+@pytest.mark.parametrize("value", ["B", "BRA", "B1", 12])
+def test_iso_code_should_validate_every_uncached_value(value):
+    # Act / Assert
+    with pytest.raises(ValueError):
+        ISOCode(value)
+
+    assert value not in ISOCode._interned
+
+
+def test_iso_code_should_not_intern_non_ascii_codes():
+    # Act
+    code = ISOCode("çé")
+
+    # Assert
+    assert code.value == "ÇÉ"
+    assert "çé" not in ISOCode._interned
+
+
+def test_domain_objects_should_be_slotted_and_immutable_where_frozen():
+    # Arrange
+    country = Country(id=1, name="Brasil", iso_code=ISOCode("BR"))
+
+    # Act / Assert
+    assert not hasattr(country, "__dict__")
+    assert not hasattr(country.iso_code, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        country.iso_code.value = "AR"
+
+
+def test_iso_code_from_trusted_should_reuse_interned_codes_without_validating():
+    # Act
+    trusted = ISOCode._from_trusted("AR")
+
+    # Assert
+    assert trusted is ISOCode("AR")
+    assert ISOCode._from_trusted("ZZ") is ISOCode("zz")
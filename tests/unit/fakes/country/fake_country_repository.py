@@ -1,39 +1,132 @@
-class FakeCountryRepository:
-    def __init__(self, countries):
-        self._countries = countries
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
-    async def get_by_id(self, country_id: int):
-        return self._countries.get(country_id)
+from sportifyapi.domain.entities.country import Country
+from sportifyapi.domain.exceptions import CountryAlreadyExistsError, CountryNotFoundError
+from sportifyapi.domain.repositories.country_repository import CountryRepository, CountryRow, UpsertStatus
+from sportifyapi.domain.value_objects.iso_code import ISOCode
 
-    async def get_all(self):
-        return list(self._countries.values())
 
-    async def create(self, country):
-        new_id = max(self._countries.keys(), default=0) + 1
-        country.id = new_id
-        self._countries[new_id] = country
-        return country
+class FakeCountryRepository(CountryRepository):
+    """
+    In-memory CountryRepository for unit tests.
+    Keeps countries in a dict keyed by ID.
+    """
 
-    async def delete(self, country_id: int):
-        return self._countries.pop(country_id, None)
+    def __init__(self, countries: Dict[int, Country]):
+        self._countries = countries
 
-    async def update(self, country_id: int, update_data: dict):
-        country = self._countries.get(country_id)
-        if not country:
-            return None
-        for key, value in update_data.items():
-            setattr(country, key, value)
+    async def save(self, country: Country) -> Country:
+        if await self.exists_by_iso_code(country.iso_code):
+            raise CountryAlreadyExistsError(f"Country with ISO code '{country.iso_code}' already exists")
+        country.id = max(self._countries.keys(), default=0) + 1
+        self._countries[country.id] = country
         return country
 
-    async def get_by_iso_code(self, iso_code: str):
+    async def upsert_many(
+        self,
+        countries: List[Country],
+        update_existing: bool = True
+    ) -> List[Tuple[Country, UpsertStatus]]:
+        outcomes = []
+        for country in countries:
+            existing = await self.find_by_iso_code(country.iso_code)
+            if existing is None:
+                outcomes.append((await self.save(country), UpsertStatus.CREATED))
+            elif update_existing and existing.name != country.name:
+                existing.name = country.name
+                outcomes.append((existing, UpsertStatus.UPDATED))
+            else:
+                outcomes.append((existing, UpsertStatus.SKIPPED))
+        return outcomes
+
+    async def find_by_id(self, country_id: int) -> Optional[Country]:
+        return self._countries.get(country_id)
+
+    async def find_by_ids(self, country_ids: List[int]) -> List[Country]:
+        return [self._countries[i] for i in set(country_ids) if i in self._countries]
+
+    async def find_by_iso_code(self, iso_code: ISOCode) -> Optional[Country]:
         for country in self._countries.values():
             if country.iso_code == iso_code:
                 return country
         return None
 
-    async def create_many_deferred(self, countries):
-        start_id = max(self._countries.keys(), default=0) + 1
-        for i, country in enumerate(countries):
-            country.id = start_id + i
-            self._countries[country.id] = country
-        return countries
+    async def find_all(self, active_only: bool = False) -> List[Country]:
+        return self._ordered(active_only)
+
+    async def find_page(
+        self,
+        active_only: bool = False,
+        after: Optional[Tuple[str, int]] = None,
+        limit: int = 50
+    ) -> List[Country]:
+        countries = self._ordered(active_only)
+        if after is not None:
+            countries = [c for c in countries if (c.name, c.id) > after]
+        return countries[:limit]
+
+    async def find_rows(
+        self,
+        active_only: bool = False,
+        after: Optional[Tuple[str, int]] = None,
+        limit: Optional[int] = None
+    ) -> List[CountryRow]:
+        countries = await self.find_page(active_only=active_only, after=after, limit=limit)
+        return [CountryRow(c.id, c.name, str(c.iso_code), c.is_active) for c in countries]
+
+    async def stream_all(self, active_only: bool = False) -> AsyncIterator[Country]:
+        for country in self._ordered(active_only):
+            yield country
+
+    async def get_list_version(self, active_only: bool = False) -> Tuple[Optional[datetime], int]:
+        countries = self._ordered(active_only)
+        stamps = [c.updated_at for c in countries if c.updated_at is not None]
+        return max(stamps, default=None), len(countries)
+
+    async def get_version(self, country_id: int) -> Optional[datetime]:
+        country = self._countries.get(country_id)
+        return country.updated_at if country else None
+
+    async def update(self, country: Country) -> Country:
+        if country.id not in self._countries:
+            raise CountryNotFoundError(f"Country with ID {country.id} not found")
+        self._check_iso_code_is_free(country.id, country.iso_code)
+        self._countries[country.id] = country
+        return country
+
+    async def patch(
+        self,
+        country_id: int,
+        name: Optional[str] = None,
+        iso_code: Optional[ISOCode] = None,
+        is_active: Optional[bool] = None
+    ) -> Country:
+        country = self._countries.get(country_id)
+        if country is None:
+            raise CountryNotFoundError(f"Country with ID {country_id} not found")
+        if iso_code is not None:
+            self._check_iso_code_is_free(country_id, iso_code)
+            country.iso_code = iso_code
+        if name is not None:
+            country.name = name
+        if is_active is not None:
+            country.is_active = is_active
+        return country
+
+    async def delete(self, country_id: int) -> bool:
+        return self._countries.pop(country_id, None) is not None
+
+    async def exists_by_iso_code(self, iso_code: ISOCode) -> bool:
+        return await self.find_by_iso_code(iso_code) is not None
+
+    def _ordered(self, active_only: bool) -> List[Country]:
+        countries = [
+            c for c in self._countries.values() if c.is_active or not active_only
+        ]
+        return sorted(countries, key=lambda c: (c.name, c.id))
+
+    def _check_iso_code_is_free(self, country_id: int, iso_code: ISOCode) -> None:
+        for other in self._countries.values():
+            if other.id != country_id and other.iso_code == iso_code:
+                raise CountryAlreadyExistsError(f"Country with ISO code '{iso_code}' already exists")
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from sportifyapi.domain.entities.country import Country
+from sportifyapi.domain.value_objects.iso_code import ISOCode
+from sportifyapi.infrastructure.batching.batch_loader import BatchLoader
+from sportifyapi.infrastructure.batching.batched_country_repository import BatchedCountryRepository
+from tests.unit.fakes.country.fake_country_repository import FakeCountryRepository
+
+
+def _recording_loader(values, max_batch_size=500):
+    calls = []
+
+    async def batch_load(keys):
+        calls.append(sorted(keys))
+        return {key: values[key] for key in keys if key in values}
+
+    return BatchLoader(batch_load, max_batch_size=max_batch_size), calls
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_should_coalesce_loads_of_the_same_tick():
+    # Arrange
+    loader, calls = _recording_loader({1: "a", 2: "b", 3: "c"})
+
+    # Act
+    results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), loader.load(4))
+
+    # Assert
+    assert results == ["a", "b", "a", None]
+    assert calls == [[1, 2, 4]]
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_should_split_batches_at_max_size():
+    # Arrange
+    loader, calls = _recording_loader({i: i for i in range(5)}, max_batch_size=2)
+
+    # Act
+    results = await asyncio.gather(*(loader.load(i) for i in range(5)))
+
+    # Assert
+    assert results == [0, 1, 2, 3, 4]
+    assert calls == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_should_propagate_errors_to_every_caller():
+    # Arrange
+    async def batch_load(keys):
+        raise RuntimeError("database down")
+
+    loader = BatchLoader(batch_load)
+
+    # Act
+    results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+    # Assert
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_batched_repository_should_memoize_lookups():
+    # Arrange
+    countries = {1: Country(id=1, name="Brazil", iso_code=ISOCode("BR"))}
+    fake = FakeCountryRepository(countries)
+
+    async def batch_load(ids):
+        return {country.id: country for country in await fake.find_by_ids(ids)}
+
+    loader = BatchLoader(batch_load)
+    repo = BatchedCountryRepository(fake, loader)
+
+    # Act
+    first = await repo.find_by_id(1)
+    second = await repo.find_by_id(1)
+
+    # Assert
+    assert first is second
+    assert first is not countries[1]
+    assert loader.batches == 1
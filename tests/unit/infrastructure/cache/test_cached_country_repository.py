@@ -0,0 +1,105 @@
+import pytest
+from sportifyapi.domain.entities.country import Country
+from sportifyapi.domain.value_objects.iso_code import ISOCode
+from sportifyapi.infrastructure.cache.cached_country_repository import CachedCountryRepository
+from sportifyapi.infrastructure.cache.query_cache import QueryCache
+from tests.unit.fakes.country.fake_country_repository import FakeCountryRepository
+
+
+def _active_cache():
+    cache = QueryCache(max_entries=10)
+    cache.active = True
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_should_serve_repeated_reads_from_cache():
+    # Arrange
+    countries = {1: Country(id=1, name="Brazil", iso_code=ISOCode("BR"))}
+    cache = _active_cache()
+    repo = CachedCountryRepository(FakeCountryRepository(countries), cache)
+
+    # Act
+    await repo.find_by_id(1)
+    countries[1] = Country(id=1, name="Brasil", iso_code=ISOCode("BR"))
+    result = await repo.find_by_id(1)
+
+    # Assert
+    assert result.name == "Brazil"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_should_reload_after_table_invalidation():
+    # Arrange
+    countries = {1: Country(id=1, name="Brazil", iso_code=ISOCode("BR"))}
+    cache = _active_cache()
+    repo = CachedCountryRepository(FakeCountryRepository(countries), cache)
+    await repo.find_all()
+
+    # Act
+    countries[2] = Country(id=2, name="Argentina", iso_code=ISOCode("AR"))
+    cache.invalidate("countries")
+    result = await repo.find_all()
+
+    # Assert
+    assert [c.iso_code for c in result] == [ISOCode("AR"), ISOCode("BR")]
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_should_return_copies():
+    # Arrange
+    countries = {1: Country(id=1, name="Brazil", iso_code=ISOCode("BR"))}
+    repo = CachedCountryRepository(FakeCountryRepository(countries), _active_cache())
+
+    # Act
+    first = await repo.find_by_id(1)
+    first.deactivate()
+    second = await repo.find_by_id(1)
+
+    # Assert
+    assert second.is_active is True
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_should_bypass_cache_when_inactive():
+    # Arrange
+    countries = {1: Country(id=1, name="Brazil", iso_code=ISOCode("BR"))}
+    cache = QueryCache(max_entries=10)
+    repo = CachedCountryRepository(FakeCountryRepository(countries), cache)
+
+    # Act
+    await repo.find_by_id(1)
+    countries[1] = Country(id=1, name="Brasil", iso_code=ISOCode("BR"))
+    result = await repo.find_by_id(1)
+
+    # Assert
+    assert result.name == "Brasil"
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_cached_repository_should_not_share_reads_after_writing():
+    # Arrange
+    cache = _active_cache()
+    repo = CachedCountryRepository(FakeCountryRepository({}), cache)
+
+    # Act
+    await repo.save(Country(id=None, name="Brazil", iso_code=ISOCode("BR")))
+    await repo.find_all()
+
+    # Assert
+    assert len(cache) == 0
+
+
+def test_query_cache_should_drop_results_computed_before_invalidation():
+    # Arrange
+    cache = _active_cache()
+    version = cache.version("countries")
+
+    # Act
+    cache.invalidate("countries")  # change committed while the query ran
+    cache.put("countries", "key", version, ["stale"])
+
+    # Assert
+    assert len(cache) == 0
@@ -0,0 +1,32 @@
+import gzip
+
+import brotli
+from sportifyapi.infrastructure.cache.snapshot_store import Snapshot, SnapshotStore
+
+
+def test_snapshot_should_hold_every_encoding_of_the_body():
+    # Arrange
+    body = b'{"countries": []}' * 20
+
+    # Act
+    snapshot = Snapshot.build('"v1"', body)
+
+    # Assert
+    assert snapshot.body(None) == body
+    assert gzip.decompress(snapshot.body("gzip")) == body
+    assert brotli.decompress(snapshot.body("br")) == body
+
+
+def test_snapshot_store_should_only_serve_snapshots_of_the_current_etag():
+    # Arrange
+    store = SnapshotStore()
+    store.put("countries", Snapshot.build('"v1"', b"[]"))
+
+    # Act
+    current = store.get("countries", '"v1"')
+    stale = store.get("countries", '"v2"')
+
+    # Assert
+    assert current is not None
+    assert stale is None
+    assert (store.hits, store.builds) == (1, 1)
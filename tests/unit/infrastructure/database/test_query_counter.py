@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import pytest
+from sportifyapi.core.database import query_counter
+from sportifyapi.infrastructure.database.query_counter import QueryCounter, statement_shape
+
+
+def _execute(counter, statement):
+    conn = SimpleNamespace(info={})
+    counter._before_execute(conn, None, statement, (), None, False)
+    counter._after_execute(conn, None, statement, (), None, False)
+
+
+def test_statement_shape_should_normalize_placeholders_and_in_lists():
+    # Act
+    shapes = {
+        statement_shape("SELECT * FROM people WHERE id IN ($1, $2, $3)"),
+        statement_shape("SELECT * FROM people\n WHERE id IN ($1)"),
+        statement_shape("SELECT * FROM people WHERE id = $1::INTEGER"),
+    }
+
+    # Assert
+    assert shapes == {
+        "SELECT * FROM people WHERE id IN (?, ...)",
+        "SELECT * FROM people WHERE id IN (?)",
+        "SELECT * FROM people WHERE id = ?::INTEGER",
+    }
+
+
+def test_query_counter_should_flag_repeated_statement_shapes():
+    # Arrange
+    counter = QueryCounter()
+
+    # Act
+    with counter.track() as log:
+        _execute(counter, "SELECT * FROM clubs")
+        for _ in range(3):
+            _execute(counter, "SELECT * FROM people WHERE people.id = $1")
+
+    # Assert
+    assert log.count == 4
+    assert log.repeated(3) == [("SELECT * FROM people WHERE people.id = ?", 3)]
+    assert log.repeated(4) == []
+
+
+def test_query_counter_should_count_nested_scopes_and_nothing_outside():
+    # Arrange
+    counter = QueryCounter()
+
+    # Act
+    _execute(counter, "SELECT 1")
+    with counter.track() as outer:
+        _execute(counter, "SELECT 1")
+        with counter.track() as inner:
+            _execute(counter, "SELECT 2")
+
+    # Assert
+    assert (outer.count, inner.count) == (2, 1)
+
+
+def test_max_queries_should_fail_above_the_limit(max_queries):
+    # Act / Assert
+    with pytest.raises(AssertionError, match="at most 1 statement"):
+        with max_queries(1):
+            _execute(query_counter, "SELECT * FROM people WHERE people.id = $1")
+            _execute(query_counter, "SELECT * FROM people WHERE people.id = $1")
@@ -0,0 +1,42 @@
+from prometheus_client import CollectorRegistry
+from sportifyapi.infrastructure.database.query_metrics import (
+    DatabaseMetrics,
+    InstrumentedQueuePool,
+    statement_labels,
+)
+
+
+def test_statement_labels_should_name_operation_and_first_table():
+    # Act
+    labels = [
+        statement_labels("SELECT countries.id FROM countries WHERE countries.id = $1"),
+        statement_labels('\n INSERT INTO "countries" (name) VALUES ($1) RETURNING countries.id'),
+        statement_labels("update countries SET name=$1"),
+        statement_labels("SELECT 1"),
+    ]
+
+    # Assert
+    assert labels == [
+        ("SELECT", "countries"),
+        ("INSERT", "countries"),
+        ("UPDATE", "countries"),
+        ("SELECT", ""),
+    ]
+
+
+def test_instrumented_pool_should_keep_timing_after_recreate():
+    # Arrange
+    registry = CollectorRegistry()
+    metrics = DatabaseMetrics(registry)
+    pool = InstrumentedQueuePool(lambda: None, pool_size=1)
+    pool.wait_observer = metrics.pool_wait.labels("primary").observe
+
+    # Act
+    recreated = pool.recreate()
+    recreated.wait_observer(0.25)
+
+    # Assert
+    assert recreated is not pool
+    assert registry.get_sample_value(
+        "db_pool_wait_seconds_sum", {"engine": "primary"}
+    ) == 0.25
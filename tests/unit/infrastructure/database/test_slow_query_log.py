@@ -0,0 +1,40 @@
+from sportifyapi.infrastructure.database.slow_query_log import SlowQueryLog, redact
+
+
+def test_redact_should_hide_text_and_keep_numbers():
+    # Act
+    redacted = redact(("alice@example.com", 42, None, [1, 2], b"\x00\x01", True))
+
+    # Assert
+    assert redacted == ["<str:17>", 42, None, [1, 2], "<bytes:2>", True]
+
+
+def test_slow_query_log_should_aggregate_by_fingerprint_with_origin():
+    # Arrange
+    log = SlowQueryLog(threshold_seconds=0.1)
+
+    # Act
+    with log.origin(lambda: "GET /countries/{country_id}"):
+        log.record("SELECT * FROM countries WHERE id = $1::INTEGER", (1,), 0.2)
+        log.record("SELECT *\n FROM countries WHERE id = $1::INTEGER", (2,), 0.5)
+    log.record("SELECT * FROM people", (), 0.3)
+
+    # Assert
+    first, second = log.top()
+    assert (first.calls, first.total_seconds, first.max_seconds) == (2, 0.7, 0.5)
+    assert first.last_parameters == [2]
+    assert first.last_origin == "GET /countries/{country_id}"
+    assert second.last_origin is None
+
+
+def test_slow_query_log_should_keep_top_entries_by_total_time():
+    # Arrange
+    log = SlowQueryLog(threshold_seconds=0.1, max_entries=2)
+
+    # Act
+    log.record("SELECT * FROM a", (), 0.5)
+    log.record("SELECT * FROM b", (), 0.2)
+    log.record("SELECT * FROM c", (), 0.3)
+
+    # Assert
+    assert [entry.statement for entry in log.top()] == ["SELECT * FROM a", "SELECT * FROM c"]
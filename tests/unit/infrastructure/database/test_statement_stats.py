@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+from sqlalchemy.engine import default
+from sportifyapi.infrastructure.database.statement_stats import StatementCacheStats
+
+
+def _execute(stats, cache_hit):
+    context = SimpleNamespace(cache_hit=cache_hit)
+    stats._on_execute(None, None, "SELECT 1", (), context, False)
+
+
+def test_statement_cache_stats_should_classify_executions():
+    # Arrange
+    stats = StatementCacheStats()
+
+    # Act
+    _execute(stats, default.CACHE_MISS)
+    _execute(stats, default.CACHE_HIT)
+    _execute(stats, default.CACHE_HIT)
+    _execute(stats, default.CACHING_DISABLED)
+
+    # Assert
+    snapshot = stats.snapshot()
+    assert (snapshot["hits"], snapshot["misses"], snapshot["uncached"]) == (2, 1, 1)
+    assert snapshot["hit_ratio"] == 0.5
+
+
+def test_statement_cache_stats_should_report_no_ratio_before_executions():
+    # Arrange
+    stats = StatementCacheStats()
+
+    # Act
+    snapshot = stats.snapshot()
+
+    # Assert
+    assert snapshot["hit_ratio"] is None
+    assert snapshot["compiled_cache_entries"] == 0
+
+
+def test_statement_cache_stats_should_report_unavailable_cache_size():
+    # Arrange
+    stats = StatementCacheStats()
+    stats._engines.append(SimpleNamespace(sync_engine=SimpleNamespace()))
+
+    # Act
+    snapshot = stats.snapshot()
+
+    # Assert
+    assert snapshot["compiled_cache_entries"] is None
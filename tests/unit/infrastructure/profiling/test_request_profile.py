@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+
+from pyinstrument.frame import AWAIT_FRAME_IDENTIFIER, SELF_TIME_FRAME_IDENTIFIER, Frame
+from sportifyapi.infrastructure.profiling.request_profile import (
+    FRAMEWORK_LAYER,
+    ProfileStore,
+    RequestProfile,
+    layer_breakdown,
+)
+
+
+def _frame(function, path, children=(), time=0.0, identifier=None):
+    frame = Frame(identifier or f"{function}\x00{path}\x001", time=time)
+    for child in children:
+        frame.add_child(child)
+    return frame
+
+
+def test_layer_breakdown_should_split_cpu_and_await_time_by_layer():
+    # Arrange
+    root = _frame("run", "/venv/starlette/routing.py", [
+        _frame("get_country", "/app/src/sportifyapi/api/controllers/country.py", [
+            _frame("execute", "/app/src/sportifyapi/application/use_cases/get.py", [
+                _frame("find_by_id", "/app/src/sportifyapi/infrastructure/database/repo.py", [
+                    _frame("execute", "/venv/sqlalchemy/ext/asyncio/session.py", [
+                        Frame(AWAIT_FRAME_IDENTIFIER, time=0.03),
+                        Frame(SELF_TIME_FRAME_IDENTIFIER, time=0.002),
+                    ]),
+                ]),
+            ]),
+            Frame(SELF_TIME_FRAME_IDENTIFIER, time=0.001),
+        ]),
+        Frame(SELF_TIME_FRAME_IDENTIFIER, time=0.004),
+    ])
+
+    # Act
+    layers = layer_breakdown(root)
+
+    # Assert
+    assert layers == {
+        FRAMEWORK_LAYER: {"cpu": 0.004, "await": 0.0},
+        "api": {"cpu": 0.001, "await": 0.0},
+        "infrastructure": {"cpu": 0.002, "await": 0.03},
+    }
+
+
+def test_profile_store_should_keep_the_latest_profiles():
+    # Arrange
+    store = ProfileStore(max_entries=2)
+
+    def profile(id):
+        return RequestProfile(
+            id=id, method="GET", path="/", status=200, started_at=datetime.now(timezone.utc),
+            wall_seconds=0.0, cpu_seconds=0.0, await_seconds=0.0, layers={}, speedscope="{}"
+        )
+
+    # Act
+    for id in ("a", "b", "c"):
+        store.put(profile(id))
+
+    # Assert
+    assert [p.id for p in store.latest()] == ["c", "b"]
+    assert store.get("a") is None
@@ -0,0 +1,24 @@
+from sportifyapi.server import build_options, parse_args
+
+
+def test_serve_should_preload_app_with_production_worker():
+    # Act
+    options = build_options(parse_args(["serve", "--workers", "3"]))
+
+    # Assert
+    assert options["workers"] == 3
+    assert options["preload_app"] is True
+    assert options["worker_class"] == "sportifyapi.server.ProductionUvicornWorker"
+
+
+def test_serve_should_read_tuning_from_environment(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("KEEPALIVE", "75")
+    monkeypatch.setenv("BACKLOG", "4096")
+    monkeypatch.setenv("WEB_CONCURRENCY", "2")
+
+    # Act
+    options = build_options(parse_args(["serve"]))
+
+    # Assert
+    assert (options["keepalive"], options["backlog"], options["workers"]) == (75, 4096, 2)
@@ -1,23 +1,37 @@
 import pytest
 from sportifyapi.application.use_cases.country.create_country import CreateCountryUseCase
 from sportifyapi.domain.entities.country import Country
+from sportifyapi.domain.exceptions import CountryAlreadyExistsError
+from sportifyapi.domain.value_objects.iso_code import ISOCode
 from sportifyapi.api.schemas.country import CountryCreateRequest
 from tests.unit.fakes.country.fake_country_repository import FakeCountryRepository
-from tests.unit.fakes.country.fake_unit_of_work import FakeUnitOfWork
 
 
 @pytest.mark.asyncio
 async def test_create_country_should_return_created_country():
     # Arrange
     fake_repo = FakeCountryRepository({})
-    uow = FakeUnitOfWork(fake_repo)
-    use_case = CreateCountryUseCase(uow)
+    use_case = CreateCountryUseCase(fake_repo)
     input_data = CountryCreateRequest(name="Canada", iso_code="CA")
 
     # Act
     result = await use_case.execute(input_data)
 
     # Assert
-    assert isinstance(result, Country)
+    assert result.id == 1
     assert result.name == "Canada"
-    assert result.iso_code == "CA"
\ No newline at end of file
+    assert result.iso_code == "CA"
+    assert result.is_active is True
+
+
+@pytest.mark.asyncio
+async def test_create_country_should_reject_duplicate_iso_code():
+    # Arrange
+    countries = {1: Country(id=1, name="Canada", iso_code=ISOCode("CA"))}
+    use_case = CreateCountryUseCase(FakeCountryRepository(countries))
+    input_data = CountryCreateRequest(name="Kanada", iso_code="CA")
+
+    # Act / Assert
+    with pytest.raises(CountryAlreadyExistsError):
+        await use_case.execute(input_data)
+    assert len(countries) == 1
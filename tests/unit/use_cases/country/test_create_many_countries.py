@@ -1,42 +1,128 @@
-# import pytest
-# from sportifyapi.application.use_cases.country.create_many_countries import (
-#     CreateManyCountriesUseCase,
-# )
-# from sportifyapi.api.schemas.country.country_schema import CountryCreateRequest
-# from tests.unit.fakes.country.fake_country_repository import FakeCountryRepository
-# from tests.unit.fakes.country.fake_unit_of_work import FakeUnitOfWork
-
-
-# @pytest.mark.asyncio
-# async def test_create_many_countries_should_return_created_list():
-#     # Arrange
-#     fake_repo = FakeCountryRepository({})
-#     uow = FakeUnitOfWork(fake_repo)
-#     use_case = CreateManyCountriesUseCase(uow)
-
-#     input_data = [
-#         CountryCreateRequest(name="Brazil", iso_code="BR"),
-#         CountryCreateRequest(name="Argentina", iso_code="AR"),
-#     ]
-
-#     # Act
-#     result = await use_case.execute(input_data)
-
-#     # Assert
-#     assert len(result) == 2
-#     assert result[0].name == "Brazil"
-#     assert result[1].iso_code == "AR"
-
-
-# @pytest.mark.asyncio
-# async def test_create_many_countries_should_return_empty_list():
-#     # Arrange
-#     fake_repo = FakeCountryRepository({})
-#     uow = FakeUnitOfWork(fake_repo)
-#     use_case = CreateManyCountriesUseCase(uow)
-
-#     # Act
-#     result = await use_case.execute([])
-
-#     # Assert
-#     assert result == []
+import pytest
+from sportifyapi.application.use_cases.country.create_country import CreateCountryRequest
+from sportifyapi.application.use_cases.country.create_many_countries import (
+    CreateManyCountriesRequest,
+    CreateManyCountriesUseCase,
+)
+from sportifyapi.domain.entities.country import Country
+from sportifyapi.domain.value_objects.iso_code import ISOCode
+from tests.unit.fakes.country.fake_country_repository import FakeCountryRepository
+
+
+@pytest.mark.asyncio
+async def test_create_many_countries_should_return_created_list():
+    # Arrange
+    fake_repo = FakeCountryRepository({})
+    use_case = CreateManyCountriesUseCase(fake_repo)
+
+    input_data = CreateManyCountriesRequest(countries=[
+        CreateCountryRequest(name="Brazil", iso_code="BR"),
+        CreateCountryRequest(name="Argentina", iso_code="ar"),
+    ])
+
+    # Act
+    result = await use_case.execute(input_data)
+
+    # Assert
+    assert len(result.countries) == 2
+    assert result.countries[0].name == "Brazil"
+    assert result.countries[1].iso_code == "AR"
+    assert result.created == 2
+    assert all(c.status == "created" for c in result.countries)
+
+
+@pytest.mark.asyncio
+async def test_create_many_countries_should_return_empty_list():
+    # Arrange
+    fake_repo = FakeCountryRepository({})
+    use_case = CreateManyCountriesUseCase(fake_repo)
+
+    # Act
+    result = await use_case.execute(CreateManyCountriesRequest(countries=[]))
+
+    # Assert
+    assert result.countries == []
+    assert (result.created, result.updated, result.skipped) == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_create_many_countries_should_report_updated_and_skipped():
+    # Arrange
+    countries = {
+        1: Country(id=1, name="Brasil", iso_code=ISOCode("BR")),
+        2: Country(id=2, name="Chile", iso_code=ISOCode("CL")),
+    }
+    use_case = CreateManyCountriesUseCase(FakeCountryRepository(countries))
+
+    input_data = CreateManyCountriesRequest(countries=[
+        CreateCountryRequest(name="Brazil", iso_code="BR"),
+        CreateCountryRequest(name="Chile", iso_code="CL"),
+        CreateCountryRequest(name="Peru", iso_code="PE"),
+    ])
+
+    # Act
+    result = await use_case.execute(input_data)
+
+    # Assert
+    assert [c.status for c in result.countries] == ["updated", "skipped", "created"]
+    assert countries[1].name == "Brazil"
+
+
+@pytest.mark.asyncio
+async def test_create_many_countries_should_not_update_when_skipping_conflicts():
+    # Arrange
+    countries = {1: Country(id=1, name="Brasil", iso_code=ISOCode("BR"))}
+    use_case = CreateManyCountriesUseCase(FakeCountryRepository(countries))
+
+    input_data = CreateManyCountriesRequest(
+        countries=[CreateCountryRequest(name="Brazil", iso_code="BR")],
+        on_conflict="skip",
+    )
+
+    # Act
+    result = await use_case.execute(input_data)
+
+    # Assert
+    assert result.skipped == 1
+    assert countries[1].name == "Brasil"
+
+
+@pytest.mark.asyncio
+async def test_create_many_countries_should_reject_whole_batch_on_invalid_row():
+    # Arrange
+    fake_repo = FakeCountryRepository({})
+    use_case = CreateManyCountriesUseCase(fake_repo)
+
+    input_data = CreateManyCountriesRequest(countries=[
+        CreateCountryRequest(name="Brazil", iso_code="BR"),
+        CreateCountryRequest(name="Brasil", iso_code="BR"),
+    ])
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="duplicated"):
+        await use_case.execute(input_data)
+    assert await fake_repo.find_all() == []
+
+
+@pytest.mark.asyncio
+async def test_create_many_countries_should_keep_existing_countries_inactive():
+    # Arrange
+    countries = {
+        1: Country(id=1, name="Brasil", iso_code=ISOCode("BR"), is_active=False),
+        2: Country(id=2, name="Chile", iso_code=ISOCode("CL"), is_active=False),
+    }
+    use_case = CreateManyCountriesUseCase(FakeCountryRepository(countries))
+
+    input_data = CreateManyCountriesRequest(countries=[
+        CreateCountryRequest(name="Brazil", iso_code="BR"),
+        CreateCountryRequest(name="Chile", iso_code="CL"),
+    ])
+
+    # Act
+    result = await use_case.execute(input_data)
+
+    # Assert
+    assert [c.status for c in result.countries] == ["updated", "skipped"]
+    assert [c.is_active for c in result.countries] == [False, False]
+    assert [c.id for c in result.countries] == [1, 2]
+    assert not countries[1].is_active and not countries[2].is_active
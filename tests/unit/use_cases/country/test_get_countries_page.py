@@ -0,0 +1,79 @@
+import pytest
+from sportifyapi.application.use_cases.country.get_countries_page import (
+    GetCountriesPageRequest,
+    GetCountriesPageUseCase,
+)
+from sportifyapi.domain.entities.country import Country
+from sportifyapi.domain.value_objects.iso_code import ISOCode
+from tests.unit.fakes.country.fake_country_repository import FakeCountryRepository
+
+
+def _countries():
+    return {
+        1: Country(id=1, name="Brazil", iso_code=ISOCode("BR")),
+        2: Country(id=2, name="Argentina", iso_code=ISOCode("AR")),
+        3: Country(id=3, name="Chile", iso_code=ISOCode("CL")),
+        4: Country(id=4, name="Germany", iso_code=ISOCode("DE"), is_active=False),
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_countries_page_should_return_first_page_and_cursor():
+    # Arrange
+    use_case = GetCountriesPageUseCase(FakeCountryRepository(_countries()))
+
+    # Act
+    result = await use_case.execute(GetCountriesPageRequest(limit=2))
+
+    # Assert
+    assert [c.name for c in result.countries] == ["Argentina", "Brazil"]
+    assert result.total == 2
+    assert result.next_cursor == "Brazil,1"
+
+
+@pytest.mark.asyncio
+async def test_get_countries_page_should_resume_after_cursor():
+    # Arrange
+    use_case = GetCountriesPageUseCase(FakeCountryRepository(_countries()))
+
+    # Act
+    result = await use_case.execute(GetCountriesPageRequest(after="Brazil,1", limit=2))
+
+    # Assert
+    assert [c.name for c in result.countries] == ["Chile", "Germany"]
+    assert result.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_countries_page_should_filter_active_only():
+    # Arrange
+    use_case = GetCountriesPageUseCase(FakeCountryRepository(_countries()))
+
+    # Act
+    result = await use_case.execute(
+        GetCountriesPageRequest(active_only=True, after="Brazil,1", limit=5)
+    )
+
+    # Assert
+    assert [c.iso_code for c in result.countries] == ["CL"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", ["Brazil", "Brazil,abc", ",1"])
+async def test_get_countries_page_should_reject_invalid_cursor(cursor):
+    # Arrange
+    use_case = GetCountriesPageUseCase(FakeCountryRepository(_countries()))
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        await use_case.execute(GetCountriesPageRequest(after=cursor))
+
+
+@pytest.mark.asyncio
+async def test_get_countries_page_should_reject_invalid_page_size():
+    # Arrange
+    use_case = GetCountriesPageUseCase(FakeCountryRepository(_countries()))
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="Page size"):
+        await use_case.execute(GetCountriesPageRequest(limit=0))
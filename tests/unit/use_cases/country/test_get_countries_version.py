@@ -0,0 +1,64 @@
+from datetime import datetime, timezone
+
+import pytest
+from sportifyapi.application.use_cases.country.get_countries_version import (
+    GetCountriesVersionRequest,
+    GetCountriesVersionUseCase,
+)
+from sportifyapi.domain.entities.country import Country
+from sportifyapi.domain.value_objects.iso_code import ISOCode
+from tests.unit.fakes.country.fake_country_repository import FakeCountryRepository
+
+JAN = datetime(2024, 1, 1, tzinfo=timezone.utc)
+FEB = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_get_countries_version_should_return_latest_update_and_count():
+    # Arrange
+    countries = {
+        1: Country(id=1, name="Brazil", iso_code=ISOCode("BR"), updated_at=JAN),
+        2: Country(id=2, name="Argentina", iso_code=ISOCode("AR"), is_active=False, updated_at=FEB),
+    }
+    use_case = GetCountriesVersionUseCase(FakeCountryRepository(countries))
+
+    # Act
+    all_version = await use_case.execute(GetCountriesVersionRequest())
+    active_version = await use_case.execute(GetCountriesVersionRequest(active_only=True))
+
+    # Assert
+    assert (all_version.last_modified, all_version.total) == (FEB, 2)
+    assert (active_version.last_modified, active_version.total) == (JAN, 1)
+
+
+@pytest.mark.asyncio
+async def test_get_countries_version_should_change_when_a_country_is_deleted():
+    # Arrange
+    countries = {
+        1: Country(id=1, name="Brazil", iso_code=ISOCode("BR"), updated_at=FEB),
+        2: Country(id=2, name="Argentina", iso_code=ISOCode("AR"), updated_at=JAN),
+    }
+    fake_repo = FakeCountryRepository(countries)
+    use_case = GetCountriesVersionUseCase(fake_repo)
+    before = await use_case.execute(GetCountriesVersionRequest())
+
+    # Act
+    await fake_repo.delete(2)
+    after = await use_case.execute(GetCountriesVersionRequest())
+
+    # Assert
+    assert after.last_modified == before.last_modified
+    assert after != before
+
+
+@pytest.mark.asyncio
+async def test_get_countries_version_should_handle_empty_list():
+    # Arrange
+    use_case = GetCountriesVersionUseCase(FakeCountryRepository({}))
+
+    # Act
+    result = await use_case.execute(GetCountriesVersionRequest())
+
+    # Assert
+    assert result.last_modified is None
+    assert result.total == 0
@@ -0,0 +1,61 @@
+import pytest
+from sportifyapi.application.use_cases.country.get_country_rows import (
+    GetCountryRowsRequest,
+    GetCountryRowsUseCase,
+)
+from sportifyapi.domain.entities.country import Country
+from sportifyapi.domain.value_objects.iso_code import ISOCode
+from tests.unit.fakes.country.fake_country_repository import FakeCountryRepository
+
+
+def _countries():
+    return {
+        1: Country(id=1, name="Brazil", iso_code=ISOCode("BR")),
+        2: Country(id=2, name="Argentina", iso_code=ISOCode("AR")),
+        3: Country(id=3, name="Chile", iso_code=ISOCode("CL")),
+        4: Country(id=4, name="Germany", iso_code=ISOCode("DE"), is_active=False),
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_country_rows_should_return_all_rows_ordered_by_name():
+    # Arrange
+    use_case = GetCountryRowsUseCase(FakeCountryRepository(_countries()))
+
+    # Act
+    result = await use_case.execute(GetCountryRowsRequest(active_only=True))
+
+    # Assert
+    assert result.rows == [
+        (2, "Argentina", "AR", True),
+        (1, "Brazil", "BR", True),
+        (3, "Chile", "CL", True),
+    ]
+    assert result.total == 3
+    assert result.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_country_rows_should_paginate_with_cursor():
+    # Arrange
+    use_case = GetCountryRowsUseCase(FakeCountryRepository(_countries()))
+
+    # Act
+    first = await use_case.execute(GetCountryRowsRequest(limit=2))
+    second = await use_case.execute(GetCountryRowsRequest(after=first.next_cursor, limit=2))
+
+    # Assert
+    assert [row[1] for row in first.rows] == ["Argentina", "Brazil"]
+    assert first.next_cursor == "Brazil,1"
+    assert [row[1] for row in second.rows] == ["Chile", "Germany"]
+    assert second.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_country_rows_should_reject_invalid_cursor():
+    # Arrange
+    use_case = GetCountryRowsUseCase(FakeCountryRepository(_countries()))
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        await use_case.execute(GetCountryRowsRequest(after="Brazil", limit=2))
@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+
+import pytest
+from sportifyapi.application.use_cases.country.get_country_version import (
+    GetCountryVersionRequest,
+    GetCountryVersionUseCase,
+)
+from sportifyapi.domain.entities.country import Country
+from sportifyapi.domain.exceptions import CountryNotFoundError
+from sportifyapi.domain.value_objects.iso_code import ISOCode
+from tests.unit.fakes.country.fake_country_repository import FakeCountryRepository
+
+
+@pytest.mark.asyncio
+async def test_get_country_version_should_return_updated_at():
+    # Arrange
+    updated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    countries = {
+        1: Country(id=1, name="Brazil", iso_code=ISOCode("BR"), updated_at=updated_at),
+    }
+    use_case = GetCountryVersionUseCase(FakeCountryRepository(countries))
+
+    # Act
+    result = await use_case.execute(GetCountryVersionRequest(country_id=1))
+
+    # Assert
+    assert result.id == 1
+    assert result.last_modified == updated_at
+
+
+@pytest.mark.asyncio
+async def test_get_country_version_should_raise_for_nonexistent():
+    # Arrange
+    use_case = GetCountryVersionUseCase(FakeCountryRepository({}))
+
+    # Act / Assert
+    with pytest.raises(CountryNotFoundError):
+        await use_case.execute(GetCountryVersionRequest(country_id=99))
@@ -0,0 +1,61 @@
+import pytest
+from sportifyapi.application.use_cases.country.patch_country import (
+    PatchCountryRequest,
+    PatchCountryUseCase,
+)
+from sportifyapi.domain.entities.country import Country
+from sportifyapi.domain.exceptions import CountryNotFoundError
+from sportifyapi.domain.value_objects.iso_code import ISOCode
+from tests.unit.fakes.country.fake_country_repository import FakeCountryRepository
+
+
+@pytest.mark.asyncio
+async def test_patch_country_should_update_only_given_fields():
+    # Arrange
+    countries = {1: Country(id=1, name="Brazil", iso_code=ISOCode("BR"))}
+    use_case = PatchCountryUseCase(FakeCountryRepository(countries))
+
+    # Act
+    result = await use_case.execute(PatchCountryRequest(country_id=1, is_active=False))
+
+    # Assert
+    assert result.name == "Brazil"
+    assert result.iso_code == "BR"
+    assert result.is_active is False
+
+
+@pytest.mark.asyncio
+async def test_patch_country_should_clean_name_and_iso_code():
+    # Arrange
+    countries = {1: Country(id=1, name="Brasil", iso_code=ISOCode("BR"))}
+    use_case = PatchCountryUseCase(FakeCountryRepository(countries))
+
+    # Act
+    result = await use_case.execute(
+        PatchCountryRequest(country_id=1, name="  Brazil ", iso_code="br")
+    )
+
+    # Assert
+    assert result.name == "Brazil"
+    assert result.iso_code == "BR"
+
+
+@pytest.mark.asyncio
+async def test_patch_country_should_reject_empty_patch():
+    # Arrange
+    countries = {1: Country(id=1, name="Brazil", iso_code=ISOCode("BR"))}
+    use_case = PatchCountryUseCase(FakeCountryRepository(countries))
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="At least one field"):
+        await use_case.execute(PatchCountryRequest(country_id=1))
+
+
+@pytest.mark.asyncio
+async def test_patch_country_should_raise_for_nonexistent():
+    # Arrange
+    use_case = PatchCountryUseCase(FakeCountryRepository({}))
+
+    # Act / Assert
+    with pytest.raises(CountryNotFoundError):
+        await use_case.execute(PatchCountryRequest(country_id=99, name="Nowhere"))
@@ -0,0 +1,41 @@
+import pytest
+from sportifyapi.application.use_cases.country.stream_countries import (
+    StreamCountriesRequest,
+    StreamCountriesUseCase,
+)
+from sportifyapi.domain.entities.country import Country
+from sportifyapi.domain.value_objects.iso_code import ISOCode
+from tests.unit.fakes.country.fake_country_repository import FakeCountryRepository
+
+
+@pytest.mark.asyncio
+async def test_stream_countries_should_yield_ordered_dtos():
+    # Arrange
+    countries = {
+        1: Country(id=1, name="Brazil", iso_code=ISOCode("BR")),
+        2: Country(id=2, name="Argentina", iso_code=ISOCode("AR"), is_active=False),
+    }
+    use_case = StreamCountriesUseCase(FakeCountryRepository(countries))
+
+    # Act
+    result = [c async for c in use_case.execute(StreamCountriesRequest())]
+
+    # Assert
+    assert [c.iso_code for c in result] == ["AR", "BR"]
+    assert result[0].is_active is False
+
+
+@pytest.mark.asyncio
+async def test_stream_countries_should_filter_active_only():
+    # Arrange
+    countries = {
+        1: Country(id=1, name="Brazil", iso_code=ISOCode("BR")),
+        2: Country(id=2, name="Argentina", iso_code=ISOCode("AR"), is_active=False),
+    }
+    use_case = StreamCountriesUseCase(FakeCountryRepository(countries))
+
+    # Act
+    result = [c async for c in use_case.execute(StreamCountriesRequest(active_only=True))]
+
+    # Assert
+    assert [c.name for c in result] == ["Brazil"]
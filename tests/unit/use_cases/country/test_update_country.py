@@ -1,43 +1,68 @@
-# import pytest
-# from sportifyapi.application.use_cases.country.update_country import (
-#     UpdateCountryUseCase,
-# )
-# from sportifyapi.domain.entities.country import Country
-# from tests.unit.fakes.country.fake_country_repository import FakeCountryRepository
-# from tests.unit.fakes.country.fake_unit_of_work import FakeUnitOfWork
-
-
-# @pytest.mark.asyncio
-# async def test_update_country_should_return_updated_country():
-#     # Arrange
-#     countries = {
-#         1: Country(id=1, name="Brasil", iso_code="BR"),
-#     }
-#     fake_repo = FakeCountryRepository(countries)
-#     uow = FakeUnitOfWork(fake_repo)
-#     use_case = UpdateCountryUseCase(uow)
-
-#     # Act
-#     updated_country = Country(id=1, name="Brazil", iso_code="BR")
-#     result = await use_case.execute(1, updated_country)
-
-#     # Assert
-#     assert result is not None
-#     assert result.name == "Brazil"
-#     assert countries[1].name == "Brazil"  # Confirm repo was updated
-
-
-# @pytest.mark.asyncio
-# async def test_update_country_should_return_none_for_nonexistent():
-#     # Arrange
-#     countries = {}
-#     fake_repo = FakeCountryRepository(countries)
-#     uow = FakeUnitOfWork(fake_repo)
-#     use_case = UpdateCountryUseCase(uow)
-
-#     # Act
-#     updated_country = Country(id=99, name="Nowhere", iso_code="XX")
-#     result = await use_case.execute(99, updated_country)
-
-#     # Assert
-#     assert result is None
+import pytest
+from sportifyapi.application.use_cases.country.update_country import (
+    UpdateCountryRequest,
+    UpdateCountryUseCase,
+)
+from sportifyapi.domain.entities.country import Country
+from sportifyapi.domain.exceptions import CountryAlreadyExistsError, CountryNotFoundError
+from sportifyapi.domain.value_objects.iso_code import ISOCode
+from tests.unit.fakes.country.fake_country_repository import FakeCountryRepository
+
+
+@pytest.mark.asyncio
+async def test_update_country_should_return_updated_country():
+    # Arrange
+    countries = {
+        1: Country(id=1, name="Brasil", iso_code=ISOCode("BR")),
+    }
+    fake_repo = FakeCountryRepository(countries)
+    use_case = UpdateCountryUseCase(fake_repo)
+
+    # Act
+    result = await use_case.execute(
+        UpdateCountryRequest(country_id=1, name="Brazil", iso_code="BR", is_active=False)
+    )
+
+    # Assert
+    assert result is not None
+    assert result.name == "Brazil"
+    assert result.is_active is False
+    assert countries[1].name == "Brazil"  # Confirm repo was updated
+
+
+@pytest.mark.asyncio
+async def test_update_country_should_raise_for_nonexistent():
+    # Arrange
+    countries = {}
+    fake_repo = FakeCountryRepository(countries)
+    use_case = UpdateCountryUseCase(fake_repo)
+
+    # Act / Assert
+    with pytest.raises(CountryNotFoundError):
+        await use_case.execute(UpdateCountryRequest(country_id=99, name="Nowhere", iso_code="XX"))
+
+
+@pytest.mark.asyncio
+async def test_update_country_should_raise_for_taken_iso_code():
+    # Arrange
+    countries = {
+        1: Country(id=1, name="Brazil", iso_code=ISOCode("BR")),
+        2: Country(id=2, name="Argentina", iso_code=ISOCode("AR")),
+    }
+    use_case = UpdateCountryUseCase(FakeCountryRepository(countries))
+
+    # Act / Assert
+    with pytest.raises(CountryAlreadyExistsError):
+        await use_case.execute(UpdateCountryRequest(country_id=2, name="Argentina", iso_code="BR"))
+
+
+@pytest.mark.asyncio
+async def test_update_country_should_validate_name():
+    # Arrange
+    countries = {1: Country(id=1, name="Brazil", iso_code=ISOCode("BR"))}
+    use_case = UpdateCountryUseCase(FakeCountryRepository(countries))
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="at least 2 characters"):
+        await use_case.execute(UpdateCountryRequest(country_id=1, name="B", iso_code="BR"))
+    assert countries[1].name == "Brazil"